@@ -56,6 +56,80 @@ OFFER_BROADCAST_INTERVAL = 1.0
 # Individual network recv() calls will complete much faster, so 30s is really a max per message.
 SOCKET_TIMEOUT = 30.0
 
+# Server engine: how client sessions are scheduled.
+#   "threaded": one OS thread per connected client (simple, but each thread costs stack memory)
+#   "asyncio":  all sessions multiplexed on one event loop (cheap idle sessions, scales to 10k+)
+# Can be overridden on the command line: python -m src.server.server --engine asyncio
+SERVER_ENGINE = "threaded"
+SERVER_ENGINES = ("threaded", "asyncio")
+
+# Listen backlog: how many completed TCP handshakes the kernel queues before accept().
+# A small backlog drops connections during bursts long before the engine itself is saturated.
+TCP_LISTEN_BACKLOG = 128
+
+# ============ WORKER POOL (threaded engine) ============
+# Fixed number of game threads instead of one thread per connection.
+# Extra connections wait in a bounded admission queue for a free worker.
+WORKER_POOL_SIZE = 64
+ADMISSION_QUEUE_SIZE = 256
+
+# What to do with a new connection when the admission queue is full:
+#   "reject":   close it right away (cheap, client fails fast)
+#   "deadline": park it (up to ADMISSION_QUEUE_SIZE more) until the queue has
+#               room; drop sessions that waited longer than ADMISSION_DEADLINE
+#               seconds in total before being served. The accept loop never waits.
+OVERFLOW_POLICY = "reject"
+OVERFLOW_POLICIES = ("reject", "deadline")
+ADMISSION_DEADLINE = 5.0
+
+# ============ MULTI-PROCESS SHARDING ============
+# Number of server processes sharing the TCP port via SO_REUSEPORT.
+# 1 = classic single process. More processes = more cores for round logic (no shared GIL).
+SERVER_PROCESSES = 1
+
+# Seconds a shard gets to finish its games after the parent asks it to stop.
+SHARD_SHUTDOWN_TIMEOUT = 5.0
+
+# ============ SHOE ============
+# Each session deals from one shoe of SHOE_DECKS decks across all its rounds
+# instead of building and shuffling a fresh deck every round.
+# SHOE_PENETRATION: fraction of the shoe dealt before the cut card comes out;
+#                   the shoe is reshuffled before the next round after that
+SHOE_DECKS = 6
+SHOE_PENETRATION = 0.75
+
+# ============ RANDOMNESS ============
+# Every session shuffles with its own random.Random, seeded from this master
+# seed + shard index + session id (see src/common/seeding.py).
+# None = pick a fresh random master seed at startup (it's printed, so a run
+# can still be replayed with --seed)
+MASTER_SEED = None
+
+# ============ METRICS ============
+# Local HTTP endpoint serving live counters in Prometheus text format
+# (GET /metrics). None = disabled. In sharded mode the parent serves
+# METRICS_PORT and shard N serves METRICS_PORT + N + 1 (0 = every process
+# picks any free port and logs it).
+METRICS_PORT = None
+METRICS_HOST = "127.0.0.1"  # Loopback only: the endpoint has no authentication
+
+# ============ LOGGING ============
+# Server and offer-listener log records go through a queue to one background
+# writer thread (src/common/log.py), so sessions never block on stdout.
+LOG_LEVEL = "INFO"
+LOG_FORMAT = "text"        # "text" (time level logger message key=value) or "json" (one object per line)
+LOG_FORMATS = ("text", "json")
+# Repeat suppression: at most LOG_REPEAT_BURST identical records (same logger,
+# level and rendered message) every LOG_REPEAT_WINDOW seconds; the next one
+# that gets through reports how many were dropped.
+LOG_REPEAT_WINDOW = 10.0
+LOG_REPEAT_BURST = 20
+
+# ============ ODDS ============
+# LRU bound on memoized dealer sub-results (src/common/dealer_odds.py).
+# Each entry is one (remaining composition, dealer total, soft) state.
+DEALER_ODDS_CACHE_SIZE = 1 << 18
+
 # ============ MESSAGE FORMAT SIZES ============
 # Fixed-length fields make messages predictable in size. This is critical for protocol design:
 # - We can parse without having to read a length field first
@@ -91,6 +165,10 @@ TEAM_NAME_LENGTH = 32
 CARD_RANK_BYTES = 2
 CARD_SUIT_BYTES = 1
 
+# Receive buffer for FrameReader (src/common/framing.py).
+# Reused for the whole connection; big enough for a burst of ~290 payload frames per recv.
+FRAME_BUFFER_SIZE = 4096
+
 # ============ GAME RULES ============
 DEALER_HIT_THRESHOLD = 17   # Dealer hits if < 17, stands if >= 17
 MAX_HAND_VALUE = 21
@@ -19,6 +19,7 @@ import threading
 import time
 from src.client.offer_listener import OfferListener
 from src.client.game_client import GameClient
+from src.common.log import configure_logging
 from src.client.ui import (
     get_team_name, get_num_rounds, show_servers, get_player_decision,
     show_round_header, show_hand, show_result, show_statistics,
@@ -77,6 +78,8 @@ class GameSessionHandler:
 def main():
     """Main client application."""
     
+    configure_logging()  # Offer listener messages go through the background log writer
+    
     # Get team name and number of rounds from user
     print("\n" + "="*60)
     print("BLACKJACK CLIENT")
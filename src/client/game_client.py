@@ -10,22 +10,19 @@ Key protocol facts (from hackathon spec):
 """
 
 import socket
-import struct
 from src.common.protocol import (
     encode_request,
-    decode_payload_card,
+    encode_payload,
+    unpack_payload_from,
     encode_payload_player_decision,
+    PAYLOAD_STRUCT,
 )
 from src.common.card import Card
+from src.common.game_logic import Hand
+from src.common.framing import FrameReader
 from config import SOCKET_TIMEOUT
 
-MAGIC_COOKIE = 0xabcddcba
-MSG_TYPE_PAYLOAD = 0x4
-
-PAYLOAD_LEN = 14
-CARD_SLICE = slice(11, 14)     # last 3 bytes in payload
-RESULT_OFFSET = 10             # 1 byte
-# decision slice is [5:10] but client doesn't need to parse it
+PAYLOAD_LEN = PAYLOAD_STRUCT.size  # 14 bytes
 
 
 class GameClient:
@@ -35,25 +32,20 @@ class GameClient:
         self.team_name = team_name
         self.num_rounds = num_rounds
         self.socket = None
+        self.frame_reader = None
         self.wins = 0
         self.losses = 0
         self.ties = 0
 
     # ---------- TCP helpers ----------
-    def _recv_exact(self, n: int) -> bytes:
+    def _recv_exact(self, n: int) -> memoryview:
         """
         Read exactly n bytes from the TCP stream (or raise if connection closes).
-        TCP recv() can return fewer bytes than requested, so we loop until complete.
+        TCP recv() can return fewer or more bytes than one frame; FrameReader
+        buffers the stream, so frames that arrived together cost a single recv.
+        Returns a view into the reader's buffer, valid until the next read.
         """
-        chunks = []
-        remaining = n
-        while remaining > 0:
-            chunk = self.socket.recv(remaining)
-            if not chunk:
-                raise ConnectionError("Server closed connection unexpectedly")
-            chunks.append(chunk)
-            remaining -= len(chunk)
-        return b"".join(chunks)
+        return self.frame_reader.read_exact(n)
 
     # ---------- connection ----------
     def connect(self) -> bool:
@@ -61,6 +53,7 @@ class GameClient:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(SOCKET_TIMEOUT)
             self.socket.connect((self.server_ip, self.server_port))
+            self.frame_reader = FrameReader(self.socket, closed_message="Server closed connection unexpectedly")
             print(f"Connected to server at {self.server_ip}:{self.server_port}")
             return True
         except Exception as e:
@@ -81,19 +74,9 @@ class GameClient:
         """
         Read one SPEC payload (14 bytes) and return (result_code, Card).
         """
-        data = self._recv_exact(PAYLOAD_LEN)
-
-        magic = struct.unpack("!I", data[0:4])[0]
-        msg_type = data[4]
-
-        if magic != MAGIC_COOKIE:
-            raise ValueError(f"Invalid magic cookie: {hex(magic)}")
-        if msg_type != MSG_TYPE_PAYLOAD:
-            raise ValueError(f"Invalid message type: {msg_type} (expected 0x4)")
-
-        result_code = data[RESULT_OFFSET]
-        rank, suit = decode_payload_card(data[CARD_SLICE])
-        return result_code, Card(rank, suit)
+        # Validates cookie + type; decision field is irrelevant server->client
+        _, result_code, rank, suit = unpack_payload_from(self._recv_exact(PAYLOAD_LEN))
+        return result_code, Card.of(rank, suit)
 
     def _update_stats_if_finished(self, result_code: int) -> None:
         # 0x0 = not over, 0x1 tie, 0x2 loss, 0x3 win
@@ -136,8 +119,8 @@ class GameClient:
         """
         try:
             decision_bytes = encode_payload_player_decision(decision)
-            # Build complete 14-byte payload
-            payload = struct.pack("!IB", MAGIC_COOKIE, MSG_TYPE_PAYLOAD) + decision_bytes + b"\x00\x00\x00\x00"
+            # Build complete 14-byte payload (result and card unused client->server)
+            payload = encode_payload(decision_bytes, 0x0, 0, 0)
             self.socket.sendall(payload)
             return True
         except Exception as e:
@@ -160,8 +143,9 @@ class GameClient:
                     game_handler.show_error("Failed to receive initial cards")
                     return False
 
+                player_cards = Hand(player_cards)
                 game_handler.show_initial_cards(player_cards, dealer_card)
-                dealer_cards = [dealer_card]
+                dealer_cards = Hand((dealer_card,))
 
                 # round loop until server says finished (result != 0x0)
                 while True:
@@ -180,11 +164,10 @@ class GameClient:
                         # If round not over, this payload contains a "card update"
                         if result_code == 0x0:
                             if decision.lower() == "hit":
-                                player_cards.append(card)
+                                player_cards.add(card)
                                 game_handler.show_card(card, is_player=True)
                                 # Check for immediate bust after hit
-                                from src.common.game_logic import calculate_hand_value, is_bust
-                                if is_bust(calculate_hand_value(player_cards)):
+                                if player_cards.is_bust():
                                     # Player busted - server sends final result next
                                     result_code, _ = self._read_payload()
                                     self._update_stats_if_finished(result_code)
@@ -195,7 +178,7 @@ class GameClient:
                                     # Not busted, continue to next decision
                                     break
                             else:
-                                dealer_cards.append(card)
+                                dealer_cards.add(card)
                                 game_handler.show_card(card, is_player=False)
                                 # dealer may draw multiple cards, so keep reading until result != 0x0
                                 continue
@@ -0,0 +1,267 @@
+"""
+Headless load generator: a fleet of scripted players for capacity testing.
+
+Speaks the same wire protocol as GameClient (38-byte request, 14-byte
+payloads, same encode/decode helpers) but runs every player as an asyncio
+coroutine instead of a blocking socket + terminal, so one process can keep
+thousands of sessions open against a server.
+
+Each simulated user:
+    1. waits for its slot in the ramp-up schedule (starts spread evenly over --ramp-up seconds)
+    2. plays --sessions sessions back to back, each of --rounds rounds
+    3. before every decision "thinks" for a delay drawn from --think
+       (fixed:S, uniform:A,B or exp:MEAN seconds) and then decides with --strategy
+
+Report: sessions/sec, rounds/sec, errors by type and per-decision latency
+percentiles. Decision latency = time from writing Hittt/Stand until the
+server's first reply frame has arrived.
+
+Example (2000 players, 10 rounds each, started over 5 seconds):
+    python -m src.client.load_generator 127.0.0.1 43343 --users 2000 --rounds 10 --ramp-up 5
+
+Thousands of sockets need a high enough open-file limit (ulimit -n).
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import math
+import random
+import time
+from src.common.protocol import (
+    encode_request,
+    encode_payload,
+    encode_payload_player_decision,
+    unpack_payload_from,
+    PAYLOAD_STRUCT,
+)
+from src.common.card import Card
+from src.common.game_logic import Hand
+from src.common.strategy import default_table
+from config import SOCKET_TIMEOUT, RESULT_ROUND_NOT_OVER, RESULT_TIE, RESULT_LOSS, RESULT_WIN, SHOE_DECKS
+
+PAYLOAD_LEN = PAYLOAD_STRUCT.size  # 14 bytes
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+# ---------- strategies: (hand, dealer up card, rng) -> "hit" / "stand" ----------
+def _basic(hand, up_card, rng):
+    return default_table(SHOE_DECKS).decide_hand(hand, up_card)
+
+
+STRATEGIES = {
+    "basic": _basic,
+    "mimic": lambda hand, up_card, rng: "hit" if hand.value() < 17 else "stand",
+    "never-bust": lambda hand, up_card, rng: "hit" if hand.value() < 12 else "stand",
+    "stand": lambda hand, up_card, rng: "stand",
+    "random": lambda hand, up_card, rng: rng.choice(("hit", "stand")),
+}
+
+
+def parse_think_time(spec):
+    """
+    Parse a think-time distribution.
+
+    Args:
+        spec (str): "fixed:S", "uniform:A,B" or "exp:MEAN" (seconds); "0" = no thinking
+
+    Returns:
+        callable: rng -> delay in seconds
+    """
+    kind, _, args = spec.partition(":")
+    try:
+        if kind in ("0", "none"):
+            return lambda rng: 0.0
+        if kind == "fixed":
+            delay = float(args)
+            return lambda rng: delay
+        if kind == "uniform":
+            low, high = (float(x) for x in args.split(","))
+            return lambda rng: rng.uniform(low, high)
+        if kind == "exp":
+            mean = float(args)
+            return lambda rng: rng.expovariate(1 / mean) if mean > 0 else 0.0
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid think time '{spec}'. Use fixed:S, uniform:A,B or exp:MEAN")
+
+
+def percentile(sorted_values, q):
+    """q-th percentile (nearest rank) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadStats:
+    """Counters shared by every simulated user (one event loop, so no locking)."""
+
+    def __init__(self):
+        self.sessions_ok = 0
+        self.sessions_failed = 0
+        self.rounds = 0
+        self.results = collections.Counter()   # "win" / "loss" / "tie"
+        self.errors = collections.Counter()    # exception type name -> count
+        self.latencies = []                    # Seconds per decision
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def report(self):
+        """Summary dict (latencies in milliseconds)."""
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        latencies = sorted(self.latencies)
+        return {
+            "elapsed_sec": round(elapsed, 3),
+            "sessions_ok": self.sessions_ok,
+            "sessions_failed": self.sessions_failed,
+            "sessions_per_sec": round(self.sessions_ok / elapsed, 1) if elapsed else 0.0,
+            "rounds": self.rounds,
+            "rounds_per_sec": round(self.rounds / elapsed, 1) if elapsed else 0.0,
+            "decisions": len(latencies),
+            "results": dict(self.results),
+            "errors": dict(self.errors),
+            "latency_ms": {f"p{q:g}": round(percentile(latencies, q) * 1000, 3) for q in PERCENTILES}
+                          | {"max": round(latencies[-1] * 1000, 3) if latencies else 0.0},
+        }
+
+    def format_report(self):
+        r = self.report()
+        latency = "  ".join(f"{name}={value}ms" for name, value in r["latency_ms"].items())
+        return "\n".join([
+            f"Elapsed:    {r['elapsed_sec']}s",
+            f"Sessions:   {r['sessions_ok']} ok, {r['sessions_failed']} failed ({r['sessions_per_sec']}/sec)",
+            f"Rounds:     {r['rounds']} ({r['rounds_per_sec']}/sec), results {r['results']}",
+            f"Decisions:  {r['decisions']}",
+            f"Latency:    {latency}",
+            f"Errors:     {r['errors'] or 'none'}",
+        ])
+
+
+class _Player:
+    """One scripted session over asyncio streams."""
+
+    _RESULT_NAMES = {RESULT_TIE: "tie", RESULT_LOSS: "loss", RESULT_WIN: "win"}
+
+    def __init__(self, reader, writer, strategy, think, rng, stats):
+        self.reader = reader
+        self.writer = writer
+        self.strategy = strategy
+        self.think = think
+        self.rng = rng
+        self.stats = stats
+
+    async def _read_payload(self):
+        async with asyncio.timeout(SOCKET_TIMEOUT):
+            frame = await self.reader.readexactly(PAYLOAD_LEN)
+        _, result_code, rank, suit = unpack_payload_from(frame)
+        return result_code, Card.of(rank, suit)
+
+    async def play_round(self):
+        _, first = await self._read_payload()
+        _, second = await self._read_payload()
+        _, up_card = await self._read_payload()
+        hand = Hand((first, second))
+
+        while True:
+            delay = self.think(self.rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            decision = self.strategy(hand, up_card, self.rng)
+
+            sent = time.perf_counter()
+            self.writer.write(encode_payload(encode_payload_player_decision(decision), RESULT_ROUND_NOT_OVER, 0, 0))
+            result_code, card = await self._read_payload()
+            self.stats.latencies.append(time.perf_counter() - sent)
+
+            if decision == "hit":
+                hand.add(card)
+                if not hand.is_bust():
+                    continue
+                result_code, _ = await self._read_payload()
+            # Stand (or bust): dealer cards until the result frame
+            while result_code == RESULT_ROUND_NOT_OVER:
+                result_code, _ = await self._read_payload()
+            self.stats.results[self._RESULT_NAMES.get(result_code, "unknown")] += 1
+            self.stats.rounds += 1
+            return
+
+
+async def run_session(host, port, team_name, rounds, strategy, think, rng, stats):
+    """Connect, play `rounds` rounds and close; failures are counted, not raised."""
+    writer = None
+    try:
+        async with asyncio.timeout(SOCKET_TIMEOUT):
+            reader, writer = await asyncio.open_connection(host, port)
+        writer.write(encode_request(rounds, team_name))
+        player = _Player(reader, writer, strategy, think, rng, stats)
+        for _ in range(rounds):
+            await player.play_round()
+        stats.sessions_ok += 1
+    except Exception as e:
+        stats.sessions_failed += 1
+        stats.errors[type(e).__name__] += 1
+    finally:
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+
+async def run_load(host, port, users=100, rounds=10, sessions=1, strategy="basic",
+                   think="0", ramp_up=0.0, seed=None):
+    """
+    Run the whole fleet and return its LoadStats.
+
+    Args:
+        host (str), port (int): Server to load
+        users (int): Concurrent simulated players
+        rounds (int): Rounds per session (1-255)
+        sessions (int): Sessions each user plays back to back
+        strategy (str): Key of STRATEGIES
+        think (str): Think-time distribution (see parse_think_time)
+        ramp_up (float): Seconds over which user start times are spread evenly
+        seed (int): Seed for think times / random strategy (None = random)
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: '{strategy}'. Must be one of {tuple(STRATEGIES)}")
+    decide = STRATEGIES[strategy]
+    think_time = parse_think_time(think)
+    master = random.Random(seed)
+    stats = LoadStats()
+
+    async def user(index, rng):
+        if ramp_up > 0:
+            await asyncio.sleep(ramp_up * index / users)
+        for _ in range(sessions):
+            await run_session(host, port, f"load-{index}", rounds, decide, think_time, rng, stats)
+
+    await asyncio.gather(*(user(i, random.Random(master.getrandbits(64))) for i in range(users)))
+    stats.finished = time.perf_counter()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blackjack server load generator")
+    parser.add_argument("host", help="Server IP")
+    parser.add_argument("port", type=int, help="Server TCP port")
+    parser.add_argument("--users", type=int, default=100, help="Concurrent simulated players")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds per session (1-255)")
+    parser.add_argument("--sessions", type=int, default=1, help="Sessions per user, played back to back")
+    parser.add_argument("--strategy", choices=tuple(STRATEGIES), default="basic", help="Player strategy")
+    parser.add_argument("--think", default="0", help="Think time: fixed:S, uniform:A,B or exp:MEAN seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to spread user start times over")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for think times / random strategy")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    stats = asyncio.run(run_load(args.host, args.port, args.users, args.rounds, args.sessions,
+                                 args.strategy, args.think, args.ramp_up, args.seed))
+    print(json.dumps(stats.report(), indent=2) if args.json else stats.format_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,11 @@ The main thread waits for user input, this thread listens for broadcasts.
 import socket
 import threading
 from src.common.protocol import decode_offer
+from src.common.log import get_logger
 from config import OFFER_UDP_PORT, SOCKET_TIMEOUT
 
+log = get_logger("client.listener")
+
 
 class OfferListener:
     def __init__(self):
@@ -45,7 +48,7 @@ class OfferListener:
             self.socket.bind(('0.0.0.0', OFFER_UDP_PORT))
             self.socket.settimeout(SOCKET_TIMEOUT)
             
-            print(f"[Listener] Listening for server offers on port {OFFER_UDP_PORT}...")
+            log.info("Listening for server offers on port %d...", OFFER_UDP_PORT)
             
             while self.running:
                 try:
@@ -71,7 +74,7 @@ class OfferListener:
                                     'port': tcp_port,
                                     'name': server_name
                                 })
-                                print(f"[Listener] Received offer from {server_name} @ {sender_ip}:{tcp_port}")
+                                log.info("Received offer from %s @ %s:%d", server_name, sender_ip, tcp_port)
                     
                     except ValueError as e:
                         # Ignore invalid offers (not our protocol)
@@ -82,10 +85,10 @@ class OfferListener:
                     pass
                 except Exception as e:
                     if self.running:
-                        print(f"[Listener] Error receiving offer: {e}")
+                        log.warning("Error receiving offer: %s", e)
         
         except Exception as e:
-            print(f"[Listener] Fatal error: {e}")
+            log.error("Fatal error: %s", e)
         
         finally:
             if self.socket:
@@ -9,6 +9,7 @@ This file is the *only* place that uses print() and input().
 """
 
 from src.common.card import Card
+from src.common.game_logic import Hand
 
 
 def display_card(card):
@@ -44,12 +45,17 @@ def display_card(card):
     return f"{rank_str}{suit_str}"
 
 
+def _as_hand(cards):
+    """Return cards as a Hand (reusing it if it already is one)."""
+    return cards if isinstance(cards, Hand) else Hand(cards)
+
+
 def show_hand(cards, is_player=True, hide_second=False):
     """
     Display a hand of cards nicely.
     
     Args:
-        cards (list[Card]): List of cards
+        cards (Hand | list[Card]): The hand
         is_player (bool): True for player's hand, False for dealer's
         hide_second (bool): If True, hide the second card (dealer's hole card)
     
@@ -71,13 +77,7 @@ def show_hand(cards, is_player=True, hide_second=False):
     
     # Calculate value if we're not hiding any card
     if not hide_second or len(cards) == 0:
-        value = sum(c.value() for c in cards)
-        # Handle Ace logic: if over 21 and we have Aces, count one as 1 instead of 11
-        aces = sum(1 for c in cards if c.rank == 1)
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        hand_str += f" (value: {value})"
+        hand_str += f" (value: {_as_hand(cards).value()})"
     
     return hand_str
 
@@ -141,8 +141,8 @@ def show_result(result_code, player_cards=None, dealer_cards=None):
     
     Args:
         result_code (int): 0x1=tie, 0x2=loss, 0x3=win
-        player_cards (list): Player's hand (optional, for detailed display)
-        dealer_cards (list): Dealer's hand (optional, for detailed display)
+        player_cards (Hand | list[Card]): Player's hand (optional, for detailed display)
+        dealer_cards (Hand | list[Card]): Dealer's hand (optional, for detailed display)
     """
     results = {
         0x1: "TIE",
@@ -154,23 +154,15 @@ def show_result(result_code, player_cards=None, dealer_cards=None):
     
     # Show detailed hand info if provided
     if player_cards and dealer_cards:
-        player_value = sum(c.value() for c in player_cards)
-        aces = sum(1 for c in player_cards if c.rank == 1)
-        while player_value > 21 and aces > 0:
-            player_value -= 10
-            aces -= 1
-        
-        dealer_value = sum(c.value() for c in dealer_cards)
-        aces = sum(1 for c in dealer_cards if c.rank == 1)
-        while dealer_value > 21 and aces > 0:
-            dealer_value -= 10
-            aces -= 1
+        player_hand = _as_hand(player_cards)
+        player_value = player_hand.value()
+        dealer_value = _as_hand(dealer_cards).value()
         
         player_hand_str = ", ".join(display_card(c) for c in player_cards)
         dealer_hand_str = ", ".join(display_card(c) for c in dealer_cards)
         
         # Check if player busted
-        if player_value > 21:
+        if player_hand.is_bust():
             print(f"\nRound result: BUST - You busted!")
             print(f"  Player: {player_hand_str} ({player_value})")
             print(f"  Dealer: {dealer_hand_str} ({dealer_value})")
@@ -5,12 +5,18 @@ Why a class instead of just tuples?
 - Type clarity: Card(1, 0) vs (1, 0) - the former is obvious it's a card
 - Encapsulates value logic: Card knows its blackjack value without asking caller
 - Self-documenting: reader sees Card.value() and knows what to expect
+
+Flyweights:
+There are only 52 distinct cards, so Card.of(rank, suit) hands out one of 52
+canonical instances created at import time instead of allocating a new object.
+Cards use __slots__ (no per-instance __dict__) and are immutable, which is what
+makes sharing one instance between every deck, hand and session safe.
 """
 
 from config import (
     RANK_ACE, RANK_JACK, RANK_QUEEN, RANK_KING,
     SUIT_HEARTS, SUIT_DIAMONDS, SUIT_CLUBS, SUIT_SPADES,
-    ACE_HIGH_VALUE, FACE_CARD_VALUE
+    ACE_HIGH_VALUE, FACE_CARD_VALUE, RANKS_PER_SUIT, SUITS
 )
 
 
@@ -31,10 +37,13 @@ class Card:
     - 2 = Clubs ♣
     - 3 = Spades ♠
     
-    Cards are immutable once created: rank and suit never change.
-    This means we can safely use them in collections without worrying about modification.
+    Cards are immutable once created: rank and suit never change (assigning raises
+    AttributeError). This means we can safely use them in collections, and share the
+    canonical instances from Card.of() everywhere, without worrying about modification.
     """
     
+    __slots__ = ("rank", "suit")
+    
     # Lookup tables for human-readable display
     RANK_NAMES = {
         1: "Ace", 2: "2", 3: "3", 4: "4", 5: "5", 6: "6", 7: "7",
@@ -51,9 +60,41 @@ class Card:
         Args:
             rank (int): 1-13 (must be valid)
             suit (int): 0-3 (must be valid)
+        
+        Prefer Card.of(rank, suit), which returns a shared canonical instance.
+        """
+        object.__setattr__(self, "rank", rank)
+        object.__setattr__(self, "suit", suit)
+    
+    @classmethod
+    def of(cls, rank, suit):
+        """
+        Return the canonical (interned) card for rank/suit - no allocation.
+        
+        Out-of-range values (e.g. the neutral 0/0 card in result payloads) aren't
+        interned; they get a fresh instance, exactly like Card(rank, suit).
         """
-        self.rank = rank
-        self.suit = suit
+        if 1 <= rank <= RANKS_PER_SUIT and 0 <= suit < SUITS:
+            return CARDS[suit * RANKS_PER_SUIT + rank - 1]
+        return cls(rank, suit)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card is immutable (tried to set '{name}')")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"Card is immutable (tried to delete '{name}')")
+    
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.rank == other.rank and self.suit == other.suit
+    
+    def __hash__(self):
+        return hash((self.rank, self.suit))
+    
+    def __reduce__(self):
+        """Pickle as Card.of(rank, suit) so unpickled cards are the canonical ones."""
+        return (Card.of, (self.rank, self.suit))
     
     def value(self):
         """
@@ -109,3 +150,8 @@ class Card:
         Returns: (rank_bytes, suit_byte) as 3 total bytes
         """
         return (self.rank, self.suit)
+
+
+# The 52 canonical cards, in deck order: Suit 0 Ranks 1-13, Suit 1 Ranks 1-13, ...
+# Index of a card = suit * 13 + (rank - 1)
+CARDS = tuple(Card(rank, suit) for suit in range(SUITS) for rank in range(1, RANKS_PER_SUIT + 1))
@@ -0,0 +1,139 @@
+"""
+Exact dealer outcome probabilities for house-edge reporting.
+
+Given the dealer's up card and the cards the dealer could still draw, compute
+the exact probability of the dealer finishing on each total 17-21 or busting,
+playing by the server's rules (dealer_decision: hit below 17, stand on 17 and
+above - including soft 17, because Hand counts the Ace as 11 there).
+
+Cards are grouped by blackjack value, so a composition is a tuple of 10 counts:
+    composition[0] = Aces, composition[1] = 2s, ..., composition[8] = 9s,
+    composition[9] = all 10-value cards (10, J, Q, K)
+A full single deck is (4, 4, 4, 4, 4, 4, 4, 4, 4, 16).
+
+From the player's point of view the dealer's face-down hole card is still
+unknown, so it belongs in the composition: the first "draw" the engine makes
+is the hole card.
+
+The recursion is memoized on (composition, dealer total, soft) with an LRU
+bound (DEALER_ODDS_CACHE_SIZE). Queries from one shoe share most of their
+sub-states, so after the first few queries per shoe a lookup is mostly cache
+hits - cheap enough to run per decision on a live server.
+"""
+
+from functools import lru_cache
+from config import DEALER_HIT_THRESHOLD, MAX_HAND_VALUE, RANK_ACE, DEALER_ODDS_CACHE_SIZE
+from .game_logic import dealer_decision, add_card_value
+from .deck import INDEX_RANKS
+
+NUM_VALUES = 10  # Ace, 2-9, ten-value
+FINAL_TOTALS = tuple(range(DEALER_HIT_THRESHOLD, MAX_HAND_VALUE + 1))  # 17..21
+BUST = "bust"
+OUTCOMES = FINAL_TOTALS + (BUST,)
+
+_BUST_INDEX = len(FINAL_TOTALS)
+_BUST_RESULT = tuple(1.0 if i == _BUST_INDEX else 0.0 for i in range(len(OUTCOMES)))
+# One-hot distribution for a dealer standing on each total
+_STAND_RESULTS = {
+    total: tuple(1.0 if i == total - DEALER_HIT_THRESHOLD else 0.0 for i in range(len(OUTCOMES)))
+    for total in FINAL_TOTALS
+}
+
+
+def full_composition(num_decks=1):
+    """Composition of num_decks complete decks."""
+    return (4 * num_decks,) * 9 + (16 * num_decks,)
+
+
+def value_index(rank):
+    """Composition index (0-9) of a card rank (1-13)."""
+    return min(rank, 10) - 1
+
+
+def remove_ranks(composition, ranks):
+    """
+    Return composition with one card of each given rank taken out.
+    
+    Raises:
+        ValueError: If a rank isn't available any more
+    """
+    counts = list(composition)
+    for rank in ranks:
+        i = value_index(rank)
+        if counts[i] == 0:
+            raise ValueError(f"No card of rank {rank} left in composition")
+        counts[i] -= 1
+    return tuple(counts)
+
+
+def deck_composition(deck):
+    """
+    Composition of the cards still undealt in a CompactDeck/Shoe.
+    
+    Note: the dealer's hole card has already left the deck; add it back
+    (e.g. with its rank unknown, don't remove it) for player-side odds.
+    """
+    counts = [0] * NUM_VALUES
+    for card_index in deck.cards[deck.index:]:
+        counts[value_index(INDEX_RANKS[card_index])] += 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=DEALER_ODDS_CACHE_SIZE)
+def _final_distribution(composition, total, soft):
+    """Probabilities (aligned with OUTCOMES) of the dealer's final result from this state."""
+    if total > MAX_HAND_VALUE:
+        return _BUST_RESULT
+    if dealer_decision(total) == "Stand":
+        return _STAND_RESULTS[total]
+
+    remaining = sum(composition)
+    if remaining == 0:
+        raise ValueError(f"Composition ran out of cards with the dealer on {total}")
+
+    probabilities = [0.0] * len(OUTCOMES)
+    counts = list(composition)
+    for i, count in enumerate(composition):
+        if not count:
+            continue
+        counts[i] -= 1
+        sub = _final_distribution(tuple(counts), *add_card_value(total, soft, i + 1))
+        counts[i] += 1
+        weight = count / remaining
+        for k, p in enumerate(sub):
+            probabilities[k] += weight * p
+    return tuple(probabilities)
+
+
+def dealer_probabilities(up_rank, composition):
+    """
+    Exact distribution of the dealer's final result.
+    
+    Args:
+        up_rank (int): Rank of the dealer's face-up card (1-13)
+        composition (sequence[int]): 10 counts of cards the dealer may still draw,
+                                     hole card included (see module docstring)
+    
+    Returns:
+        dict: {17: p, 18: p, 19: p, 20: p, 21: p, "bust": p}, summing to 1
+    
+    Raises:
+        ValueError: If the composition has the wrong length or runs out mid-hand
+    """
+    if len(composition) != NUM_VALUES:
+        raise ValueError(f"Composition needs {NUM_VALUES} counts, got {len(composition)}")
+    if up_rank == RANK_ACE:
+        total, soft = 11, True
+    else:
+        total, soft = min(up_rank, 10), False
+    return dict(zip(OUTCOMES, _final_distribution(tuple(composition), total, soft)))
+
+
+def cache_info():
+    """LRU statistics of the memoized sub-results (hits, misses, maxsize, currsize)."""
+    return _final_distribution.cache_info()
+
+
+def clear_cache():
+    """Drop all memoized sub-results (e.g. between unrelated shoes)."""
+    _final_distribution.cache_clear()
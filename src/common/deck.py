@@ -12,11 +12,41 @@ The spec says "dealer shuffles the deck" each round. We interpret this as:
 create a fresh deck and shuffle it. This avoids complex state tracking
 (what happens after 100 draws from same deck? Reshuffle? Start new?).
 Fresh deck is simpler and matches typical blackjack.
+
+Compact representation:
+CompactDeck stores cards as small ints (index = suit * 13 + rank - 1) in an
+array('B') - one byte per card instead of a list of object pointers. Rank,
+suit and blackjack value come from the INDEX_* lookup tables, and Card
+objects are only produced by draw() (the shared instances from card.CARDS),
+so dealing a round allocates nothing. Simulation code can stay on ints
+throughout via draw_index().
+
+Lazy shuffle:
+A round only deals 4-7 cards, yet a full shuffle does 51 swaps. With
+lazy=True, shuffle() just rewinds and each draw does the next step of
+Fisher-Yates instead (swap position i with a uniformly chosen position in
+i..n-1). The cards dealt are exactly those a full Fisher-Yates shuffle would
+deal first, so the distribution is unchanged - we simply never do the swaps
+for cards nobody draws. Starting from whatever order the last round left is
+fine: Fisher-Yates gives a uniform permutation from any starting order.
+
+Shoe:
+Casinos don't shuffle between rounds either. A Shoe is a lazy multi-deck
+CompactDeck that keeps dealing across rounds until the cut card (set by the
+penetration) has come out, and is reshuffled before the next round after that.
 """
 
 import random
-from config import DECK_SIZE, RANKS_PER_SUIT, SUITS
-from .card import Card
+from array import array
+from config import DECK_SIZE, SHOE_DECKS, SHOE_PENETRATION
+from .card import CARDS
+
+# Lookup tables indexed by card index 0..51 (same order as card.CARDS)
+INDEX_RANKS = bytes(card.rank for card in CARDS)
+INDEX_SUITS = bytes(card.suit for card in CARDS)
+INDEX_VALUES = bytes(card.value() for card in CARDS)  # Ace = 11, faces = 10
+
+_ONE_DECK = array("B", range(DECK_SIZE))  # Copied (not rebuilt) for each CompactDeck
 
 
 class Deck:
@@ -32,12 +62,16 @@ class Deck:
     - Avoids off-by-one bugs in index management
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Create a new deck with all 52 cards and shuffle.
         
         The deck is ready to draw from immediately.
+        
+        Args:
+            rng (random.Random): Source of randomness (default: the random module)
         """
+        self.rng = rng if rng is not None else random
         self.cards = []
         self._create_deck()
         # Don't shuffle in _create_deck; separate concerns
@@ -48,12 +82,12 @@ class Deck:
         """
         Create all 52 cards in order (not shuffled yet).
         
-        Iterates: Suit 0 Ranks 1-13, Suit 1 Ranks 1-13, ...
+        Order: Suit 0 Ranks 1-13, Suit 1 Ranks 1-13, ...
         This is deterministic so we can verify the deck is complete.
+        The cards are the shared canonical instances (see Card.of), so building
+        a deck allocates one list and no Card objects.
         """
-        for suit in range(SUITS):
-            for rank in range(1, RANKS_PER_SUIT + 1):
-                self.cards.append(Card(rank, suit))
+        self.cards = list(CARDS)
     
     def shuffle(self):
         """
@@ -66,7 +100,7 @@ class Deck:
         - More efficient (no copy)
         - Clearer intent (shuffle this deck, don't create new one)
         """
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         self.index = 0
     
     def draw(self):
@@ -101,3 +135,165 @@ class Deck:
     def is_empty(self):
         """Return True if all cards have been drawn."""
         return self.index >= len(self.cards)
+
+
+class CompactDeck:
+    """
+    Integer-encoded deck: num_decks × 52 card indices in an array('B').
+    
+    Same draw()/cards_remaining()/is_empty() interface as Deck, so it can be used
+    anywhere a Deck is (e.g. as GameSession's deck_factory).
+    
+    With num_decks > 1 each index simply appears num_decks times; which physical
+    deck a card came from doesn't matter to the game, and it keeps every value
+    in one byte.
+    
+    lazy=True swaps one card per draw instead of shuffling up front (see module
+    docstring); the deal is statistically identical.
+    """
+    
+    def __init__(self, num_decks=1, lazy=False, rng=None):
+        """
+        Create num_decks × 52 cards and shuffle.
+        
+        Args:
+            num_decks (int): Number of 52-card decks to combine (1 = standard deck)
+            lazy (bool): Do one Fisher-Yates swap per draw instead of a full shuffle
+            rng (random.Random): Source of randomness (default: the random module)
+        """
+        if num_decks < 1:
+            raise ValueError(f"num_decks must be at least 1, got {num_decks}")
+        self.cards = _ONE_DECK * num_decks
+        self.lazy = lazy
+        self.rng = rng if rng is not None else random
+        self.shuffle()
+    
+    def shuffle(self):
+        """
+        Shuffle all cards back into the deck (in place, no rebuild) and reset the index.
+        
+        In lazy mode this only rewinds; the shuffling happens as cards are drawn.
+        """
+        if not self.lazy:
+            self.rng.shuffle(self.cards)
+        self.index = 0
+    
+    def draw_index(self):
+        """
+        Draw the next card as an int index (0-51).
+        
+        Use INDEX_RANKS / INDEX_SUITS / INDEX_VALUES to look up its properties.
+        
+        Raises:
+            IndexError: If every card has been drawn already
+        """
+        cards = self.cards
+        index = self.index
+        if index >= len(cards):
+            raise IndexError(f"Deck exhausted - drew all {len(cards)} cards, no more available")
+        if self.lazy:
+            # One Fisher-Yates step: bring a random undealt card to this position
+            swap = index + self.rng.randrange(len(cards) - index)
+            cards[index], cards[swap] = cards[swap], cards[index]
+        self.index = index + 1
+        return cards[index]
+    
+    def draw(self):
+        """
+        Draw the next card as a Card (the shared canonical instance - no allocation).
+        
+        Raises:
+            IndexError: If every card has been drawn already
+        """
+        return CARDS[self.draw_index()]
+    
+    def cards_remaining(self):
+        """Return the number of cards left in deck."""
+        return len(self.cards) - self.index
+    
+    def is_empty(self):
+        """Return True if all cards have been drawn."""
+        return self.index >= len(self.cards)
+
+
+class Shoe(CompactDeck):
+    """
+    num_decks decks dealt across rounds, reshuffled once the cut card is reached.
+    
+    Call start_round() before dealing each round; it reshuffles if the previous
+    round went past the cut card. Counts shuffles and cards dealt for stats.
+    
+    If a round runs off the end of the shoe (penetration close to 1), only the
+    discards of earlier rounds are shuffled back in: the current round's cards
+    are still on the table and must not be dealt a second time.
+    """
+    
+    def __init__(self, num_decks=SHOE_DECKS, penetration=SHOE_PENETRATION, rng=None):
+        """
+        Args:
+            num_decks (int): Number of 52-card decks in the shoe
+            penetration (float): Fraction of the shoe dealt before reshuffling (0 < p <= 1)
+            rng (random.Random): Source of randomness (default: the random module)
+        """
+        if not 0 < penetration <= 1:
+            raise ValueError(f"penetration must be in (0, 1], got {penetration}")
+        self.index = 0
+        self.round_start = 0  # Position of the current round's first card
+        self.shuffles = 0
+        self._dealt_before_shuffle = 0  # Cards dealt from earlier shuffles
+        super().__init__(num_decks, lazy=True, rng=rng)
+        self.cut_card = max(1, int(len(self.cards) * penetration))
+    
+    def shuffle(self):
+        """Gather every card back into the shoe and start over."""
+        self._dealt_before_shuffle += self.index
+        self.shuffles += 1
+        super().shuffle()
+        self.round_start = 0
+    
+    def start_round(self):
+        """
+        Prepare for a new round: reshuffle if the cut card has come out.
+        
+        Returns:
+            bool: True if the shoe was reshuffled
+        """
+        reshuffled = self.index >= self.cut_card
+        if reshuffled:
+            self.shuffle()
+        self.round_start = self.index
+        return reshuffled
+    
+    def draw_index(self):
+        """
+        Draw the next card index; an exhausted shoe reshuffles its discards rather than raising.
+        
+        Raises:
+            IndexError: If every card in the shoe was dealt in the current round
+        """
+        if self.index >= len(self.cards):
+            # Only reachable with penetration close to 1: the round ran off the end
+            self._reshuffle_discards()
+        return super().draw_index()
+    
+    def _reshuffle_discards(self):
+        """Mid-round reshuffle: earlier rounds' cards go back in, this round's stay dealt."""
+        cards = self.cards
+        in_play = len(cards) - self.round_start
+        if self.round_start == 0:
+            raise IndexError(f"Shoe exhausted - all {len(cards)} cards are in play this round")
+        # Move this round's cards to the front as already dealt; lazy draws
+        # then pick uniformly from the discards behind them
+        self.cards = cards[self.round_start:] + cards[:self.round_start]
+        self._dealt_before_shuffle += self.round_start
+        self.shuffles += 1
+        self.index = in_play
+        self.round_start = 0
+    
+    def cards_dealt(self):
+        """Total cards dealt from this shoe over its lifetime."""
+        return self._dealt_before_shuffle + self.index
+    
+    def cards_per_shuffle(self):
+        """Average cards dealt per shuffle."""
+        return self.cards_dealt() / self.shuffles
@@ -0,0 +1,85 @@
+"""
+Zero-copy framing reader for our fixed-size TCP messages.
+
+TCP is a byte stream: one recv() may return half a frame, or several frames
+glued together (the server flushes a whole burst of 14-byte payloads at once).
+The naive fix - recv() the missing bytes into a list of chunks and b"".join()
+them - allocates new bytes objects for every frame.
+
+FrameReader instead keeps one reusable bytearray, fills it with recv_into(),
+and hands out memoryview slices of it. When several frames arrive in one
+recv(), the following read_exact() calls are served straight from the buffer
+without touching the socket.
+
+IMPORTANT: a returned memoryview points into the shared buffer, so it is only
+valid until the next read on the same reader. Parse it (or bytes() it) first.
+"""
+
+from config import FRAME_BUFFER_SIZE
+
+
+class FrameReader:
+    def __init__(self, sock, buffer_size=FRAME_BUFFER_SIZE, closed_message="Connection closed"):
+        """
+        Args:
+            sock (socket.socket): Connected TCP socket to read from
+            buffer_size (int): Size of the reusable receive buffer
+            closed_message (str): ConnectionError text when the peer closes mid-frame
+        """
+        self.sock = sock
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0  # First unread byte
+        self.end = 0    # One past the last received byte
+        self.closed_message = closed_message
+
+    def read_exact(self, n: int) -> memoryview:
+        """
+        Return the next n bytes of the stream (blocking until they have arrived).
+
+        Raises:
+            ConnectionError: If the peer closes the connection first
+            ValueError: If n doesn't fit in the buffer
+        """
+        if self.end - self.start < n:
+            self._fill(n)
+        frame = self.view[self.start:self.start + n]
+        self.start += n
+        if self.start == self.end:
+            # Buffer fully consumed: next recv_into can start at the front again
+            self.start = self.end = 0
+        return frame
+
+    def read_frames(self, size: int) -> list[memoryview]:
+        """
+        Return every complete frame of `size` bytes that is already buffered
+        (blocking for the first one if nothing is buffered yet).
+
+        Useful when the peer sends bursts: one recv() often yields several frames.
+        """
+        frames = [self.read_exact(size)]
+        while self.end - self.start >= size:
+            frames.append(self.read_exact(size))
+        return frames
+
+    def buffered(self) -> int:
+        """Number of received-but-unread bytes."""
+        return self.end - self.start
+
+    def _fill(self, n: int):
+        """recv_into the buffer until at least n unread bytes are available."""
+        if n > len(self.buffer):
+            raise ValueError(f"Frame of {n} bytes doesn't fit in a {len(self.buffer)}-byte buffer")
+
+        if len(self.buffer) - self.start < n:
+            # Not enough room after the unread bytes: move them to the front.
+            # Rare (only when a partial frame sits at the very end of the buffer).
+            pending = self.end - self.start
+            self.buffer[:pending] = bytes(self.view[self.start:self.end])
+            self.start, self.end = 0, pending
+
+        while self.end - self.start < n:
+            received = self.sock.recv_into(self.view[self.end:])
+            if not received:
+                raise ConnectionError(self.closed_message)
+            self.end += received
@@ -1,8 +1,64 @@
 """
 Core blackjack game logic and rules.
+
+Hand values are computed from rank ints through two lookup tables
+(RANK_VALUES, RANK_IS_ACE) rather than Card.value()/Card.is_ace() method
+calls per card. hand_value_from_ranks() is the one place the Ace rule lives;
+calculate_hand_value() and Hand are thin layers over the same tables.
 """
 
-from config import DEALER_HIT_THRESHOLD, MAX_HAND_VALUE, ACE_LOW_VALUE
+from config import DEALER_HIT_THRESHOLD, MAX_HAND_VALUE, ACE_LOW_VALUE, RANK_ACE, RANKS_PER_SUIT
+from .card import Card
+
+# Lookup tables indexed by rank 1-13 (index 0 unused), built from Card.value()
+RANK_VALUES = (0,) + tuple(Card.of(rank, 0).value() for rank in range(1, RANKS_PER_SUIT + 1))
+RANK_IS_ACE = tuple(1 if rank == RANK_ACE else 0 for rank in range(RANKS_PER_SUIT + 1))  # 1 = Ace
+
+
+def hand_value_from_ranks(ranks):
+    """
+    Calculate the value of a hand given as rank ints (1-13) - the fast path.
+    
+    Same Ace rule as calculate_hand_value: Aces count 11, then 1 (one at a
+    time) while the total is over 21.
+    
+    Args:
+        ranks (sequence[int]): Card ranks, e.g. [1, 13] for Ace + King
+    
+    Returns:
+        int: Total hand value
+    """
+    total = 0
+    num_aces = 0
+    for rank in ranks:
+        total += RANK_VALUES[rank]
+        num_aces += RANK_IS_ACE[rank]
+    
+    while total > MAX_HAND_VALUE and num_aces > 0:
+        total -= 10  # Convert one Ace from 11 to 1 (11 - 10 = 1)
+        num_aces -= 1
+    
+    return total
+
+
+def add_card_value(total, soft, value):
+    """
+    Hand total after drawing one card, for code that tracks (total, soft) instead of a Hand.
+    
+    Args:
+        total (int): Current best total
+        soft (bool): True if an Ace in the hand is counted as 11
+        value (int): Blackjack value of the new card, 1-10 (1 = Ace)
+    
+    Returns:
+        tuple: (new total, new soft flag)
+    """
+    if value == ACE_LOW_VALUE and total + 11 <= MAX_HAND_VALUE:
+        return total + 11, True
+    total += value
+    if total > MAX_HAND_VALUE and soft:
+        return total - 10, False
+    return total, soft
 
 
 def calculate_hand_value(cards):
@@ -19,18 +75,65 @@ def calculate_hand_value(cards):
     Returns:
         int: Total hand value (typically 0-21, can exceed for bust detection)
     """
-    if not cards:
-        return 0
+    return hand_value_from_ranks([card.rank for card in cards])
+
+
+class Hand:
+    """
+    A blackjack hand that keeps its value up to date as cards are added.
     
-    total = sum(card.value() for card in cards)
-    num_aces = sum(1 for card in cards if card.is_ace())
+    calculate_hand_value() re-sums every card on every call; a Hand does the
+    work once per add() instead, tracking the running total and how many Aces
+    are still counted as 11 ("soft" Aces). value(), is_bust() and is_soft()
+    are then O(1) - handy in loops like the dealer's "hit until 17".
     
-    # Recalculate Aces as 1 if busting
-    while total > MAX_HAND_VALUE and num_aces > 0:
-        total -= 10  # Convert one Ace from 11 to 1 (11 - 10 = 1)
-        num_aces -= 1
+    Iterating a Hand yields its cards in the order they were added.
+    """
     
-    return total
+    __slots__ = ("cards", "total", "soft_aces")
+    
+    def __init__(self, cards=()):
+        """
+        Args:
+            cards (iterable[Card]): Initial cards (optional)
+        """
+        self.cards = []
+        self.total = 0      # Best total: Aces count 11 unless that would bust
+        self.soft_aces = 0  # Aces currently counted as 11
+        for card in cards:
+            self.add(card)
+    
+    def add(self, card):
+        """Add a card and update the total."""
+        self.cards.append(card)
+        rank = card.rank
+        self.total += RANK_VALUES[rank]
+        self.soft_aces += RANK_IS_ACE[rank]
+        # Same rule as calculate_hand_value: demote Aces to 1 while busting
+        while self.total > MAX_HAND_VALUE and self.soft_aces > 0:
+            self.total -= 10
+            self.soft_aces -= 1
+    
+    def value(self):
+        """Total value of the hand (same as calculate_hand_value(cards))."""
+        return self.total
+    
+    def is_bust(self):
+        """True if the hand is over 21."""
+        return self.total > MAX_HAND_VALUE
+    
+    def is_soft(self):
+        """True if an Ace is counted as 11 (the hand can take any card without busting)."""
+        return self.soft_aces > 0
+    
+    def __iter__(self):
+        return iter(self.cards)
+    
+    def __len__(self):
+        return len(self.cards)
+    
+    def __getitem__(self, index):
+        return self.cards[index]
 
 
 def is_bust(hand_value):
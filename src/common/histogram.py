@@ -0,0 +1,127 @@
+"""
+Fixed-bucket, HDR-style latency histogram.
+
+Buckets are log-linear: every power-of-two range of values is split into
+2^(PRECISION_BITS - 1) equal sub-buckets, so any recorded value is known to
+within ~3% (PRECISION_BITS = 5) from 1 µs up to hours, using a few hundred
+integer counters. Recording is a bit_length(), a shift and one list
+increment - no allocation, no sorting, no lock.
+
+Concurrency: each thread records into its own shard (threading.local), so
+worker threads never contend on a shared counter. Readers merge the shards
+on demand; a snapshot taken while threads are recording may miss the last
+few in-flight samples, which is fine for monitoring.
+"""
+
+import threading
+
+PRECISION_BITS = 5   # Significant bits kept per value -> max relative error 2^-(bits-1) ≈ 3%
+MAX_VALUE_BITS = 37  # Values up to 2^37 µs (~38 h); larger ones land in the last bucket
+
+
+def bucket_index(value, precision_bits=PRECISION_BITS):
+    """Bucket of a non-negative integer value."""
+    shift = value.bit_length() - precision_bits
+    if shift <= 0:
+        return value
+    return (shift << (precision_bits - 1)) + (value >> shift)
+
+
+def bucket_bounds(index, precision_bits=PRECISION_BITS):
+    """(lowest, highest) value that falls into a bucket."""
+    if index < (1 << precision_bits):
+        return index, index
+    half = 1 << (precision_bits - 1)
+    shift = index // half - 1
+    mantissa = index - shift * half
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class _Shard:
+    """One thread's counters."""
+
+    __slots__ = ("counts", "total", "maximum")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.total = 0    # Sum of recorded values (for the mean)
+        self.maximum = 0
+
+
+class LatencyHistogram:
+    """Latency histogram in microseconds, sharded per recording thread."""
+
+    def __init__(self, name=""):
+        self.name = name
+        self.size = bucket_index((1 << MAX_VALUE_BITS) - 1) + 1
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()  # Only taken when a new thread records for the first time
+
+    def _new_shard(self):
+        shard = _Shard(self.size)
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def record_us(self, micros):
+        """Record one value in microseconds (int)."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        index = bucket_index(micros)
+        shard.counts[index if index < self.size else self.size - 1] += 1
+        shard.total += micros
+        if micros > shard.maximum:
+            shard.maximum = micros
+
+    def record_ns(self, nanos):
+        """Record one value measured with time.perf_counter_ns()."""
+        self.record_us(nanos // 1000)
+
+    def merged(self):
+        """
+        Merge every thread's shard.
+
+        Returns:
+            tuple: (counts list, total count, sum of values, max value)
+        """
+        with self._lock:
+            shards = list(self._shards)
+        counts = [0] * self.size
+        total = maximum = 0
+        for shard in shards:
+            for i, count in enumerate(shard.counts):
+                if count:
+                    counts[i] += count
+            total += shard.total
+            maximum = max(maximum, shard.maximum)
+        return counts, sum(counts), total, maximum
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)):
+        """
+        Count, mean, percentiles and max in microseconds.
+
+        Percentiles report the highest value of the bucket they fall into
+        (never under-reports, over-reports by at most the bucket width).
+        """
+        counts, count, total, maximum = self.merged()
+        result = {"count": count, "mean_us": round(total / count, 1) if count else 0.0}
+        for q in percentiles:
+            result[f"p{q:g}_us"] = self._value_at(counts, count, q, maximum)
+        result["max_us"] = maximum
+        return result
+
+    @staticmethod
+    def _value_at(counts, count, q, maximum):
+        if not count:
+            return 0
+        target = max(1, -(-q * count // 100))  # ceil(q% of count): nearest-rank
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bucket_bounds(index)[1], maximum)
+        return maximum
@@ -0,0 +1,180 @@
+"""
+Structured, asynchronous logging for the server and the offer listener.
+
+print() takes the stdout lock and writes synchronously, so under load every
+session queues up behind the terminal (or a slow pipe). Instead, loggers from
+get_logger() hand records to a QueueHandler; one QueueListener thread does
+all the formatting-to-bytes and writing. A producer pays for one queue put.
+
+Records are structured: keyword fields passed via `extra` are kept as
+attributes and printed after the message as key=value (text) or as JSON keys:
+
+    log = get_logger("server.handler")
+    log.info("Client %s wants %d rounds", team, rounds, extra={"session": 7})
+    -> 2026-01-01 12:00:00,000 INFO  server.handler: Client Sharks wants 3 rounds session=7
+
+Repeat suppression: RepeatFilter lets through at most `burst` identical records
+(same logger, level and rendered message) per `window` seconds - a failing
+broadcast socket or an error repeating in a loop can't turn the log into the
+bottleneck. The first record after a quiet window carries suppressed=N for what
+was dropped. Only exact repeats count: per-session lines ("Client X wants N
+rounds" with its seed) differ in their arguments and always get through.
+
+configure_logging() is called once by the entry points (server/client main,
+each shard process). Without it the loggers fall back to stdlib defaults
+(warnings and errors only, to stderr), which keeps tests quiet.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from config import LOG_LEVEL, LOG_FORMAT, LOG_FORMATS, LOG_REPEAT_WINDOW, LOG_REPEAT_BURST
+
+ROOT_LOGGER = "blackijecky"
+
+# Attributes every LogRecord has; anything else came from `extra` and is a field
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener = None  # Running QueueListener (see configure_logging)
+_settings = None  # (level, fmt_name, stream) of the last configure_logging()
+
+
+def get_logger(name):
+    """Logger under the project root, e.g. get_logger("server") -> "blackijecky.server"."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def record_fields(record):
+    """The structured fields (from `extra`) of a record."""
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
+
+class StructuredFormatter(logging.Formatter):
+    """Message plus its fields, as text (key=value) or one JSON object per line."""
+
+    def __init__(self, fmt_name="text"):
+        if fmt_name not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format: '{fmt_name}'. Must be one of {LOG_FORMATS}")
+        super().__init__("%(asctime)s %(levelname)-5s %(short_name)s: %(message)s")
+        self.json = fmt_name == "json"
+
+    def format(self, record):
+        fields = record_fields(record)
+        record.short_name = record.name.removeprefix(f"{ROOT_LOGGER}.")
+        if self.json:
+            entry = {
+                "time": record.created,
+                "level": record.levelname,
+                "logger": record.short_name,
+                "message": record.getMessage(),
+            }
+            entry.update(fields)
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, default=str)
+        line = super().format(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class RepeatFilter(logging.Filter):
+    """Drop repeats of the same rendered message beyond `burst` per `window` seconds."""
+
+    def __init__(self, window=LOG_REPEAT_WINDOW, burst=LOG_REPEAT_BURST):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.lock = threading.RLock()  # Reentrant: a signal handler may log mid-filter
+        self.seen = {}  # (logger, level, message) -> [window start, count, suppressed]
+        self.last_sweep = time.monotonic()
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_sweep >= self.window:
+                # Distinct messages would otherwise pile up forever: forget finished
+                # windows, except those still owing a suppressed=N report
+                self.seen = {k: state for k, state in self.seen.items()
+                             if now - state[0] < self.window or state[2]}
+                self.last_sweep = now
+            state = self.seen.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self.seen[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            state[1] += 1
+            if state[1] <= self.burst:
+                return True
+            state[2] += 1
+            return False
+
+
+def configure_logging(level=LOG_LEVEL, fmt_name=LOG_FORMAT, stream=None):
+    """
+    Route all project loggers through a queue to a background writer thread.
+
+    Safe to call again (e.g. in a forked shard, which doesn't inherit the
+    writer thread): the previous listener is stopped and replaced.
+
+    Args:
+        level (str): Minimum level ("DEBUG", "INFO", "WARNING", ...)
+        fmt_name (str): "text" or "json"
+        stream: Where to write (default: sys.stdout)
+
+    Returns:
+        logging.handlers.QueueListener: The running writer
+    """
+    global _listener, _settings
+    stop_logging()
+    _settings = (level, fmt_name, stream)
+    output = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    output.setFormatter(StructuredFormatter(fmt_name))
+
+    records = queue.SimpleQueue()
+    producer = logging.handlers.QueueHandler(records)
+    producer.addFilter(RepeatFilter())
+
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(producer)
+    root.setLevel(level)
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+    return _listener
+
+
+def restart_logging():
+    """
+    Start a fresh writer with the last configure_logging() settings.
+
+    For forked shard processes: the child gets the parent's queue but not its
+    writer thread, so without this its records would never be written.
+    """
+    if _settings is not None:
+        configure_logging(*_settings)
+
+
+def stop_logging():
+    """Flush queued records and stop the writer thread (no-op if not running)."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        try:
+            listener.stop()
+        except RuntimeError:
+            pass  # Forked child: the writer thread belonged to the parent
+
+
+atexit.register(stop_logging)
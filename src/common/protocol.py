@@ -7,10 +7,21 @@ Offer (UDP): 39 bytes
 Request (TCP): 38 bytes
   cookie(4) + type(1=0x3) + num_rounds(1) + team_name(32)
 
+Payload (TCP): 14 bytes
+  cookie(4) + type(1=0x4) + decision(5) + result(1) + card(3)
+
 Payload helpers:
   decision: 5 bytes ("Hittt" or "Stand")
   result:   1 byte (0x0/0x1/0x2/0x3)
   card:     3 bytes rank(2) + suit(1)
+
+Codec layer:
+Every message layout is a module-level struct.Struct, compiled once at import
+instead of re-parsing a format string on every call. pack_*_into() /
+unpack_*_from() work on caller-supplied buffers at an offset, so hot paths can
+write into a reusable bytearray or read straight out of a FrameReader
+memoryview without slicing. The classic encode_*/decode_* functions are thin
+wrappers around the same Structs.
 """
 
 import struct
@@ -18,104 +29,188 @@ from config import (
     MAGIC_COOKIE,
     MSG_TYPE_OFFER,
     MSG_TYPE_REQUEST,
+    MSG_TYPE_PAYLOAD,
     TEAM_NAME_LENGTH,
 )
 
 # -------------------------
-# Offer (UDP)
+# Precompiled layouts
 # -------------------------
-def encode_offer(tcp_port: int, server_name: str) -> bytes:
-    name_bytes = server_name.encode("utf-8")[:TEAM_NAME_LENGTH]
-    name_bytes = name_bytes + b"\x00" * (TEAM_NAME_LENGTH - len(name_bytes))
-    return struct.pack("!IBH", MAGIC_COOKIE, MSG_TYPE_OFFER, tcp_port) + name_bytes
+# "32s" pads with 0x00 and truncates to 32 bytes - exactly the name field rule
+OFFER_STRUCT = struct.Struct(f"!IBH{TEAM_NAME_LENGTH}s")      # 39 bytes
+REQUEST_STRUCT = struct.Struct(f"!IBB{TEAM_NAME_LENGTH}s")    # 38 bytes
+PAYLOAD_STRUCT = struct.Struct("!IB5sBHB")                    # 14 bytes
+CARD_STRUCT = struct.Struct("!HB")                            # 3 bytes
+RESULT_STRUCT = struct.Struct("!B")                           # 1 byte
 
+DECISION_LEN = 5
+_DECISION_BYTES = {"hit": b"Hittt", "stand": b"Stand"}
 
-def decode_offer(data: bytes) -> tuple[int, str]:
-    if len(data) < 39:
-        raise ValueError(f"Offer message too short: got {len(data)} bytes, need 39")
-
-    try:
-        magic, msg_type, tcp_port = struct.unpack("!IBH", data[:7])
-    except struct.error as e:
-        raise ValueError(f"Failed to parse offer header: {e}")
 
+def _check_header(magic: int, msg_type: int, expected_type: int):
     if magic != MAGIC_COOKIE:
         raise ValueError(f"Invalid magic cookie: got {hex(magic)}, expected {hex(MAGIC_COOKIE)}")
-    if msg_type != MSG_TYPE_OFFER:
-        raise ValueError(f"Wrong message type: got {msg_type}, expected {MSG_TYPE_OFFER}")
+    if msg_type != expected_type:
+        raise ValueError(f"Wrong message type: got {msg_type}, expected {expected_type}")
+
+
+def _decode_name(name_bytes: bytes) -> str:
+    return name_bytes.rstrip(b"\x00").decode("utf-8", errors="ignore")
+
+
+# -------------------------
+# Offer (UDP)
+# -------------------------
+def pack_offer_into(buffer, offset: int, tcp_port: int, server_name: str) -> int:
+    """Write an offer at buffer[offset:]; return the offset just past it."""
+    OFFER_STRUCT.pack_into(buffer, offset, MAGIC_COOKIE, MSG_TYPE_OFFER, tcp_port, server_name.encode("utf-8"))
+    return offset + OFFER_STRUCT.size
+
 
-    server_name = data[7:7 + TEAM_NAME_LENGTH].rstrip(b"\x00").decode("utf-8", errors="ignore")
-    return tcp_port, server_name
+def unpack_offer_from(buffer, offset: int = 0) -> tuple[int, str]:
+    """Parse and validate an offer at buffer[offset:]; return (tcp_port, server_name)."""
+    try:
+        magic, msg_type, tcp_port, name_bytes = OFFER_STRUCT.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError(f"Offer message too short: got {len(buffer) - offset} bytes, need {OFFER_STRUCT.size}")
+    _check_header(magic, msg_type, MSG_TYPE_OFFER)
+    return tcp_port, _decode_name(name_bytes)
+
+
+def encode_offer(tcp_port: int, server_name: str) -> bytes:
+    return OFFER_STRUCT.pack(MAGIC_COOKIE, MSG_TYPE_OFFER, tcp_port, server_name.encode("utf-8"))
+
+
+def decode_offer(data: bytes) -> tuple[int, str]:
+    return unpack_offer_from(data, 0)
 
 
 # -------------------------
 # Request (TCP)
 # -------------------------
+def pack_request_into(buffer, offset: int, num_rounds: int, team_name: str) -> int:
+    """Write a request at buffer[offset:]; return the offset just past it."""
+    REQUEST_STRUCT.pack_into(buffer, offset, MAGIC_COOKIE, MSG_TYPE_REQUEST, num_rounds, team_name.encode("utf-8"))
+    return offset + REQUEST_STRUCT.size
+
+
+def unpack_request_from(buffer, offset: int = 0) -> tuple[int, str]:
+    """Parse and validate a request at buffer[offset:]; return (num_rounds, team_name)."""
+    try:
+        magic, msg_type, num_rounds, name_bytes = REQUEST_STRUCT.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError(f"Request message too short: got {len(buffer) - offset} bytes, need {REQUEST_STRUCT.size}")
+    _check_header(magic, msg_type, MSG_TYPE_REQUEST)
+    return num_rounds, _decode_name(name_bytes)
+
+
 def encode_request(num_rounds: int, team_name: str) -> bytes:
-    name_bytes = team_name.encode("utf-8")[:TEAM_NAME_LENGTH]
-    name_bytes = name_bytes + b"\x00" * (TEAM_NAME_LENGTH - len(name_bytes))
-    return struct.pack("!IBB", MAGIC_COOKIE, MSG_TYPE_REQUEST, num_rounds) + name_bytes
+    return REQUEST_STRUCT.pack(MAGIC_COOKIE, MSG_TYPE_REQUEST, num_rounds, team_name.encode("utf-8"))
 
 
 def decode_request(data: bytes) -> tuple[int, str]:
-    if len(data) < 38:
-        raise ValueError(f"Request message too short: got {len(data)} bytes, need 38")
+    return unpack_request_from(data, 0)
+
+
+# -------------------------
+# Payload (TCP, 14 bytes)
+# -------------------------
+def pack_payload_into(buffer, offset: int, decision5: bytes, result_code: int, rank: int, suit: int) -> int:
+    """Write a full payload frame at buffer[offset:]; return the offset just past it."""
+    PAYLOAD_STRUCT.pack_into(buffer, offset, MAGIC_COOKIE, MSG_TYPE_PAYLOAD, decision5, result_code, rank, suit)
+    return offset + PAYLOAD_STRUCT.size
+
+
+def unpack_payload_from(buffer, offset: int = 0) -> tuple[bytes, int, int, int]:
+    """
+    Parse and validate a payload frame at buffer[offset:].
 
+    Returns:
+        tuple: (decision5 bytes, result_code, card_rank, card_suit)
+    """
     try:
-        magic, msg_type, num_rounds = struct.unpack("!IBB", data[:6])
-    except struct.error as e:
-        raise ValueError(f"Failed to parse request header: {e}")
+        magic, msg_type, decision5, result_code, rank, suit = PAYLOAD_STRUCT.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError(f"Payload too short: got {len(buffer) - offset} bytes, need {PAYLOAD_STRUCT.size}")
+    _check_header(magic, msg_type, MSG_TYPE_PAYLOAD)
+    return decision5, result_code, rank, suit
 
-    if magic != MAGIC_COOKIE:
-        raise ValueError(f"Invalid magic cookie: got {hex(magic)}")
-    if msg_type != MSG_TYPE_REQUEST:
-        raise ValueError(f"Wrong message type: got {msg_type}, expected {MSG_TYPE_REQUEST}")
 
-    team_name = data[6:6 + TEAM_NAME_LENGTH].rstrip(b"\x00").decode("utf-8", errors="ignore")
-    return num_rounds, team_name
+def encode_payload(decision5: bytes, result_code: int, rank: int, suit: int) -> bytes:
+    return PAYLOAD_STRUCT.pack(MAGIC_COOKIE, MSG_TYPE_PAYLOAD, decision5, result_code, rank, suit)
 
 
 # -------------------------
 # Payload field helpers
 # -------------------------
+def pack_card_into(buffer, offset: int, rank: int, suit: int) -> int:
+    CARD_STRUCT.pack_into(buffer, offset, rank, suit)
+    return offset + CARD_STRUCT.size
+
+
+def unpack_card_from(buffer, offset: int = 0) -> tuple[int, int]:
+    try:
+        return CARD_STRUCT.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError(f"Card data too short: got {len(buffer) - offset} bytes, need {CARD_STRUCT.size}")
+
+
 def encode_payload_card(rank: int, suit: int) -> bytes:
     """
     Card is exactly 3 bytes:
       rank: 2 bytes big-endian (01-13)
       suit: 1 byte (0-3)
     """
-    return struct.pack("!HB", rank, suit)
+    return CARD_STRUCT.pack(rank, suit)
 
 
 def decode_payload_card(data: bytes) -> tuple[int, int]:
-    if len(data) < 3:
-        raise ValueError(f"Card data too short: got {len(data)} bytes, need 3")
-    rank, suit = struct.unpack("!HB", data[:3])
-    return rank, suit
+    return unpack_card_from(data, 0)
+
+
+def pack_decision_into(buffer, offset: int, decision: str) -> int:
+    buffer[offset:offset + DECISION_LEN] = encode_payload_player_decision(decision)
+    return offset + DECISION_LEN
+
+
+def unpack_decision_from(buffer, offset: int = 0) -> str:
+    # Compare instead of a dict lookup: writable memoryviews (FrameReader) aren't hashable
+    decision_bytes = buffer[offset:offset + DECISION_LEN]
+    if decision_bytes == b"Stand":
+        return "stand"
+    if decision_bytes == b"Hittt":
+        return "hit"
+    if len(decision_bytes) < DECISION_LEN:
+        raise ValueError(f"Decision data too short: got {len(decision_bytes)} bytes, need {DECISION_LEN}")
+    raise ValueError(f"Invalid decision in payload: {bytes(decision_bytes)!r}")
 
 
 def encode_payload_player_decision(decision: str) -> bytes:
     """
     Decision is exactly 5 bytes: b"Hittt" or b"Stand"
     """
-    d = decision.lower().strip()
-    if d == "hit":
-        return b"Hittt"
-    if d == "stand":
-        return b"Stand"
-    raise ValueError(f"Invalid decision: '{decision}'. Must be 'hit' or 'stand'")
+    decision_bytes = _DECISION_BYTES.get(decision)  # Fast path: already "hit"/"stand"
+    if decision_bytes is None:
+        decision_bytes = _DECISION_BYTES.get(decision.lower().strip())
+        if decision_bytes is None:
+            raise ValueError(f"Invalid decision: '{decision}'. Must be 'hit' or 'stand'")
+    return decision_bytes
 
 
 def decode_payload_player_decision(data: bytes) -> str:
-    if len(data) < 5:
-        raise ValueError(f"Decision data too short: got {len(data)} bytes, need 5")
+    return unpack_decision_from(data, 0)
 
-    decision_bytes = data[:5]
-    if decision_bytes == b"Hittt":
-        return "hit"
-    if decision_bytes == b"Stand":
-        return "stand"
-    raise ValueError(f"Invalid decision in payload: {decision_bytes!r}")
+
+def pack_result_into(buffer, offset: int, result_code: int) -> int:
+    RESULT_STRUCT.pack_into(buffer, offset, result_code)
+    return offset + RESULT_STRUCT.size
+
+
+def unpack_result_from(buffer, offset: int = 0) -> int:
+    try:
+        return RESULT_STRUCT.unpack_from(buffer, offset)[0]
+    except struct.error:
+        raise ValueError("Result data missing")
 
 
 def encode_payload_result(result_code: int) -> bytes:
@@ -123,11 +218,8 @@ def encode_payload_result(result_code: int) -> bytes:
     Result is 1 byte:
       0x0 not over, 0x1 tie, 0x2 loss, 0x3 win
     """
-    return struct.pack("!B", result_code)
+    return RESULT_STRUCT.pack(result_code)
 
 
 def decode_payload_result(data: bytes) -> int:
-    if len(data) < 1:
-        raise ValueError("Result data missing")
-    return struct.unpack("!B", data[:1])[0]
-
+    return unpack_result_from(data, 0)
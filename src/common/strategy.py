@@ -0,0 +1,165 @@
+"""
+Basic-strategy table for this server's rules, derived by exact expected value.
+
+Rules (see game_logic / GameSession): hit or stand only, dealer hits below 17
+and stands on all 17s, a player bust loses even if the dealer busts too,
+otherwise the higher total wins and equal totals tie (no blackjack bonus).
+
+For every dealer up card we take the dealer's exact final-total distribution
+from dealer_odds (dealer drawing from num_decks decks minus the up card), then
+solve the player's side by dynamic programming over (total, soft):
+
+    EV_stand(t)       = P(dealer busts) + P(dealer < t) - P(dealer > t)
+    EV_hit(t, soft)   = sum over card values v of P(v) * EV(t + v)
+    EV(t, soft)       = max(EV_stand, EV_hit), or -1 once t > 21
+
+Sub-results are memoized per up card, so the whole table is a few hundred
+evaluations. Like published basic strategy it is total-dependent: the player's
+draw probabilities come from the fixed composition, not the exact cards held.
+
+The result is a StrategyTable - one byte per (soft, total, up card) - so a bot
+or simulator decides with a single index lookup:
+
+    table = default_table()
+    decision = table.decide_hand(hand, dealer_up_card)   # "hit" / "stand"
+
+Print the chart with:
+    python -m src.common.strategy [--decks N]
+"""
+
+import argparse
+from functools import lru_cache
+from config import MAX_HAND_VALUE, RANK_ACE, SHOE_DECKS
+from .game_logic import add_card_value
+from .dealer_odds import (
+    dealer_probabilities, full_composition, remove_ranks, value_index, BUST, FINAL_TOTALS,
+)
+
+HIT = 1
+STAND = 0
+_ACTIONS = ("stand", "hit")
+
+UP_VALUES = 10                     # Ace, 2-9, ten-value
+TOTALS = MAX_HAND_VALUE + 1        # Index totals 0-21 directly
+TABLE_SIZE = 2 * TOTALS * UP_VALUES
+
+
+def _slot(total, soft, up_index):
+    """Byte offset of (total, soft, up card) in the table."""
+    return (soft * TOTALS + total) * UP_VALUES + up_index
+
+
+class StrategyTable:
+    """Compact hit/stand lookup table: 2 × 22 × 10 bytes."""
+    
+    __slots__ = ("actions", "num_decks")
+    
+    def __init__(self, actions, num_decks):
+        """
+        Args:
+            actions (bytes): HIT/STAND per slot (see _slot)
+            num_decks (int): Decks the table was computed for
+        """
+        if len(actions) != TABLE_SIZE:
+            raise ValueError(f"Strategy table needs {TABLE_SIZE} entries, got {len(actions)}")
+        self.actions = bytes(actions)
+        self.num_decks = num_decks
+    
+    def decide(self, total, soft, up_rank):
+        """
+        Best action for a hand.
+        
+        Args:
+            total (int): Player's hand total (always "stand" above 21 - nothing to decide)
+            soft (bool): True if an Ace is counted as 11
+            up_rank (int): Rank of the dealer's face-up card (1-13)
+        
+        Returns:
+            str: "hit" or "stand"
+        """
+        if total > MAX_HAND_VALUE:
+            return "stand"
+        return _ACTIONS[self.actions[_slot(total, soft, value_index(up_rank))]]
+    
+    def decide_hand(self, hand, up_card):
+        """decide() for a game_logic.Hand and the dealer's up Card."""
+        return self.decide(hand.value(), hand.is_soft(), up_card.rank)
+
+
+def _solve_up_card(up_rank, num_decks):
+    """
+    Exact player EVs against one dealer up card.
+    
+    Returns:
+        tuple: (ev_stand(total), ev_hit(total, soft)) memoized functions
+    """
+    composition = remove_ranks(full_composition(num_decks), [up_rank])
+    dealer = dealer_probabilities(up_rank, composition)
+    remaining = sum(composition)
+    draw_probabilities = [(value + 1, count / remaining) for value, count in enumerate(composition) if count]
+    
+    @lru_cache(maxsize=None)
+    def ev_stand(total):
+        win = dealer[BUST] + sum(dealer[t] for t in FINAL_TOTALS if t < total)
+        loss = sum(dealer[t] for t in FINAL_TOTALS if t > total)
+        return win - loss
+    
+    @lru_cache(maxsize=None)
+    def ev_best(total, soft):
+        if total > MAX_HAND_VALUE:
+            return -1.0
+        return max(ev_stand(total), ev_hit(total, soft))
+    
+    @lru_cache(maxsize=None)
+    def ev_hit(total, soft):
+        return sum(p * ev_best(*add_card_value(total, soft, value)) for value, p in draw_probabilities)
+    
+    return ev_stand, ev_hit
+
+
+def generate_table(num_decks=SHOE_DECKS):
+    """
+    Compute the basic-strategy table for num_decks decks.
+    
+    Returns:
+        StrategyTable: Ties between hitting and standing go to "stand"
+    """
+    actions = bytearray(TABLE_SIZE)
+    for up_rank in range(1, UP_VALUES + 1):  # Rank 10 stands in for J/Q/K
+        ev_stand, ev_hit = _solve_up_card(up_rank, num_decks)
+        up_index = value_index(up_rank)
+        for soft in (False, True):
+            for total in range(TOTALS):
+                if ev_hit(total, soft) > ev_stand(total):
+                    actions[_slot(total, soft, up_index)] = HIT
+    return StrategyTable(actions, num_decks)
+
+
+@lru_cache(maxsize=None)
+def default_table(num_decks=SHOE_DECKS):
+    """Strategy table for num_decks decks, computed once per process."""
+    return generate_table(num_decks)
+
+
+def format_table(table):
+    """Human-readable chart: one row per player total, one column per dealer up card."""
+    header = "        " + " ".join(f"{label:>2}" for label in ["2", "3", "4", "5", "6", "7", "8", "9", "10", "A"])
+    lines = [f"Basic strategy ({table.num_decks} deck(s)), H = hit, S = stand", header]
+    up_ranks = list(range(2, 11)) + [RANK_ACE]
+    for soft, low in ((False, 4), (True, 12)):
+        for total in range(low, MAX_HAND_VALUE + 1):
+            label = f"{'soft' if soft else 'hard'} {total:>2}"
+            cells = " ".join(f"{'H' if table.decide(total, soft, up) == 'hit' else 'S':>2}" for up in up_ranks)
+            lines.append(f"{label} {cells}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the basic-strategy chart for this server's rules")
+    parser.add_argument("--decks", type=int, default=SHOE_DECKS, help="Number of decks in the shoe")
+    args = parser.parse_args()
+    print(format_table(generate_table(args.decks)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Handles one client's game session on the asyncio engine.
+
+Same protocol and round rules as GameHandler, but reads/writes go through
+asyncio StreamReader/StreamWriter instead of a blocking socket. A session
+waiting for the player's Hit/Stand costs one coroutine (a few KB), not one
+OS thread, so a single process can keep tens of thousands of players waiting.
+
+Both handlers drive the same GameSession state machine; only the I/O differs.
+"""
+
+import asyncio
+import time
+from src.common.deck import Shoe
+from src.server.game_session import STATE_READY, STATE_PLAYER_TURN
+from src.server.game_handler import GameHandler, PAYLOAD_LEN, REQUEST_LEN, parse_decision
+from config import SOCKET_TIMEOUT
+
+
+class AsyncGameHandler(GameHandler):
+    def __init__(self, reader, writer, registry=None, shoe_factory=Shoe, timings=None,
+                 metrics=None):
+        """
+        Args:
+            reader (asyncio.StreamReader): Incoming side of the client connection
+            writer (asyncio.StreamWriter): Outgoing side of the client connection
+            registry (SessionRegistry): Live session table (optional)
+            shoe_factory (callable): Builds the session's shoe
+            timings (RoundTimings): Shared latency histograms (optional)
+            metrics (ServerMetrics): Shared server counters (optional)
+        """
+        super().__init__(None, writer.get_extra_info("peername"), registry, shoe_factory, timings, metrics)
+        self.reader = reader
+        self.writer = writer
+
+    # ----------------- TCP helpers -----------------
+    async def _recv_exact(self, n: int) -> bytes:
+        """Read exactly n bytes (or raise if connection closes / times out)."""
+        try:
+            async with asyncio.timeout(SOCKET_TIMEOUT):
+                frame = await self.reader.readexactly(n)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Client disconnected")
+        self.metrics.count_in(n)
+        return frame
+
+    async def _get_player_decision(self) -> str:
+        await self._flush()
+        return parse_decision(await self._recv_exact(PAYLOAD_LEN))
+
+    async def _flush(self):
+        """
+        Write every buffered frame at once (see GameHandler._flush).
+        asyncio already sets TCP_NODELAY on stream sockets.
+        """
+        if self.outbox:
+            data = b"".join(self.outbox)
+            self.writer.write(data)
+            self.metrics.count_out(len(self.outbox), len(data))
+            self.outbox.clear()
+            await self.writer.drain()
+
+    # ----------------- main loop -----------------
+    async def handle_game(self):
+        self.session_info = self.registry.register(self.address)
+        self.metrics.inc("sessions_accepted")
+        try:
+            # Step 1: Receive request message (38 bytes)
+            self._start_session(await self._recv_exact(REQUEST_LEN))
+
+            # Step 2: Play rounds
+            while self.session.state == STATE_READY:
+                await self._play_round()
+            await self._flush()
+
+            # Step 3: Print final stats
+            self._print_summary()
+
+        except Exception as e:
+            self._log_error(e)
+        finally:
+            self._end_session()
+            try:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _play_round(self):
+        round_started = time.perf_counter_ns()
+        self._queue_frames(self.session.start_round())
+        self.session_info["round"] = self.session.round_num
+
+        while self.session.state == STATE_PLAYER_TURN:
+            decision = await self._get_player_decision()
+            self._queue_frames(self._apply_decision(decision))
+        self.timings.round.record_ns(time.perf_counter_ns() - round_started)
+        self.metrics.round_finished(self.session.last_result)
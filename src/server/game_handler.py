@@ -8,86 +8,77 @@ Spec reminders:
   result: 0x0 not over, 0x1 tie, 0x2 loss, 0x3 win
   card: rank(2 bytes) + suit(1 byte)
 
+The round rules themselves live in GameSession (src/server/game_session.py);
+this class only moves bytes between the socket and the session.
+
 IMPORTANT:
 This server implementation assumes your src/common/protocol.py was fixed so that:
 - encode_payload_card(rank, suit) returns 3 bytes as struct.pack('!HB', rank, suit)
 - decode_payload_card(data) parses struct.unpack('!HB', data[:3])
 """
 
+import random
+import socket
 import struct
+import time
 from src.common.protocol import (
     decode_request,
-    encode_payload_card,
     decode_payload_player_decision,
+    unpack_payload_from,
+    PAYLOAD_STRUCT,
 )
-from src.common.deck import Deck
-from src.common.game_logic import (
-    calculate_hand_value,
-    is_bust,
-    determine_winner,
-)
-from config import (
-    MAGIC_COOKIE,
-    MSG_TYPE_PAYLOAD,
-    RESULT_WIN,
-    RESULT_LOSS,
-    RESULT_TIE,
-    SOCKET_TIMEOUT,
-)
+from src.common.framing import FrameReader
+from src.server.game_session import GameSession, STATE_READY, STATE_PLAYER_TURN
+from src.server.session_registry import SessionRegistry
+from src.server.latency import RoundTimings
+from src.server.metrics import ServerMetrics
+from src.common.deck import Shoe
+from src.common.log import get_logger
+from config import SOCKET_TIMEOUT
+
 
+# Payload layout (14 bytes total): cookie(4) + type(1) + decision(5) + result(1) + card(3)
+PAYLOAD_LEN = PAYLOAD_STRUCT.size
+REQUEST_LEN = 38
 
-# Payload layout offsets (14 bytes total)
-PAYLOAD_LEN = 14
-DECISION_SLICE = slice(5, 10)   # 5 bytes
-RESULT_OFFSET = 10              # 1 byte
-CARD_SLICE = slice(11, 14)      # 3 bytes
+log = get_logger("server.handler")
+
+
+def parse_decision(frame) -> str:
+    """
+    Validate a client payload frame (cookie + type) and return its decision.
+    Returns: "hit" or "stand"
+    """
+    decision5 = unpack_payload_from(frame)[0]
+    return decode_payload_player_decision(decision5)
 
 
 class GameHandler:
-    def __init__(self, client_socket, client_address):
+    def __init__(self, client_socket, client_address, registry=None, shoe_factory=Shoe, timings=None,
+                 metrics=None):
         self.socket = client_socket
         self.address = client_address
+        self.registry = registry if registry is not None else SessionRegistry()
+        self.shoe_factory = shoe_factory  # Builds this session's shoe
+        self.timings = timings if timings is not None else RoundTimings()  # Shared server histograms
+        self.metrics = metrics if metrics is not None else ServerMetrics()  # Shared server counters
+        self.session_info = None  # Live registry entry while the game is running
         self.num_rounds = 0
         self.team_name = ""
-        self.wins = 0
-        self.losses = 0
-        self.ties = 0
+        self.session = None  # GameSession, created once the request is decoded
+        self.outbox = []  # Frames produced since the last flush (see _flush)
+        self.frame_reader = None  # FrameReader over self.socket (threaded engine)
 
     # ----------------- TCP helpers -----------------
-    def _recv_exact(self, n: int) -> bytes:
-        """Read exactly n bytes from TCP (or raise if connection closes)."""
-        chunks = []
-        remaining = n
-        while remaining > 0:
-            chunk = self.socket.recv(remaining)
-            if not chunk:
-                raise ConnectionError("Client disconnected")
-            chunks.append(chunk)
-            remaining -= len(chunk)
-        return b"".join(chunks)
-
-    def _read_payload(self) -> bytes:
-        """Read exactly one payload message (14 bytes) and validate header."""
-        data = self._recv_exact(PAYLOAD_LEN)
-        magic = struct.unpack("!I", data[0:4])[0]
-        msg_type = data[4]
-        if magic != MAGIC_COOKIE:
-            raise ValueError(f"Invalid magic cookie: got {hex(magic)}")
-        if msg_type != MSG_TYPE_PAYLOAD:
-            raise ValueError(f"Invalid message type: got {msg_type}, expected {MSG_TYPE_PAYLOAD}")
-        return data
-
-    def _build_payload(self, decision5: bytes, result_code: int, card_rank: int, card_suit: int) -> bytes:
+    def _recv_exact(self, n: int) -> memoryview:
         """
-        Build a spec payload (14 bytes):
-        cookie + type + decision(5) + result(1) + card(3)
+        Read exactly n bytes from TCP (or raise if connection closes).
+        Returns a view into the reader's buffer, valid until the next read.
         """
-        if len(decision5) != 5:
-            raise ValueError("decision5 must be exactly 5 bytes")
-        card_bytes = encode_payload_card(card_rank, card_suit)  # must be 3 bytes
-        if len(card_bytes) != 3:
-            raise ValueError("encode_payload_card must return exactly 3 bytes")
-        return struct.pack("!IB", MAGIC_COOKIE, MSG_TYPE_PAYLOAD) + decision5 + struct.pack("!B", result_code) + card_bytes
+        frame = self.frame_reader.read_exact(n)
+        self.metrics.count_in(n)
+        return frame
+
 
     # ----------------- protocol actions -----------------
     def _get_player_decision(self) -> str:
@@ -95,121 +86,122 @@ class GameHandler:
         Receive a full payload (14 bytes) from client and extract decision field.
         Returns: "hit" or "stand"
         """
-        data = self._read_payload()
-        decision_bytes = data[DECISION_SLICE]
-        return decode_payload_player_decision(decision_bytes)
+        # The client can't decide before it has seen everything we owe it
+        self._flush()
+        return parse_decision(self._recv_exact(PAYLOAD_LEN))
 
-    def _send_card_update(self, card):
-        """
-        Send a payload that represents "round not over" with a card update.
-        decision field is irrelevant server->client, so we fill with 5 null bytes.
+    def _queue_frames(self, frames):
+        """Buffer frames produced by the session; they go out on the next _flush()."""
+        self.outbox.extend(frames)
+
+    def _flush(self):
         """
-        payload = self._build_payload(decision5=b"\x00" * 5, result_code=0x0, card_rank=card.rank, card_suit=card.suit)
-        self.socket.sendall(payload)
+        Send every buffered frame with a single sendall.
 
-    def _send_round_result(self, result_code: int):
+        Everything the server emits between two client decisions (result of
+        the last round + next deal, or hole card + dealer draws + result)
+        leaves in one syscall and usually one TCP segment, instead of one
+        small write per 14-byte frame.
         """
-        Send a payload that ends the round (result_code != 0x0).
-        Card field must still exist; we send a neutral 0/0.
-        (Alternative is sending last card again; neutral is simplest & consistent.)
+        if self.outbox:
+            data = b"".join(self.outbox)
+            self.socket.sendall(data)
+            self.metrics.count_out(len(self.outbox), len(data))
+            self.outbox.clear()
+
+    def _start_session(self, request_data):
+        """Decode the request and set up the GameSession + registry entry."""
+        self.num_rounds, self.team_name = decode_request(request_data)
+        seed = self.session_info["seed"]
+        # Own generator per session: no shared-RNG contention, and replayable from the seed
+        self.session = GameSession(self.num_rounds, shoe=self.shoe_factory(rng=random.Random(seed)))
+        self.session_info["team_name"] = self.team_name
+
+        log.info("Client %s from %s wants %d rounds", self.team_name, self.address, self.num_rounds,
+                 extra={**self._log_fields(), "seed": seed})
+
+    def _print_summary(self):
+        s = self.session
+        win_rate = (s.wins / s.num_rounds * 100) if s.num_rounds > 0 else 0.0
+        log.info("Client %s: %dW %dL %dT (rate: %.1f%%)", self.team_name, s.wins, s.losses, s.ties, win_rate,
+                 extra=self._log_fields())
+
+    def _apply_decision(self, decision):
+        """Feed a decision to the session, timing the server-side processing."""
+        started = time.perf_counter_ns()
+        frames = self.session.receive_decision(decision)
+        elapsed = time.perf_counter_ns() - started
+        self.timings.decision.record_ns(elapsed)
+        if decision == "stand":
+            self.timings.dealer.record_ns(elapsed)  # Stand = reveal hole card + dealer play
+        return frames
+
+    def _log_fields(self):
         """
-        payload = self._build_payload(decision5=b"\x00" * 5, result_code=result_code, card_rank=0, card_suit=0)
-        self.socket.sendall(payload)
+        Structured log fields naming this session.
+
+        Session ids restart at 1 in every shard, so the shard index is part of
+        the identity: derive_seed(master_seed, shard, session) replays the deal.
+        """
+        return {"shard": self.registry.shard, "session": self.session_info["id"]}
+
+    def _log_error(self, exc):
+        """Count and log the exception that ended the session."""
+        self.metrics.error(exc)
+        fields = self._log_fields()
+        if isinstance(exc, (ConnectionError, TimeoutError)):
+            log.info("Client %s disconnected/timeout: %s", self.address, exc, extra=fields)
+        elif isinstance(exc, struct.error):
+            log.warning("Protocol struct error from %s: %s", self.address, exc, extra=fields)
+        else:
+            log.error("Error handling client %s: %s", self.address, exc, extra=fields)
+
+    def _end_session(self):
+        """Drop the registry entry and fold this session's shoe counters into the totals."""
+        if self.session is not None:
+            self.registry.record_shoe(self.session.shoe)
+        self.registry.unregister(self.session_info["id"])
 
     # ----------------- main loop -----------------
     def handle_game(self):
+        self.session_info = self.registry.register(self.address)
+        self.metrics.inc("sessions_accepted")
         try:
             self.socket.settimeout(SOCKET_TIMEOUT)
+            # Writes are already coalesced per decision, so don't let Nagle hold
+            # them back waiting for the client's delayed ACK
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.frame_reader = FrameReader(self.socket, closed_message="Client disconnected")
 
             # Step 1: Receive request message (38 bytes) reliably
-            request_data = self._recv_exact(38)
-            self.num_rounds, self.team_name = decode_request(request_data)
-
-            print(f"Client {self.team_name} from {self.address} wants {self.num_rounds} rounds")
+            self._start_session(self._recv_exact(REQUEST_LEN))
 
             # Step 2: Play rounds
-            for round_num in range(1, self.num_rounds + 1):
-                self._play_round(round_num)
+            while self.session.state == STATE_READY:
+                self._play_round()
+            self._flush()
 
             # Step 3: Print final stats
-            win_rate = (self.wins / self.num_rounds * 100) if self.num_rounds > 0 else 0.0
-            print(f"Client {self.team_name}: {self.wins}W {self.losses}L {self.ties}T (rate: {win_rate:.1f}%)")
+            self._print_summary()
 
-        except (ConnectionError, TimeoutError) as e:
-            print(f"Client {self.address} disconnected/timeout: {e}")
-        except struct.error as e:
-            print(f"Protocol struct error from {self.address}: {e}")
         except Exception as e:
-            print(f"Error handling client {self.address}: {e}")
+            self._log_error(e)
         finally:
+            self._end_session()
             try:
                 self.socket.close()
             except Exception:
                 pass
 
-    def _play_round(self, round_num: int):
-        # Fresh deck per round
-        deck = Deck()
+    def _play_round(self):
+        round_started = time.perf_counter_ns()
+        # Deal: player(2) + dealer_up(1)
+        self._queue_frames(self.session.start_round())
+        self.session_info["round"] = self.session.round_num
 
-        # Deal initial hands
-        player_hand = [deck.draw(), deck.draw()]
-        dealer_hand = [deck.draw(), deck.draw()]
-
-        # Send initial visible cards: player(2) + dealer_up(1)
-        self._send_card_update(player_hand[0])
-        self._send_card_update(player_hand[1])
-        self._send_card_update(dealer_hand[0])
-
-        # PLAYER TURN
-        while True:
+        # Player decides until bust or stand; the session plays the dealer on stand
+        while self.session.state == STATE_PLAYER_TURN:
             decision = self._get_player_decision()
-
-            if decision == "hit":
-                new_card = deck.draw()
-                player_hand.append(new_card)
-                self._send_card_update(new_card)
-
-                if is_bust(calculate_hand_value(player_hand)):
-                    # Player bust -> immediate loss
-                    self._send_round_result(RESULT_LOSS)
-                    self.losses += 1
-                    return
-
-                # else: player continues (client will send another decision)
-                continue
-
-            elif decision == "stand":
-                break
-
-            else:
-                # Should never happen if decode is strict
-                raise ValueError(f"Invalid decision from client: {decision}")
-
-        # DEALER TURN
-        # Reveal dealer's hidden card first
-        self._send_card_update(dealer_hand[1])
-
-        while calculate_hand_value(dealer_hand) < 17:
-            new_card = deck.draw()
-            dealer_hand.append(new_card)
-            self._send_card_update(new_card)
-
-        # Determine winner
-        player_value = calculate_hand_value(player_hand)
-        dealer_value = calculate_hand_value(dealer_hand)
-
-        player_busted = is_bust(player_value)
-        dealer_busted = is_bust(dealer_value)
-
-        result = determine_winner(player_value, dealer_value, player_busted, dealer_busted)
-
-        # Send final result
-        if result == "win":
-            self._send_round_result(RESULT_WIN)
-            self.wins += 1
-        elif result == "loss":
-            self._send_round_result(RESULT_LOSS)
-            self.losses += 1
-        else:
-            self._send_round_result(RESULT_TIE)
-            self.ties += 1
+            self._queue_frames(self._apply_decision(decision))
+        self.timings.round.record_ns(time.perf_counter_ns() - round_started)
+        self.metrics.round_finished(self.session.last_result)
@@ -0,0 +1,189 @@
+"""
+Sans-IO game session: the blackjack round rules with no sockets attached.
+
+GameSession is a small state machine. The caller feeds it decoded client
+input ("hit"/"stand") and gets back the ready-to-send 14-byte payload frames
+the server must emit in response. It never reads or writes a socket itself,
+so the same rules drive:
+- GameHandler (blocking socket, one thread per client)
+- AsyncGameHandler (asyncio streams)
+- tests, simulators and benchmarks (no network at all)
+
+States:
+    STATE_READY        -> next round can be started with start_round()
+    STATE_PLAYER_TURN  -> waiting for the player's decision (receive_decision())
+    STATE_FINISHED     -> all requested rounds have been played
+
+Typical driver loop:
+    session = GameSession(num_rounds)
+    while session.state == STATE_READY:
+        send(session.start_round())
+        while session.state == STATE_PLAYER_TURN:
+            send(session.receive_decision(read_decision()))
+"""
+
+from types import MappingProxyType
+from src.common.protocol import encode_payload
+from src.common.deck import Shoe
+from src.common.game_logic import (
+    Hand,
+    dealer_decision,
+    determine_winner,
+    result_to_code,
+)
+from config import (
+    RESULT_ROUND_NOT_OVER,
+    RESULT_TIE,
+    RESULT_LOSS,
+    RESULT_WIN,
+    RANKS_PER_SUIT,
+    SUITS,
+)
+
+
+STATE_READY = "ready"
+STATE_PLAYER_TURN = "player_turn"
+STATE_FINISHED = "finished"
+
+# decision field is irrelevant server->client, so we fill it with 5 null bytes
+_NO_DECISION = b"\x00" * 5
+
+
+def build_payload(result_code: int, card_rank: int, card_suit: int) -> bytes:
+    """
+    Build a server->client spec payload (14 bytes):
+    cookie + type + decision(5) + result(1) + card(3)
+    """
+    return encode_payload(_NO_DECISION, result_code, card_rank, card_suit)
+
+
+# Every frame the server can ever emit, built once at import time.
+# There are only 52 card updates and 3 results, so packing them per send is wasted work;
+# the hot path becomes a single dict lookup returning a ready-made 14-byte frame.
+# MappingProxyType makes the tables read-only (frames are shared by all sessions).
+CARD_FRAMES = MappingProxyType({
+    (rank, suit): build_payload(RESULT_ROUND_NOT_OVER, rank, suit)
+    for suit in range(SUITS)
+    for rank in range(1, RANKS_PER_SUIT + 1)
+})
+
+# Card field must still exist in a result frame; we send a neutral 0/0.
+RESULT_FRAMES = MappingProxyType({
+    code: build_payload(code, 0, 0) for code in (RESULT_TIE, RESULT_LOSS, RESULT_WIN)
+})
+
+
+def card_frame(card) -> bytes:
+    """Payload that represents "round not over" with a card update."""
+    return CARD_FRAMES[card.rank, card.suit]
+
+
+def result_frame(result_code: int) -> bytes:
+    """Payload that ends the round (result_code != 0x0)."""
+    return RESULT_FRAMES[result_code]
+
+
+class GameSession:
+    def __init__(self, num_rounds, shoe=None, deck_factory=None):
+        """
+        Args:
+            num_rounds (int): Rounds the client asked for (from the request message)
+            shoe (Shoe): Dealt from across all rounds (default: a new Shoe() for this session)
+            deck_factory (callable): If given, deal each round from a fresh deck_factory()
+                                     instead of a shoe (tests use this for stacked decks)
+        """
+        self.num_rounds = num_rounds
+        self.deck_factory = deck_factory
+        if shoe is None and deck_factory is None:
+            shoe = Shoe()
+        self.shoe = shoe
+        self.state = STATE_READY if num_rounds > 0 else STATE_FINISHED
+        self.round_num = 0
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+        self.last_result = None  # "win" / "loss" / "tie" of the most recent round
+        self.deck = None
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+
+    def start_round(self) -> list[bytes]:
+        """
+        Deal a new round.
+
+        Returns:
+            list[bytes]: Initial visible cards: player(2) + dealer_up(1)
+        """
+        if self.state != STATE_READY:
+            raise RuntimeError(f"Cannot start a round in state '{self.state}'")
+
+        self.round_num += 1
+        if self.deck_factory is not None:
+            self.deck = self.deck_factory()
+        else:
+            self.shoe.start_round()
+            self.deck = self.shoe
+
+        self.player_hand = Hand((self.deck.draw(), self.deck.draw()))
+        self.dealer_hand = Hand((self.deck.draw(), self.deck.draw()))
+
+        self.state = STATE_PLAYER_TURN
+        return [card_frame(self.player_hand[0]), card_frame(self.player_hand[1]), card_frame(self.dealer_hand[0])]
+
+    def receive_decision(self, decision: str) -> list[bytes]:
+        """
+        Apply the player's decision.
+
+        Args:
+            decision (str): "hit" or "stand" (as returned by decode_payload_player_decision)
+
+        Returns:
+            list[bytes]: Frames to send back, in order. Ends with a result frame
+            if the round is over (state leaves STATE_PLAYER_TURN).
+        """
+        if self.state != STATE_PLAYER_TURN:
+            raise RuntimeError(f"Cannot take a decision in state '{self.state}'")
+
+        if decision == "hit":
+            new_card = self.deck.draw()
+            self.player_hand.add(new_card)
+            frames = [card_frame(new_card)]
+
+            if self.player_hand.is_bust():
+                # Player bust -> immediate loss, dealer doesn't play
+                frames.append(self._finish_round("loss"))
+            return frames
+
+        if decision == "stand":
+            return self._play_dealer()
+
+        # Should never happen if decode is strict
+        raise ValueError(f"Invalid decision from client: {decision}")
+
+    def _play_dealer(self) -> list[bytes]:
+        # Reveal dealer's hidden card first
+        frames = [card_frame(self.dealer_hand[1])]
+
+        while dealer_decision(self.dealer_hand.value()) == "Hit":
+            new_card = self.deck.draw()
+            self.dealer_hand.add(new_card)
+            frames.append(card_frame(new_card))
+
+        player, dealer = self.player_hand, self.dealer_hand
+        result = determine_winner(player.value(), dealer.value(), player.is_bust(), dealer.is_bust())
+
+        frames.append(self._finish_round(result))
+        return frames
+
+    def _finish_round(self, result: str) -> bytes:
+        """Record the round result, advance the state and return the result frame."""
+        if result == "win":
+            self.wins += 1
+        elif result == "loss":
+            self.losses += 1
+        else:
+            self.ties += 1
+        self.last_result = result
+
+        self.state = STATE_READY if self.round_num < self.num_rounds else STATE_FINISHED
+        return result_frame(result_to_code(result))
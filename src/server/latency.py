@@ -0,0 +1,36 @@
+"""
+Server-side timing of the game loop.
+
+RoundTimings groups three LatencyHistograms shared by every handler of a
+server (threads record into their own shards, see src/common/histogram.py):
+
+    decision  server processing of one Hit/Stand: from the decoded decision
+              to the reply frames being ready (includes dealer play on Stand)
+    dealer    the dealer-play phase alone (decisions that were Stand)
+    round     a whole round, first deal to result - includes the player's
+              think time and network round trips
+
+Dump them with BlackjackServer.latency_report(), or send the server process
+SIGUSR1 to print the report.
+"""
+
+from src.common.histogram import LatencyHistogram
+
+
+class RoundTimings:
+    def __init__(self):
+        self.decision = LatencyHistogram("decision")
+        self.dealer = LatencyHistogram("dealer")
+        self.round = LatencyHistogram("round")
+
+    def report(self):
+        """Summary of every histogram, keyed by name."""
+        return {h.name: h.summary() for h in (self.decision, self.dealer, self.round)}
+
+    def format_report(self):
+        """Human-readable report, one line per histogram."""
+        lines = []
+        for name, summary in self.report().items():
+            values = "  ".join(f"{key}={value}" for key, value in summary.items())
+            lines.append(f"{name:<9} {values}")
+        return "\n".join(lines)
@@ -0,0 +1,203 @@
+"""
+Live server metrics and a tiny Prometheus text endpoint.
+
+ServerMetrics holds the counters the game handlers bump on every frame,
+round and error. Like LatencyHistogram (src/common/histogram.py), each
+thread increments its own shard (threading.local), so worker threads never
+share a counter or a lock on the hot path; a scrape merges the shards.
+
+Values that already exist elsewhere (active sessions in the SessionRegistry,
+rejected connections in the WorkerPool) aren't counted twice: the server
+registers them as collectors, read only when the endpoint is scraped.
+
+Exposition (GET /metrics on MetricsEndpoint), e.g.:
+    blackjack_rounds_total 1520
+    blackjack_results_total{result="win"} 640
+    blackjack_errors_total{type="TimeoutError"} 3
+    blackjack_active_sessions 12
+"""
+
+import collections
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+NAMESPACE = "blackjack"
+
+# Per-thread counters: name -> help text
+COUNTERS = {
+    "sessions_accepted": "Client sessions started",
+    "rounds": "Rounds completed",
+    "bytes_in": "Bytes received from clients",
+    "bytes_out": "Bytes sent to clients",
+    "frames_in": "Protocol messages received from clients",
+    "frames_out": "Protocol messages sent to clients",
+}
+RESULTS = ("win", "loss", "tie")
+
+
+class _Shard:
+    """One thread's counters."""
+
+    __slots__ = ("counts", "results", "errors")
+
+    def __init__(self):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.results = dict.fromkeys(RESULTS, 0)
+        self.errors = collections.Counter()  # Exception type name -> count
+
+
+class ServerMetrics:
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()  # Only taken for a thread's first shard and by collectors
+        self.collectors = []  # (name, kind, help, callable) read at scrape time
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    # ----------------- hot path -----------------
+    def inc(self, name, amount=1):
+        """Add to one of COUNTERS."""
+        self._shard().counts[name] += amount
+
+    def count_in(self, nbytes):
+        """One frame of nbytes received."""
+        counts = self._shard().counts
+        counts["frames_in"] += 1
+        counts["bytes_in"] += nbytes
+
+    def count_out(self, frames, nbytes):
+        """A batch of frames totalling nbytes sent."""
+        counts = self._shard().counts
+        counts["frames_out"] += frames
+        counts["bytes_out"] += nbytes
+
+    def round_finished(self, result):
+        """A round ended with result "win" / "loss" / "tie" (from the player's side)."""
+        shard = self._shard()
+        shard.counts["rounds"] += 1
+        shard.results[result] += 1
+
+    def error(self, exc):
+        """A session ended with an exception."""
+        self._shard().errors[type(exc).__name__] += 1
+
+    # ----------------- scrape side -----------------
+    def add_collector(self, name, kind, help_text, func):
+        """
+        Expose a value computed on demand.
+
+        Args:
+            name (str): Metric name without the namespace
+            kind (str): "counter" or "gauge"
+            help_text (str): HELP line
+            func (callable): Returns the current number
+        """
+        with self._lock:
+            self.collectors.append((name, kind, help_text, func))
+
+    def snapshot(self):
+        """
+        Merge every thread's shard.
+
+        Returns:
+            dict: counters (COUNTERS names), results, errors, and collected values
+        """
+        with self._lock:
+            shards = list(self._shards)
+            collectors = list(self.collectors)
+        counters = dict.fromkeys(COUNTERS, 0)
+        results = dict.fromkeys(RESULTS, 0)
+        errors = collections.Counter()
+        for shard in shards:
+            for name, value in shard.counts.items():
+                counters[name] += value
+            for result, value in shard.results.items():
+                results[result] += value
+            # dict() copies in one C call; iterating the live Counter could race a
+            # worker adding a new exception type ("dictionary changed size")
+            errors.update(dict(shard.errors))
+        return {
+            "counters": counters,
+            "results": results,
+            "errors": dict(errors),
+            "collected": {name: func() for name, _, _, func in collectors},
+        }
+
+    def render(self):
+        """Current values in Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {NAMESPACE}_{name} {help_text}")
+            lines.append(f"# TYPE {NAMESPACE}_{name} {kind}")
+
+        for name, help_text in COUNTERS.items():
+            family(f"{name}_total", "counter", help_text)
+            lines.append(f"{NAMESPACE}_{name}_total {snapshot['counters'][name]}")
+        family("results_total", "counter", "Round results served, from the player's side")
+        for result, value in snapshot["results"].items():
+            lines.append(f'{NAMESPACE}_results_total{{result="{result}"}} {value}')
+        family("errors_total", "counter", "Sessions ended by an error, by exception type")
+        for error_type, value in sorted(snapshot["errors"].items()):
+            lines.append(f'{NAMESPACE}_errors_total{{type="{error_type}"}} {value}')
+        for name, kind, help_text, _ in self.collectors:
+            family(name, kind, help_text)
+            lines.append(f"{NAMESPACE}_{name} {snapshot['collected'][name]}")
+        return "\n".join(lines) + "\n"
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the server output
+
+
+class MetricsEndpoint:
+    """Serves GET /metrics on a daemon thread."""
+
+    def __init__(self, metrics, port, host="127.0.0.1"):
+        """
+        Args:
+            metrics (ServerMetrics): What to serve
+            port (int): TCP port (0 = any free port, see self.port after start())
+            host (str): Interface to bind
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _MetricsRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.metrics = self.metrics
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
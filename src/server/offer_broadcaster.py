@@ -12,8 +12,11 @@ import socket
 import time
 import threading
 from src.common.protocol import encode_offer
+from src.common.log import get_logger
 from config import OFFER_UDP_PORT, BROADCAST_ADDRESS, OFFER_BROADCAST_INTERVAL
 
+log = get_logger("server.broadcaster")
+
 
 class OfferBroadcaster:
     def __init__(self, tcp_port, server_name):
@@ -55,12 +58,12 @@ class OfferBroadcaster:
                     time.sleep(OFFER_BROADCAST_INTERVAL)
                     
                 except Exception as e:
-                    print(f"Broadcast error: {e}")
+                    log.warning("Broadcast error: %s", e)
                     # Don't crash, just keep trying
                     time.sleep(1)
         
         except Exception as e:
-            print(f"Broadcaster startup error: {e}")
+            log.error("Broadcaster startup error: %s", e)
         
         finally:
             if self.socket:
@@ -7,70 +7,244 @@ Responsibilities:
 - Accept client connections and spawn game handlers
 - Graceful shutdown
 
-Threading model:
-- Main thread: TCP accept loop (waits for clients)
+Threading model ("threaded" engine, default):
+- Main thread: TCP accept loop (waits for clients, admits them to the worker pool)
 - Broadcaster thread: UDP loop (sends offers every 1s, daemon)
-- Game handler threads: One per connected client (handles their game)
+- Worker threads: fixed-size pool; each runs one client's game at a time
+
+"asyncio" engine:
+- Main thread: event loop running asyncio.start_server on the same TCP socket
+- Broadcaster thread: unchanged
+- Game sessions: one coroutine per connected client (AsyncGameHandler)
+
+Sharded mode (--processes N, N > 1):
+One Python process is GIL-bound however sessions are scheduled, so the parent
+forks N shard processes. Each shard binds the same TCP port with SO_REUSEPORT
+and runs its own accept loop with the chosen engine; the kernel spreads new
+connections across them. The parent only holds the port and runs the single
+OfferBroadcaster - clients still see one server.
 """
 
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
 import socket
 import threading
 import sys
+from functools import partial
 from src.server.offer_broadcaster import OfferBroadcaster
 from src.server.game_handler import GameHandler
-from config import SOCKET_TIMEOUT
+from src.server.async_game_handler import AsyncGameHandler
+from src.server.worker_pool import WorkerPool
+from src.server.session_registry import SessionRegistry
+from src.server.latency import RoundTimings
+from src.server.metrics import ServerMetrics, MetricsEndpoint
+from src.common.deck import Shoe
+from src.common.seeding import new_master_seed
+from src.common.log import get_logger, configure_logging, restart_logging, stop_logging
+from config import (
+    SOCKET_TIMEOUT, SERVER_ENGINE, SERVER_ENGINES, TCP_LISTEN_BACKLOG,
+    WORKER_POOL_SIZE, ADMISSION_QUEUE_SIZE, OVERFLOW_POLICY, OVERFLOW_POLICIES,
+    ADMISSION_DEADLINE, SERVER_PROCESSES, SHARD_SHUTDOWN_TIMEOUT,
+    SHOE_DECKS, SHOE_PENETRATION, MASTER_SEED, METRICS_PORT, METRICS_HOST,
+    LOG_LEVEL, LOG_FORMAT, LOG_FORMATS,
+)
+
+log = get_logger("server")
 
 
 class BlackjackServer:
-    def __init__(self, server_name="Blackijecky"):
+    def __init__(self, server_name="Blackijecky", engine=SERVER_ENGINE,
+                 workers=WORKER_POOL_SIZE, queue_size=ADMISSION_QUEUE_SIZE,
+                 overflow_policy=OVERFLOW_POLICY, admission_deadline=ADMISSION_DEADLINE,
+                 processes=SERVER_PROCESSES, shoe_decks=SHOE_DECKS,
+                 shoe_penetration=SHOE_PENETRATION, master_seed=MASTER_SEED,
+                 tcp_port=0, shard=None, metrics_port=METRICS_PORT):
         """
         Initialize server.
         
         Args:
             server_name (str): Team name to broadcast
+            engine (str): "threaded" (worker pool) or "asyncio" (one event loop)
+            workers (int): Worker threads for the threaded engine
+            queue_size (int): Admission queue size for the threaded engine
+            overflow_policy (str): "reject" or "deadline" when the queue is full
+            admission_deadline (float): Max queue wait in seconds (deadline policy)
+            processes (int): Shard processes sharing the port via SO_REUSEPORT (1 = no sharding)
+            shoe_decks (int): Decks in each session's shoe
+            shoe_penetration (float): Fraction of the shoe dealt before reshuffling
+            master_seed (int): Seed every session's RNG derives from (None = random)
+            tcp_port (int): Port to bind (0 = any free port; shards get the parent's port)
+            shard (int): Shard index when running inside a shard process, else None
+            metrics_port (int): Port of the local /metrics endpoint (None = off; shard N uses +N+1)
         """
+        if engine not in SERVER_ENGINES:
+            raise ValueError(f"Unknown server engine: '{engine}'. Must be one of {SERVER_ENGINES}")
+        if processes > 1 and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("Sharded mode needs SO_REUSEPORT, which this platform doesn't support")
         self.server_name = server_name
+        self.engine = engine
+        self.processes = processes
+        self.shard = shard
+        self.bind_port = tcp_port
+        self.pool_options = (workers, queue_size, overflow_policy, admission_deadline)
+        self.shoe_options = (shoe_decks, shoe_penetration)
+        self.shoe_factory = partial(Shoe, shoe_decks, shoe_penetration)
         self.tcp_socket = None
         self.tcp_port = None
         self.broadcaster = None
         self.broadcaster_thread = None
+        self.shards = []  # Shard processes (sharded parent only)
         self.running = True
-        self.handlers = []  # Track active game handler threads
+        self.master_seed = master_seed if master_seed is not None else new_master_seed()
+        # Live table of games being played; hands out per-session RNG seeds
+        self.sessions = SessionRegistry(self.master_seed, shard or 0)
+        self.timings = RoundTimings()  # Decision / dealer / round latency histograms
+        self.pool = None
+        if engine == "threaded" and processes == 1:
+            self.pool = WorkerPool(*self.pool_options)
+        self.metrics_port = metrics_port
+        self.metrics = ServerMetrics()  # Counters bumped by the handlers, see stats() / /metrics
+        self.metrics_endpoint = None
+        self._register_collectors()
     
     def start(self):
         """
         Start the server and begin accepting clients.
         """
         try:
-            # Bind TCP socket to any available port
-            # Binding to 0 means: "OS, pick any available port"
-            # We get the actual port via getsockname()
-            self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.tcp_socket.bind(('0.0.0.0', 0))  # 0 = any available port
-            self.tcp_socket.listen(5)  # Queue up to 5 pending connections
-            self.tcp_socket.settimeout(1.0)  # 1 second timeout on accept() so Ctrl+C works
+            self._bind_tcp_socket()
+            self._install_dump_signal()
             
-            # Get the actual port we bound to
-            self.tcp_port = self.tcp_socket.getsockname()[1]
-            print(f"Server started, listening on IP address {self._get_local_ip()}")
-            print(f"TCP port: {self.tcp_port}")
+            if self.shard is None:
+                log.info("Server started, listening on IP address %s", self._get_local_ip())
+                log.info("TCP port: %d (engine: %s, processes: %d)", self.tcp_port, self.engine, self.processes)
+                log.info("Master seed: %d", self.master_seed)
+            else:
+                log.info("Shard %d (pid %d) accepting on TCP port %d", self.shard, os.getpid(), self.tcp_port)
+            
+            if self.processes > 1:
+                # Fork before starting any thread: the children only inherit the calling thread
+                self._start_shards()
+            self._start_metrics_endpoint()
             
             # Start broadcaster thread (daemon so it dies with main thread)
-            self.broadcaster = OfferBroadcaster(self.tcp_port, self.server_name)
-            self.broadcaster_thread = threading.Thread(target=self.broadcaster.run, daemon=True)
-            self.broadcaster_thread.start()
+            # Shards never broadcast - the parent announces the shared port once
+            if self.shard is None:
+                self.broadcaster = OfferBroadcaster(self.tcp_port, self.server_name)
+                self.broadcaster_thread = threading.Thread(target=self.broadcaster.run, daemon=True)
+                self.broadcaster_thread.start()
             
             # Main loop: accept clients and spawn handlers
-            self._accept_clients()
+            if self.processes > 1:
+                self._wait_for_shards()
+            elif self.engine == "asyncio":
+                asyncio.run(self._serve_asyncio())
+            else:
+                self.pool.start()
+                self._accept_clients()
             
         except KeyboardInterrupt:
-            print("\nShutting down...")
+            log.info("Shutting down...")
         except Exception as e:
-            print(f"Server error: {e}")
+            log.error("Server error: %s", e)
         finally:
             self.shutdown()
     
+    def _bind_tcp_socket(self):
+        """
+        Create and bind the TCP socket (and listen, unless we're a sharded parent).
+        
+        Binding to port 0 means: "OS, pick any available port";
+        we get the actual port via getsockname(). In sharded mode every socket
+        sets SO_REUSEPORT so the shards can bind the parent's port too. The
+        parent never listens on its socket - it just keeps the port reserved,
+        so all connections go to the shards.
+        """
+        self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.processes > 1 or self.shard is not None:
+            self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.tcp_socket.bind(('0.0.0.0', self.bind_port))
+        if self.processes == 1:
+            self.tcp_socket.listen(TCP_LISTEN_BACKLOG)
+        self.tcp_socket.settimeout(1.0)  # 1 second timeout on accept() so Ctrl+C works
+        
+        # Get the actual port we bound to
+        self.tcp_port = self.tcp_socket.getsockname()[1]
+    
+    def _start_shards(self):
+        """Fork one shard process per requested process, all serving self.tcp_port."""
+        ctx = multiprocessing.get_context("fork")
+        for i in range(self.processes):
+            process = ctx.Process(
+                target=_run_shard,
+                args=(i, self.tcp_port, self.server_name, self.engine, self.pool_options,
+                      self.shoe_options, self.master_seed, self.metrics_port),
+                name=f"blackjack-shard-{i}",
+            )
+            process.start()
+            self.shards.append(process)
+    
+    def _wait_for_shards(self):
+        """Sharded parent's main loop: idle until shutdown or until every shard has exited."""
+        while self.running and any(process.is_alive() for process in self.shards):
+            for process in self.shards:
+                process.join(timeout=1.0 / len(self.shards))
+    
+    def _stop_shards(self):
+        """Ask shards to finish (SIGTERM -> graceful shutdown), then force-kill stragglers."""
+        for process in self.shards:
+            if process.is_alive():
+                process.terminate()
+        for process in self.shards:
+            process.join(timeout=SHARD_SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+    
+    def _register_collectors(self):
+        """Expose values other components already track (read at scrape time only)."""
+        if self.processes > 1:
+            self.metrics.add_collector("shards_alive", "gauge", "Shard processes running",
+                                       lambda: sum(1 for process in self.shards if process.is_alive()))
+            return
+        self.metrics.add_collector("active_sessions", "gauge", "Sessions being played right now",
+                                   lambda: len(self.sessions))
+        if self.pool:
+            self.metrics.add_collector("sessions_rejected_total", "counter",
+                                       "Connections turned away (admission queue full or deadline passed)",
+                                       lambda: sum(self.pool.stats()[key] for key in ("rejected", "expired")))
+    
+    def _start_metrics_endpoint(self):
+        """
+        Serve /metrics on loopback; each shard takes the port after the parent's, by index.
+        Port 0 (any free port) stays 0 for the shards too - each logs the port it got.
+        """
+        if self.metrics_port is None:
+            return
+        port = self.metrics_port
+        if self.shard is not None and port != 0:
+            port += self.shard + 1
+        self.metrics_endpoint = MetricsEndpoint(self.metrics, port, METRICS_HOST)
+        self.metrics_endpoint.start()
+        log.info("Metrics: http://%s:%d/metrics", METRICS_HOST, self.metrics_endpoint.port)
+    
+    def _install_dump_signal(self):
+        """SIGUSR1 prints the latency report (a sharded parent forwards it to every shard)."""
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, self._on_dump_signal)
+    
+    def _on_dump_signal(self, signum, frame):
+        if self.shards:
+            for process in self.shards:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGUSR1)
+            return
+        label = "Server" if self.shard is None else f"Shard {self.shard}"
+        log.info("%s latency (µs):\n%s", label, self.timings.format_report())
+    
     def _get_local_ip(self):
         """
         Get the local IP address that will reach other machines on the network.
@@ -90,9 +264,10 @@ class BlackjackServer:
     
     def _accept_clients(self):
         """
-        Main server loop: accept TCP connections and spawn game handlers.
+        Main server loop: accept TCP connections and hand them to the worker pool.
         
-        Each client connection gets its own thread so multiple games run concurrently.
+        Up to WORKER_POOL_SIZE games run concurrently; the rest wait in the
+        admission queue (or are turned away, see WorkerPool).
         Socket timeout allows Ctrl+C to interrupt accept() quickly.
         """
         while self.running:
@@ -101,13 +276,11 @@ class BlackjackServer:
                 # Socket timeout (1s) means we check self.running frequently
                 client_socket, client_address = self.tcp_socket.accept()
                 
-                # Spawn a new thread to handle this client's game
-                # Don't pass daemon=True - we want to wait for games to finish
-                handler = GameHandler(client_socket, client_address)
-                handler_thread = threading.Thread(target=handler.handle_game)
-                handler_thread.start()
-                
-                self.handlers.append(handler_thread)
+                # Queue this client's game for the next free worker
+                handler = GameHandler(client_socket, client_address, self.sessions, self.shoe_factory, self.timings,
+                                      self.metrics)
+                if not self.pool.submit(handler):
+                    log.warning("Rejected client %s: admission queue full", client_address)
                 
             except socket.timeout:
                 # Timeout is normal - just loop again and check self.running
@@ -116,7 +289,25 @@ class BlackjackServer:
                 break
             except Exception as e:
                 if self.running:
-                    print(f"Error accepting client: {e}")
+                    log.error("Error accepting client: %s", e)
+    
+    async def _serve_asyncio(self):
+        """
+        asyncio engine: serve clients as coroutines on the already-bound TCP socket.
+        
+        Mirrors _accept_clients: wakes up once a second to check self.running,
+        so shutdown() from another thread (or Ctrl+C) stops the loop.
+        """
+        server = await asyncio.start_server(self._handle_async_client, sock=self.tcp_socket)
+        async with server:
+            while self.running:
+                await asyncio.sleep(1.0)
+    
+    async def _handle_async_client(self, reader, writer):
+        """Run one client's whole session as a coroutine."""
+        handler = AsyncGameHandler(reader, writer, self.sessions, self.shoe_factory, self.timings,
+                                   self.metrics)
+        await handler.handle_game()
     
     def shutdown(self):
         """
@@ -133,15 +324,110 @@ class BlackjackServer:
         if self.broadcaster:
             self.broadcaster.stop()
         
+        if self.metrics_endpoint:
+            self.metrics_endpoint.stop()
+        
+        if self.shards:
+            log.info("Stopping %d shard processes...", len(self.shards))
+            self._stop_shards()
+            return
+        
         # Wait for active game handlers to finish
-        print("Waiting for active games to complete...")
-        for thread in self.handlers:
-            if thread.is_alive():
-                thread.join(timeout=1)
+        log.info("Waiting for %d active games to complete...", len(self.sessions))
+        if self.pool:
+            self.pool.shutdown(timeout=1)
+    
+    def latency_report(self):
+        """
+        Decision / dealer / round latency summaries of this process (microseconds).
+        
+        Returns:
+            dict: {"decision": {...}, "dealer": {...}, "round": {...}}, see LatencyHistogram.summary
+        """
+        return self.timings.report()
+    
+    def stats(self):
+        """
+        Return a snapshot of server counters.
+        
+        Returns:
+            dict: engine, active sessions, shoe shuffles / cards per shuffle of finished
+            sessions, plus worker pool counters (threaded engine).
+            A sharded parent reports how many shard processes are alive instead;
+            sessions live in the shards.
+        """
+        stats = {"engine": self.engine, "active_sessions": len(self.sessions)}
+        stats.update(self.sessions.shoe_stats())
+        if self.shards:
+            stats["processes"] = self.processes
+            stats["shards_alive"] = sum(1 for process in self.shards if process.is_alive())
+        if self.pool:
+            stats.update(self.pool.stats())
+        return stats
+
+
+def _run_shard(shard, tcp_port, server_name, engine, pool_options, shoe_options, master_seed,
+               metrics_port):
+    """
+    Entry point of a shard process: a regular single-process server on the shared port.
+    
+    Ctrl+C in the terminal reaches every process in the group, so shards ignore
+    SIGINT and let the parent decide; the parent's SIGTERM becomes a normal
+    KeyboardInterrupt-style graceful shutdown.
+    """
+    def _graceful_stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _graceful_stop)
+    # The forked child has the parent's log queue but not its writer thread
+    restart_logging()
+
+    shoe_decks, shoe_penetration = shoe_options
+    server = BlackjackServer(server_name, engine, *pool_options, shoe_decks=shoe_decks,
+                             shoe_penetration=shoe_penetration, master_seed=master_seed,
+                             tcp_port=tcp_port, shard=shard, metrics_port=metrics_port)
+    try:
+        server.start()
+    finally:
+        stop_logging()  # Shards leave via os._exit, which skips atexit: flush explicitly
 
 
 def main():
-    server = BlackjackServer()
+    parser = argparse.ArgumentParser(description="Blackijecky blackjack server")
+    parser.add_argument("--engine", choices=SERVER_ENGINES, default=SERVER_ENGINE,
+                        help="Session scheduling: thread per client or a single asyncio event loop")
+    parser.add_argument("--workers", type=int, default=WORKER_POOL_SIZE,
+                        help="Worker threads for the threaded engine")
+    parser.add_argument("--queue-size", type=int, default=ADMISSION_QUEUE_SIZE,
+                        help="Connections allowed to wait for a free worker")
+    parser.add_argument("--overflow", choices=OVERFLOW_POLICIES, default=OVERFLOW_POLICY,
+                        help="What to do when the admission queue is full")
+    parser.add_argument("--deadline", type=float, default=ADMISSION_DEADLINE,
+                        help="Max seconds a connection may wait in the queue (deadline policy)")
+    parser.add_argument("--processes", type=int, default=SERVER_PROCESSES,
+                        help="Shard processes sharing the TCP port via SO_REUSEPORT (0 = one per CPU)")
+    parser.add_argument("--shoe-decks", type=int, default=SHOE_DECKS,
+                        help="Decks in each session's shoe")
+    parser.add_argument("--penetration", type=float, default=SHOE_PENETRATION,
+                        help="Fraction of the shoe dealt before it is reshuffled")
+    parser.add_argument("--seed", type=int, default=MASTER_SEED,
+                        help="Master seed for all session RNGs (default: random, printed at startup)")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT,
+                        help="Serve Prometheus metrics on 127.0.0.1:PORT/metrics (shard N: PORT+N+1)")
+    parser.add_argument("--log-level", default=LOG_LEVEL, type=str.upper,
+                        choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="Minimum log level")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default=LOG_FORMAT,
+                        help="Log line format: text or json (one object per line)")
+    args = parser.parse_args()
+    configure_logging(args.log_level, args.log_format)
+
+    processes = args.processes or os.cpu_count() or 1
+    server = BlackjackServer(engine=args.engine, workers=args.workers, queue_size=args.queue_size,
+                             overflow_policy=args.overflow, admission_deadline=args.deadline,
+                             processes=processes, shoe_decks=args.shoe_decks,
+                             shoe_penetration=args.penetration, master_seed=args.seed,
+                             metrics_port=args.metrics_port)
     server.start()
 
 
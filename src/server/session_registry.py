@@ -0,0 +1,104 @@
+"""
+Live table of the game sessions currently being played.
+
+Replaces the old "append every handler thread to a list forever" approach:
+entries are added when a session starts and removed when it ends, so memory
+is O(active sessions) no matter how long the server has been running, and
+snapshot() is a cheap way to see what's going on right now.
+
+Each entry is a small dict (like the offers list in OfferListener):
+    {'id': 7, 'team_name': 'Sharks', 'address': ('10.0.0.5', 51234),
+     'round': 3, 'started': 1718000000.0, 'seed': 1234567890123}
+
+'seed' is the session's RNG seed, derived from the registry's master seed,
+shard index and session id - enough to replay that session's deal exactly.
+
+The handler owning an entry updates 'team_name' and 'round' in place; a
+single dict item assignment is atomic under the GIL, so no lock is needed
+on that hot path. Adding/removing entries and snapshots take the lock.
+
+The registry also keeps running shoe totals (shuffles, cards dealt) of
+finished sessions for the server stats.
+"""
+
+import itertools
+import threading
+import time
+from src.common.seeding import derive_seed, new_master_seed
+
+
+class SessionRegistry:
+    def __init__(self, master_seed=None, shard=0):
+        """
+        Args:
+            master_seed (int): Seed all session seeds derive from (None = random)
+            shard (int): Shard index, so shards sharing a master seed get distinct streams
+        """
+        self.master_seed = master_seed if master_seed is not None else new_master_seed()
+        self.shard = shard
+        self.lock = threading.Lock()
+        self.sessions = {}  # session id -> entry dict
+        self._ids = itertools.count(1)
+        self.shuffles = 0  # Shoe totals of finished sessions (see record_shoe)
+        self.cards_dealt = 0
+
+    def register(self, address):
+        """
+        Add a session that's starting now.
+
+        Args:
+            address (tuple): Client (ip, port)
+
+        Returns:
+            dict: The live entry; the caller updates 'team_name' and 'round' on it
+        """
+        session_id = next(self._ids)
+        entry = {
+            "id": session_id,
+            "team_name": "",
+            "address": address,
+            "round": 0,
+            "started": time.time(),
+            "seed": derive_seed(self.master_seed, self.shard, session_id),
+        }
+        with self.lock:
+            self.sessions[entry["id"]] = entry
+        return entry
+
+    def unregister(self, session_id):
+        """Remove a finished session (no-op if already removed)."""
+        with self.lock:
+            self.sessions.pop(session_id, None)
+
+    def record_shoe(self, shoe):
+        """Add a finished session's shoe counters to the running totals."""
+        with self.lock:
+            self.shuffles += shoe.shuffles
+            self.cards_dealt += shoe.cards_dealt()
+
+    def shoe_stats(self):
+        """
+        Return shoe totals of finished sessions.
+
+        Returns:
+            dict: shuffles and average cards_per_shuffle
+        """
+        with self.lock:
+            shuffles, cards_dealt = self.shuffles, self.cards_dealt
+        return {
+            "shuffles": shuffles,
+            "cards_per_shuffle": cards_dealt / shuffles if shuffles else 0.0,
+        }
+
+    def snapshot(self):
+        """
+        Return copies of all active entries, oldest first.
+
+        Returns:
+            list[dict]: One dict per active session
+        """
+        with self.lock:
+            return [dict(entry) for entry in self.sessions.values()]
+
+    def __len__(self):
+        return len(self.sessions)
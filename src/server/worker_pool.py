@@ -0,0 +1,206 @@
+"""
+Fixed-size worker pool with a bounded admission queue (threaded engine).
+
+Why not one thread per client?
+A burst of connections would start a burst of threads: memory grows with
+every connection and the scheduler thrashes, so *every* player's latency
+collapses together. Instead we run a fixed number of worker threads and park
+extra connections in a bounded queue until a worker is free.
+
+When the queue is full, the overflow policy decides what happens:
+    "reject"   -> close the new connection immediately (client sees EOF)
+    "deadline" -> park it in an overflow line (up to queue_size more) and let
+                  the admission thread move it into the queue when a slot
+                  frees up; connections that waited longer than `deadline` in
+                  total before a worker picked them up are closed instead
+
+submit() never blocks under either policy: it runs on the accept thread, and
+an accept loop stuck waiting for a slot would stop draining the listen
+backlog - exactly the burst collapse the pool exists to prevent.
+
+Jobs are GameHandler objects: the pool calls job.handle_game() on a worker,
+or closes job.socket if the job is turned away.
+"""
+
+import collections
+import queue
+import threading
+import time
+from config import OVERFLOW_POLICIES
+
+
+class WorkerPool:
+    def __init__(self, num_workers, queue_size, overflow_policy="reject", deadline=5.0):
+        """
+        Args:
+            num_workers (int): Number of worker threads (max concurrent games)
+            queue_size (int): Max connections waiting for a worker
+            overflow_policy (str): "reject" or "deadline"
+            deadline (float): Max seconds a connection may wait (deadline policy)
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: '{overflow_policy}'. Must be one of {OVERFLOW_POLICIES}")
+        self.num_workers = num_workers
+        self.overflow_policy = overflow_policy
+        self.deadline = deadline
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.workers = []
+        self.running = True
+        # "deadline" policy: connections waiting for a queue slot, oldest first
+        self.overflow = collections.deque()
+        self.overflow_size = queue_size
+        self.overflow_ready = threading.Condition()
+        self.admission_thread = None
+
+        # Counters (read via stats())
+        self.lock = threading.Lock()
+        self.queued = 0    # Sessions admitted to the queue
+        self.rejected = 0  # Sessions closed because the queue was full
+        self.expired = 0   # Sessions closed because they waited past the deadline
+
+    def start(self):
+        """Start the worker threads."""
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"game-worker-{i}")
+            worker.start()
+            self.workers.append(worker)
+        if self.overflow_policy == "deadline":
+            self.admission_thread = threading.Thread(target=self._admission_loop, name="admission")
+            self.admission_thread.start()
+
+    def submit(self, job) -> bool:
+        """
+        Admit a job (GameHandler) or turn it away according to the overflow policy.
+        Never blocks (see module docstring).
+
+        Returns:
+            bool: True if queued (or parked for a slot), False if rejected (the job's socket is closed)
+        """
+        entry = (job, time.monotonic())
+        if self.overflow_policy == "deadline":
+            admitted = self._queue_or_park(entry)
+        else:
+            try:
+                self.queue.put_nowait(entry)
+                admitted = True
+            except queue.Full:
+                admitted = False
+
+        with self.lock:
+            if admitted:
+                self.queued += 1
+            else:
+                self.rejected += 1
+        if not admitted:
+            self._close(job)
+        return admitted
+
+    def _queue_or_park(self, entry) -> bool:
+        """Deadline policy: queue now if there's room, else wait in the overflow line."""
+        with self.overflow_ready:
+            if not self.overflow:  # Don't overtake connections already waiting
+                try:
+                    self.queue.put_nowait(entry)
+                    return True
+                except queue.Full:
+                    pass
+            if len(self.overflow) >= self.overflow_size:
+                return False
+            self.overflow.append(entry)
+            self.overflow_ready.notify()
+            return True
+
+    def _admission_loop(self):
+        """Deadline policy: move parked connections into the queue as slots free up."""
+        while self.running:
+            with self.overflow_ready:
+                if not self.overflow:
+                    self.overflow_ready.wait(timeout=1.0)
+                    continue
+                job, enqueued_at = self.overflow.popleft()
+            if self._wait_for_slot(job, enqueued_at):
+                continue
+            if self.running:
+                with self.lock:
+                    self.expired += 1
+            self._close(job)
+
+    def _wait_for_slot(self, job, enqueued_at) -> bool:
+        """Put a parked job into the queue before its deadline; False if it ran out (or shutdown)."""
+        deadline_at = enqueued_at + self.deadline
+        while self.running:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                # Short slices so shutdown() isn't kept waiting for a whole deadline
+                self.queue.put((job, enqueued_at), timeout=min(remaining, 1.0))
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker_loop(self):
+        """Take jobs off the queue and run them until shutdown."""
+        while self.running:
+            try:
+                job, enqueued_at = self.queue.get(timeout=1.0)
+            except queue.Empty:
+                # Timeout is normal - just loop again and check self.running
+                continue
+
+            if self.overflow_policy == "deadline" and time.monotonic() - enqueued_at > self.deadline:
+                with self.lock:
+                    self.expired += 1
+                self._close(job)
+                continue
+
+            job.handle_game()
+
+    def _close(self, job):
+        try:
+            job.socket.close()
+        except Exception:
+            pass
+
+    def stats(self):
+        """
+        Return pool counters.
+
+        Returns:
+            dict: workers, waiting (currently queued), queued, rejected, expired
+        """
+        with self.lock:
+            return {
+                "workers": self.num_workers,
+                "waiting": self.queue.qsize() + len(self.overflow),
+                "queued": self.queued,
+                "rejected": self.rejected,
+                "expired": self.expired,
+            }
+
+    def shutdown(self, timeout=1.0):
+        """
+        Stop workers after their current game; close connections still waiting.
+
+        Args:
+            timeout (float): Max seconds to wait for each worker
+        """
+        self.running = False
+        with self.overflow_ready:
+            parked, self.overflow = list(self.overflow), collections.deque()
+            self.overflow_ready.notify_all()
+        for job, _ in parked:
+            self._close(job)
+        # Stop admitting before draining, so nothing lands in the queue afterwards
+        if self.admission_thread is not None and self.admission_thread.is_alive():
+            self.admission_thread.join(timeout=timeout)
+        while True:
+            try:
+                job, _ = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self._close(job)
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.join(timeout=timeout)
@@ -0,0 +1 @@
+"""Offline simulation of many blackjack rounds (capacity sizing, fairness checks)."""
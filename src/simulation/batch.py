@@ -0,0 +1,99 @@
+"""
+Multi-process batch simulation API.
+
+    from src.simulation.batch import simulate
+    result = simulate(50_000_000, "basic", workers=8, seed=42)
+    print(result.summary())
+
+The rounds are cut into fixed-size chunks (CHUNK_ROUNDS, independent of the
+worker count). Chunk k is simulated with its own seed, derive_seed(seed, k),
+and the per-chunk SimulationResults - integer counters and histograms - are
+summed. Which process ran which chunk, and in what order they finished,
+can't change the sum, so the same seed gives the same result on a 4-core
+laptop and a 64-core batch box.
+
+Workers are a ProcessPoolExecutor (the vectorized simulator holds the GIL).
+Policies are passed by name (see vectorized.make_policy) so each worker
+builds its own; any picklable policy object works too.
+
+Run from the repo root:
+    python -m src.simulation.batch --rounds 20000000 --workers 0 --seed 42
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.common.seeding import derive_seed, new_master_seed
+from src.simulation.vectorized import simulate_rounds, make_policy, SimulationResult
+
+CHUNK_ROUNDS = 500_000  # Fixed work unit; changing it changes results for a given seed
+
+
+def _chunk_sizes(n_rounds, chunk_rounds):
+    """Sizes of the consecutive chunks covering n_rounds."""
+    full, rest = divmod(n_rounds, chunk_rounds)
+    return [chunk_rounds] * full + ([rest] if rest else [])
+
+
+def _run_chunk(chunk_index, size, policy, num_decks, seed):
+    """Simulate one chunk (runs in a worker process)."""
+    if isinstance(policy, str):
+        policy = make_policy(policy, num_decks)
+    return simulate_rounds(size, policy, num_decks, seed=derive_seed(seed, chunk_index))
+
+
+def simulate(n_rounds, policy, workers=1, seed=None, num_decks=1, chunk_rounds=CHUNK_ROUNDS):
+    """
+    Simulate n_rounds across a process pool and merge the statistics.
+
+    Args:
+        n_rounds (int): Total rounds to play
+        policy (str | callable): Policy name for make_policy, or a picklable policy
+        workers (int): Worker processes (1 = run in this process, 0 = one per CPU)
+        seed (int): Master seed (None = fresh random seed; results then aren't reproducible)
+        num_decks (int): Decks per round's pack
+        chunk_rounds (int): Rounds per chunk (keep fixed to compare runs)
+
+    Returns:
+        SimulationResult: Merged win/loss/tie counters and final-total histograms
+    """
+    if n_rounds < 0:
+        raise ValueError(f"n_rounds must be >= 0, got {n_rounds}")
+    seed = seed if seed is not None else new_master_seed()
+    workers = workers or os.cpu_count() or 1
+    sizes = _chunk_sizes(n_rounds, chunk_rounds)
+    jobs = [(index, size, policy, num_decks, seed) for index, size in enumerate(sizes)]
+
+    result = SimulationResult()
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            result = result + _run_chunk(*job)
+        return result
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for chunk_result in pool.map(_run_chunk, *zip(*jobs)):
+            result = result + chunk_result
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process blackjack round simulator")
+    parser.add_argument("--rounds", type=int, default=10_000_000, help="Rounds to simulate")
+    parser.add_argument("--policy", default="basic", help="basic, mimic, never-bust or stand")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--decks", type=int, default=1, help="Decks per round's pack")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed (default: random, printed)")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else new_master_seed()
+    print(f"Master seed: {seed}")
+    start = time.perf_counter()
+    result = simulate(args.rounds, args.policy, args.workers, seed, args.decks)
+    elapsed = time.perf_counter() - start
+    print(result.summary())
+    print(f"{args.rounds / elapsed:,.0f} rounds/sec ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Vectorized NumPy Monte Carlo simulator of full rounds.
+
+Playing rounds one Deck/Card/Hand object at a time tops out around 10^5
+rounds/sec. This module plays a whole batch of rounds at once: every row of a
+2-D int8 array is one round's deck, and each step of the game (deal, player
+hit, dealer hit) is a masked array operation over all rounds still in that
+step.
+
+Same rules and deal order as GameSession:
+    player, player, dealer up, dealer hole, then player hits, then dealer draws.
+    The dealer follows dealer_decision (tabulated once into DEALER_HITS), a
+    player bust loses immediately, otherwise the higher total wins.
+
+Decks:
+Each round is dealt from its own freshly shuffled num_decks-deck pack (the
+per-round model the server used before shoes). Cards are stored by blackjack
+value (Ace = 1, faces = 10). Shuffling is a vectorized partial Fisher-Yates:
+only the first few positions are shuffled up front and more are shuffled on
+demand, exactly like CompactDeck(lazy=True) - a round touches ~6 of 52 cards.
+
+Policies decide for many hands at once: policy(total, soft, up) takes int/bool
+arrays (up = dealer up value, 1 = Ace) and returns a bool "hit" mask.
+
+Run from the repo root:
+    python -m src.simulation.vectorized --rounds 5000000 --policy basic
+"""
+
+import argparse
+import math
+import time
+import numpy as np
+from config import MAX_HAND_VALUE, RANKS_PER_SUIT, SUITS
+from src.common.game_logic import dealer_decision
+from src.common.strategy import default_table, TOTALS, UP_VALUES
+
+BATCH_SIZE = 200_000     # Rounds per vectorized batch
+INITIAL_SHUFFLED = 8     # Deck positions shuffled up front (4 dealt + a few hits)
+Z_95 = 1.959964          # Two-sided 95% normal quantile
+HISTOGRAM_SIZE = 32      # Hand totals 0-31 (the largest reachable total is 30)
+
+# One deck by blackjack value: Ace = 1, 2-9, 10/J/Q/K = 10
+ONE_DECK_VALUES = np.array([min(rank, 10) for _ in range(SUITS) for rank in range(1, RANKS_PER_SUIT + 1)],
+                           dtype=np.int8)
+# dealer_decision tabulated for every reachable total, so the dealer rule stays the single source
+DEALER_HITS = np.array([dealer_decision(total) == "Hit" for total in range(HISTOGRAM_SIZE)])
+
+
+# ---------- policies ----------
+class ThresholdPolicy:
+    """Hit while the total is below stand_on (17 = mimic the dealer, 0 = always stand)."""
+
+    def __init__(self, stand_on):
+        self.stand_on = stand_on
+
+    def __call__(self, total, soft, up):
+        return total < self.stand_on
+
+
+class StrategyPolicy:
+    """Basic strategy from a StrategyTable, as one fancy-indexing lookup."""
+
+    def __init__(self, table):
+        # actions is laid out [soft][total][up value index]
+        self.hits = np.frombuffer(table.actions, dtype=np.uint8).reshape(2, TOTALS, UP_VALUES).astype(bool)
+
+    def __call__(self, total, soft, up):
+        return self.hits[soft.astype(np.intp), np.minimum(total, TOTALS - 1), up - 1]
+
+
+def make_policy(name, num_decks=1):
+    """
+    Build a policy by name.
+
+    Args:
+        name (str): "basic" (exact-EV basic strategy), "mimic" (hit below 17),
+                    "never-bust" (hit below 12) or "stand" (never hit)
+        num_decks (int): Decks the basic-strategy table is computed for
+    """
+    if name == "basic":
+        return StrategyPolicy(default_table(num_decks))
+    thresholds = {"mimic": 17, "never-bust": 12, "stand": 0}
+    if name not in thresholds:
+        raise ValueError(f"Unknown policy: '{name}'. Must be one of {('basic',) + tuple(thresholds)}")
+    return ThresholdPolicy(thresholds[name])
+
+
+# ---------- results ----------
+class SimulationResult:
+    """Win/loss/tie counters and final-total histograms; results of separate runs add up."""
+
+    def __init__(self, wins=0, losses=0, ties=0, player_totals=None, dealer_totals=None):
+        self.wins = wins
+        self.losses = losses
+        self.ties = ties
+        # player_totals[t] / dealer_totals[t] = rounds that ended with that hand total
+        # (the dealer's hand isn't played out when the player busts; those rounds count at the dealer's 2-card total)
+        self.player_totals = player_totals if player_totals is not None else np.zeros(HISTOGRAM_SIZE, np.int64)
+        self.dealer_totals = dealer_totals if dealer_totals is not None else np.zeros(HISTOGRAM_SIZE, np.int64)
+
+    @property
+    def rounds(self):
+        return self.wins + self.losses + self.ties
+
+    def __add__(self, other):
+        return SimulationResult(self.wins + other.wins, self.losses + other.losses, self.ties + other.ties,
+                                self.player_totals + other.player_totals, self.dealer_totals + other.dealer_totals)
+
+    def __eq__(self, other):
+        return (isinstance(other, SimulationResult)
+                and (self.wins, self.losses, self.ties) == (other.wins, other.losses, other.ties)
+                and np.array_equal(self.player_totals, other.player_totals)
+                and np.array_equal(self.dealer_totals, other.dealer_totals))
+
+    def rate(self, count):
+        """(rate, 95% confidence half-width) of a counter, normal approximation."""
+        n = self.rounds
+        p = count / n
+        return p, Z_95 * math.sqrt(p * (1 - p) / n)
+
+    def expected_value(self):
+        """(player EV per unit bet, 95% confidence half-width): win = +1, loss = -1, tie = 0."""
+        n = self.rounds
+        mean = (self.wins - self.losses) / n
+        second_moment = (self.wins + self.losses) / n
+        return mean, Z_95 * math.sqrt((second_moment - mean * mean) / n)
+
+    def summary(self):
+        """Multi-line human-readable report."""
+        lines = [f"Rounds: {self.rounds:,}"]
+        for label, count in (("Win", self.wins), ("Loss", self.losses), ("Tie", self.ties)):
+            p, half_width = self.rate(count)
+            lines.append(f"{label + ' rate:':<11} {p * 100:7.3f}% ± {half_width * 100:.3f}%")
+        ev, half_width = self.expected_value()
+        lines.append(f"{'Player EV:':<11} {ev * 100:+7.3f}% ± {half_width * 100:.3f}%")
+        return "\n".join(lines)
+
+
+# ---------- simulation ----------
+class _Batch:
+    """Decks for one batch of rounds, shuffled lazily column by column."""
+
+    def __init__(self, size, num_decks, rng):
+        self.rng = rng
+        self.rows = np.arange(size)
+        self.cards = np.tile(ONE_DECK_VALUES, (size, num_decks))
+        self.shuffled = 0
+        self.shuffle_until(INITIAL_SHUFFLED)
+
+    def shuffle_until(self, count):
+        """Fisher-Yates positions [shuffled, count): each gets a uniform pick from the rest."""
+        cards, rows, width = self.cards, self.rows, self.cards.shape[1]
+        for i in range(self.shuffled, min(count, width)):
+            swap = self.rng.integers(i, width, size=len(rows))
+            picked = cards[rows, swap]
+            cards[rows, swap] = cards[:, i]
+            cards[:, i] = picked
+        self.shuffled = max(self.shuffled, min(count, width))
+
+    def draw(self, which, position):
+        """Card at position[k] for each selected row (position: per-row next-card index)."""
+        needed = int(position[which].max()) + 1
+        if needed > self.shuffled:
+            self.shuffle_until(needed)
+        return self.cards[which, position[which]]
+
+
+def _best_total(hard, has_ace):
+    """Best total and soft flag from the Aces-as-1 total."""
+    soft = has_ace & (hard + 10 <= MAX_HAND_VALUE)
+    return np.where(soft, hard + 10, hard), soft
+
+
+def _play_batch(size, policy, num_decks, rng):
+    batch = _Batch(size, num_decks, rng)
+    cards = batch.cards
+    every = batch.rows
+
+    player_hard = (cards[:, 0] + cards[:, 1]).astype(np.int16)
+    player_ace = (cards[:, 0] == 1) | (cards[:, 1] == 1)
+    up = cards[:, 2].astype(np.intp)
+    dealer_hard = (cards[:, 2] + cards[:, 3]).astype(np.int16)
+    dealer_ace = (cards[:, 2] == 1) | (cards[:, 3] == 1)
+    position = np.full(size, 4, dtype=np.intp)
+
+    # Player: rows that keep hitting stay active; standing or busting ends the turn
+    active = every
+    while active.size:
+        total, soft = _best_total(player_hard[active], player_ace[active])
+        active = active[(total <= MAX_HAND_VALUE) & policy(total, soft, up[active])]
+        if not active.size:
+            break
+        card = batch.draw(active, position)
+        player_hard[active] += card
+        player_ace[active] |= card == 1
+        position[active] += 1
+
+    player_total, _ = _best_total(player_hard, player_ace)
+    player_bust = player_total > MAX_HAND_VALUE
+
+    # Dealer: only plays out hands where the player didn't bust
+    active = every[~player_bust]
+    while active.size:
+        total, _ = _best_total(dealer_hard[active], dealer_ace[active])
+        active = active[DEALER_HITS[total]]
+        if not active.size:
+            break
+        card = batch.draw(active, position)
+        dealer_hard[active] += card
+        dealer_ace[active] |= card == 1
+        position[active] += 1
+
+    dealer_total, _ = _best_total(dealer_hard, dealer_ace)
+    dealer_bust = dealer_total > MAX_HAND_VALUE
+
+    win = ~player_bust & (dealer_bust | (player_total > dealer_total))
+    loss = player_bust | (~dealer_bust & (dealer_total > player_total))
+    wins = int(np.count_nonzero(win))
+    losses = int(np.count_nonzero(loss))
+    return SimulationResult(
+        wins, losses, size - wins - losses,
+        np.bincount(player_total, minlength=HISTOGRAM_SIZE).astype(np.int64),
+        np.bincount(dealer_total, minlength=HISTOGRAM_SIZE).astype(np.int64),
+    )
+
+
+def simulate_rounds(n_rounds, policy, num_decks=1, seed=None, batch_size=BATCH_SIZE):
+    """
+    Simulate n_rounds independent rounds.
+
+    Args:
+        n_rounds (int): Rounds to play
+        policy (callable): policy(total, soft, up) -> bool hit mask (see make_policy)
+        num_decks (int): Decks per round's pack
+        seed (int): Seed for numpy's default generator (None = fresh entropy)
+        batch_size (int): Rounds per vectorized batch (memory ~ 52 * num_decks bytes per round)
+
+    Returns:
+        SimulationResult: Merged counters and histograms
+    """
+    rng = np.random.default_rng(seed)
+    result = SimulationResult()
+    remaining = n_rounds
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        result = result + _play_batch(size, policy, num_decks, rng)
+        remaining -= size
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized blackjack round simulator")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="Rounds to simulate")
+    parser.add_argument("--policy", default="basic", help="basic, mimic, never-bust or stand")
+    parser.add_argument("--decks", type=int, default=1, help="Decks per round's pack")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: random)")
+    args = parser.parse_args()
+
+    policy = make_policy(args.policy, args.decks)
+    start = time.perf_counter()
+    result = simulate_rounds(args.rounds, policy, args.decks, args.seed)
+    elapsed = time.perf_counter() - start
+    print(result.summary())
+    print(f"{args.rounds / elapsed:,.0f} rounds/sec ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: cost of dealing one round (6 cards) from each deck flavour.
+
+"Deck()"             = the original list-of-Cards deck, built and shuffled per round
+"CompactDeck()"      = integer deck, built and fully shuffled per round
+"CompactDeck reuse"  = one integer deck, full shuffle() per round
+"lazy CompactDeck()" = integer deck built per round in lazy mode (GameSession's default)
+"lazy reuse"         = one integer deck in lazy mode, one Fisher-Yates swap per draw
+
+Run from the repo root:
+    python -m tests.bench_deck
+"""
+
+import timeit
+from src.common.deck import Deck, CompactDeck
+
+CARDS_PER_ROUND = 6
+
+REUSED = CompactDeck()
+REUSED_LAZY = CompactDeck(lazy=True)
+
+
+def round_deck():
+    deck = Deck()
+    for _ in range(CARDS_PER_ROUND):
+        deck.draw()
+
+
+def round_compact():
+    deck = CompactDeck()
+    for _ in range(CARDS_PER_ROUND):
+        deck.draw()
+
+
+def round_compact_reuse():
+    REUSED.shuffle()
+    for _ in range(CARDS_PER_ROUND):
+        REUSED.draw()
+
+
+def round_lazy():
+    deck = CompactDeck(lazy=True)
+    for _ in range(CARDS_PER_ROUND):
+        deck.draw()
+
+
+def round_lazy_reuse():
+    REUSED_LAZY.shuffle()
+    for _ in range(CARDS_PER_ROUND):
+        REUSED_LAZY.draw()
+
+
+CASES = {
+    "Deck()": round_deck,
+    "CompactDeck()": round_compact,
+    "CompactDeck reuse": round_compact_reuse,
+    "lazy CompactDeck()": round_lazy,
+    "lazy reuse": round_lazy_reuse,
+}
+
+
+def rounds_per_sec(func, repeat=5, number=20000):
+    """Return best-of-`repeat` rounds/sec."""
+    return number / min(timeit.repeat(func, repeat=repeat, number=number))
+
+
+def main():
+    baseline = None
+    for name, func in CASES.items():
+        rate = rounds_per_sec(func)
+        baseline = baseline or rate
+        print(f"{name:<20} {rate:>12,.0f} rounds/sec {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: server->client payload frames/sec, packed per send vs. precomputed table.
+
+"before" = the original build_payload() on every send (cookie/type header +
+           encode_payload_card + length check + concatenation), kept here
+           verbatim as a frozen reference - the live build_payload() has since
+           moved onto the precompiled PAYLOAD_STRUCT, so it no longer measures
+           the old per-send cost.
+"after"  = card_frame() / result_frame() lookups into the import-time frame tables.
+
+Run from the repo root:
+    python -m tests.bench_frames
+"""
+
+import struct
+import timeit
+from config import MAGIC_COOKIE, MSG_TYPE_PAYLOAD
+from src.common.card import Card
+from src.server.game_session import card_frame, result_frame
+
+# A typical round's worth of server frames: 6 card updates + 1 result
+CARDS = [Card(rank, suit) for rank, suit in ((10, 0), (7, 1), (9, 2), (8, 3), (1, 0), (13, 2))]
+RESULT_CODE = 0x3
+FRAMES_PER_CALL = len(CARDS) + 1
+
+
+# ---------- old implementation (reference) ----------
+_NO_DECISION = b"\x00" * 5
+
+
+def old_encode_payload_card(rank, suit):
+    return struct.pack("!HB", rank, suit)
+
+
+def old_build_payload(result_code, card_rank, card_suit):
+    card_bytes = old_encode_payload_card(card_rank, card_suit)  # must be 3 bytes
+    if len(card_bytes) != 3:
+        raise ValueError("encode_payload_card must return exactly 3 bytes")
+    return struct.pack("!IB", MAGIC_COOKIE, MSG_TYPE_PAYLOAD) + _NO_DECISION + struct.pack("!B", result_code) + card_bytes
+
+
+def frames_before():
+    for card in CARDS:
+        old_build_payload(0x0, card.rank, card.suit)
+    old_build_payload(RESULT_CODE, 0, 0)
+
+
+def frames_after():
+    for card in CARDS:
+        card_frame(card)
+    result_frame(RESULT_CODE)
+
+
+def measure(func, repeat=5, number=20000):
+    """Return best-of-`repeat` frames/sec."""
+    best = min(timeit.repeat(func, repeat=repeat, number=number))
+    return number * FRAMES_PER_CALL / best
+
+
+def main():
+    before = measure(frames_before)
+    after = measure(frames_after)
+    print(f"{'build per send (before)':<28} {before:>14,.0f} frames/sec")
+    print(f"{'precomputed table (after)':<28} {after:>14,.0f} frames/sec")
+    print(f"{'speedup':<28} {after / before:>14.1f}x")
+
+
+if __name__ == "__main__":
+    main()
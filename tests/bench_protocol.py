@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: old format-string protocol code vs. the precompiled Struct codecs.
+
+"old" = the original encode_*/decode_* bodies (struct.pack/unpack with a format
+        string, name padding by concatenation, slicing the input), kept here
+        verbatim as a reference.
+"wrapper" = the current encode_*/decode_* functions (thin wrappers over the Structs).
+"into/from" = pack_*_into / unpack_*_from on a reusable buffer / at an offset.
+
+Run from the repo root:
+    python -m tests.bench_protocol
+"""
+
+import struct
+import timeit
+from config import MAGIC_COOKIE, MSG_TYPE_OFFER, MSG_TYPE_REQUEST, TEAM_NAME_LENGTH
+from src.common.protocol import (
+    encode_offer, decode_offer, encode_request, decode_request, encode_payload,
+    encode_payload_card, decode_payload_card,
+    encode_payload_player_decision, decode_payload_player_decision,
+    encode_payload_result, decode_payload_result,
+    pack_offer_into, unpack_offer_from,
+    pack_request_into, unpack_request_from,
+    pack_card_into, unpack_card_from,
+    pack_decision_into, unpack_decision_from,
+    pack_result_into, unpack_result_from,
+)
+
+
+# ---------- old implementations (reference) ----------
+def old_encode_offer(tcp_port, server_name):
+    name_bytes = server_name.encode("utf-8")[:TEAM_NAME_LENGTH]
+    name_bytes = name_bytes + b"\x00" * (TEAM_NAME_LENGTH - len(name_bytes))
+    return struct.pack("!IBH", MAGIC_COOKIE, MSG_TYPE_OFFER, tcp_port) + name_bytes
+
+
+def old_decode_offer(data):
+    magic, msg_type, tcp_port = struct.unpack("!IBH", data[:7])
+    if magic != MAGIC_COOKIE or msg_type != MSG_TYPE_OFFER:
+        raise ValueError("bad offer")
+    return tcp_port, data[7:7 + TEAM_NAME_LENGTH].rstrip(b"\x00").decode("utf-8", errors="ignore")
+
+
+def old_encode_request(num_rounds, team_name):
+    name_bytes = team_name.encode("utf-8")[:TEAM_NAME_LENGTH]
+    name_bytes = name_bytes + b"\x00" * (TEAM_NAME_LENGTH - len(name_bytes))
+    return struct.pack("!IBB", MAGIC_COOKIE, MSG_TYPE_REQUEST, num_rounds) + name_bytes
+
+
+def old_decode_request(data):
+    magic, msg_type, num_rounds = struct.unpack("!IBB", data[:6])
+    if magic != MAGIC_COOKIE or msg_type != MSG_TYPE_REQUEST:
+        raise ValueError("bad request")
+    return num_rounds, data[6:6 + TEAM_NAME_LENGTH].rstrip(b"\x00").decode("utf-8", errors="ignore")
+
+
+def old_encode_card(rank, suit):
+    return struct.pack("!HB", rank, suit)
+
+
+def old_decode_card(data):
+    return struct.unpack("!HB", data[:3])
+
+
+def old_encode_decision(decision):
+    d = decision.lower().strip()
+    if d == "hit":
+        return b"Hittt"
+    if d == "stand":
+        return b"Stand"
+    raise ValueError(decision)
+
+
+def old_decode_decision(data):
+    decision_bytes = data[:5]
+    if decision_bytes == b"Hittt":
+        return "hit"
+    if decision_bytes == b"Stand":
+        return "stand"
+    raise ValueError(decision_bytes)
+
+
+def old_encode_result(code):
+    return struct.pack("!B", code)
+
+
+def old_decode_result(data):
+    return struct.unpack("!B", data[:1])[0]
+
+
+# ---------- fixtures ----------
+BUF = bytearray(64)
+OFFER = encode_offer(40000, "Blackijecky")
+REQUEST = encode_request(10, "TeamA")
+# Card/decision/result read out of a full payload frame, at their real offsets
+FRAME = encode_payload(b"Stand", 0x3, 12, 2)
+
+CASES = {
+    "offer encode": (lambda: old_encode_offer(40000, "Blackijecky"),
+                     lambda: encode_offer(40000, "Blackijecky"),
+                     lambda: pack_offer_into(BUF, 0, 40000, "Blackijecky")),
+    "offer decode": (lambda: old_decode_offer(OFFER),
+                     lambda: decode_offer(OFFER),
+                     lambda: unpack_offer_from(OFFER, 0)),
+    "request encode": (lambda: old_encode_request(10, "TeamA"),
+                       lambda: encode_request(10, "TeamA"),
+                       lambda: pack_request_into(BUF, 0, 10, "TeamA")),
+    "request decode": (lambda: old_decode_request(REQUEST),
+                       lambda: decode_request(REQUEST),
+                       lambda: unpack_request_from(REQUEST, 0)),
+    "card encode": (lambda: old_encode_card(12, 2),
+                    lambda: encode_payload_card(12, 2),
+                    lambda: pack_card_into(BUF, 11, 12, 2)),
+    "card decode": (lambda: old_decode_card(FRAME[11:14]),
+                    lambda: decode_payload_card(FRAME[11:14]),
+                    lambda: unpack_card_from(FRAME, 11)),
+    "decision encode": (lambda: old_encode_decision("stand"),
+                        lambda: encode_payload_player_decision("stand"),
+                        lambda: pack_decision_into(BUF, 5, "stand")),
+    "decision decode": (lambda: old_decode_decision(FRAME[5:10]),
+                        lambda: decode_payload_player_decision(FRAME[5:10]),
+                        lambda: unpack_decision_from(FRAME, 5)),
+    "result encode": (lambda: old_encode_result(0x3),
+                      lambda: encode_payload_result(0x3),
+                      lambda: pack_result_into(BUF, 10, 0x3)),
+    "result decode": (lambda: old_decode_result(FRAME[10:11]),
+                      lambda: decode_payload_result(FRAME[10:11]),
+                      lambda: unpack_result_from(FRAME, 10)),
+}
+
+
+def ops_per_sec(func, repeat=5, number=100000):
+    """Return best-of-`repeat` calls/sec."""
+    return number / min(timeit.repeat(func, repeat=repeat, number=number))
+
+
+def main():
+    print(f"{'message':<18} {'old ops/sec':>13} {'wrapper':>13} {'into/from':>13} {'speedup':>8}")
+    for name, (old, wrapper, codec) in CASES.items():
+        old_rate = ops_per_sec(old)
+        wrapper_rate = ops_per_sec(wrapper)
+        codec_rate = ops_per_sec(codec)
+        best = max(wrapper_rate, codec_rate)
+        print(f"{name:<18} {old_rate:>13,.0f} {wrapper_rate:>13,.0f} {codec_rate:>13,.0f} {best / old_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark suite for the protocol, deck, hand evaluation and a full round.
+
+One place to check whether a change to protocol.py, deck.py, card.py or
+game_logic.py (or the round logic on top of them) made things faster or
+slower. Every case is timed with timeit: the loop count is calibrated with
+Timer.autorange(), then the best of --repeat runs is kept (the minimum is the
+least noisy estimate of the real cost).
+
+Groups:
+    protocol  encode + decode of every message (offer, request, payload, card,
+              decision, result)
+    deck      Deck() construction (includes its shuffle), shuffle, drawing a
+              whole deck; CompactDeck and Shoe equivalents
+    hand      calculate_hand_value on typical hands, incremental Hand.add
+    round     one full in-process round on GameSession, without and with the
+              client side's frame decoding / decision encoding
+
+Run from the repo root:
+    python -m tests.bench_suite                          # table
+    python -m tests.bench_suite --output bench.json      # + machine-readable results
+    python -m tests.bench_suite --compare bench.json     # speedup vs. a saved run
+    python -m tests.bench_suite --filter deck --repeat 3
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from src.common.card import Card
+from src.common.deck import Deck, CompactDeck, Shoe
+from src.common.game_logic import calculate_hand_value, Hand
+from src.common.protocol import (
+    encode_offer, decode_offer, encode_request, decode_request,
+    encode_payload, unpack_payload_from,
+    encode_payload_card, decode_payload_card,
+    encode_payload_player_decision, decode_payload_player_decision,
+    encode_payload_result, decode_payload_result,
+)
+from src.server.game_session import GameSession, STATE_PLAYER_TURN
+from src.server.game_handler import parse_decision
+
+REPEAT = 5
+SEED = 1
+PLAYER_STANDS_ON = 17  # Scripted player for the round cases: hit below 17
+
+# ---------- fixtures ----------
+OFFER = encode_offer(40000, "Blackijecky")
+REQUEST = encode_request(10, "TeamA")
+PAYLOAD = encode_payload(b"Stand", 0x3, 12, 2)
+CARD = encode_payload_card(12, 2)
+DECISION = encode_payload_player_decision("stand")
+RESULT = encode_payload_result(0x3)
+
+HANDS = {
+    "hard 2": [Card(10, 0), Card(7, 1)],
+    "soft 2": [Card(1, 0), Card(6, 1)],
+    "blackjack": [Card(1, 0), Card(13, 1)],
+    "multi-ace 4": [Card(1, 0), Card(1, 1), Card(9, 2), Card(1, 3)],
+    "bust 3": [Card(10, 0), Card(6, 1), Card(12, 2)],
+}
+
+_rng = random.Random(SEED)
+DECK = Deck(rng=_rng)
+COMPACT = CompactDeck(rng=_rng)
+SHOE = Shoe(rng=_rng)
+# Effectively endless session: the round cases never run out of rounds
+SESSION = GameSession(1 << 62, shoe=Shoe(rng=random.Random(SEED)))
+CLIENT_FRAME = {"hit": encode_payload(encode_payload_player_decision("hit"), 0, 0, 0),
+                "stand": encode_payload(encode_payload_player_decision("stand"), 0, 0, 0)}
+
+
+def draw_deck():
+    deck = Deck(rng=_rng)
+    for _ in range(52):
+        deck.draw()
+
+
+def draw_compact():
+    deck = CompactDeck(lazy=True, rng=_rng)
+    for _ in range(52):
+        deck.draw()
+
+
+def play_round():
+    """Round on the session only: deal, hit below 17, dealer play, result."""
+    session = SESSION
+    session.start_round()
+    while session.state == STATE_PLAYER_TURN:
+        session.receive_decision("hit" if session.player_hand.value() < PLAYER_STANDS_ON else "stand")
+
+
+def play_round_wire():
+    """Same round, plus what crosses the wire: frames decoded, decisions encoded and parsed."""
+    session = SESSION
+    frames = session.start_round()
+    while session.state == STATE_PLAYER_TURN:
+        for frame in frames:
+            unpack_payload_from(frame)
+        decision = "hit" if session.player_hand.value() < PLAYER_STANDS_ON else "stand"
+        frames = session.receive_decision(parse_decision(CLIENT_FRAME[decision]))
+    for frame in frames:
+        unpack_payload_from(frame)
+
+
+def add_hand(cards):
+    def run():
+        hand = Hand()
+        for card in cards:
+            hand.add(card)
+    return run
+
+
+CASES = {
+    "protocol": {
+        "offer encode": lambda: encode_offer(40000, "Blackijecky"),
+        "offer decode": lambda: decode_offer(OFFER),
+        "request encode": lambda: encode_request(10, "TeamA"),
+        "request decode": lambda: decode_request(REQUEST),
+        "payload encode": lambda: encode_payload(b"Stand", 0x3, 12, 2),
+        "payload decode": lambda: unpack_payload_from(PAYLOAD),
+        "card encode": lambda: encode_payload_card(12, 2),
+        "card decode": lambda: decode_payload_card(CARD),
+        "decision encode": lambda: encode_payload_player_decision("stand"),
+        "decision decode": lambda: decode_payload_player_decision(DECISION),
+        "result encode": lambda: encode_payload_result(0x3),
+        "result decode": lambda: decode_payload_result(RESULT),
+    },
+    "deck": {
+        "Deck() build+shuffle": lambda: Deck(rng=_rng),
+        "Deck shuffle": DECK.shuffle,
+        "Deck() + draw 52": draw_deck,
+        "CompactDeck shuffle": COMPACT.shuffle,
+        "lazy CompactDeck + draw 52": draw_compact,
+        "Shoe round (6 cards)": lambda: (SHOE.start_round(), [SHOE.draw() for _ in range(6)]),
+    },
+    "hand": {
+        **{f"calculate_hand_value {name}": (lambda cards=cards: calculate_hand_value(cards))
+           for name, cards in HANDS.items()},
+        "Hand.add multi-ace 4": add_hand(HANDS["multi-ace 4"]),
+    },
+    "round": {
+        "GameSession round": play_round,
+        "GameSession round + codec": play_round_wire,
+    },
+}
+
+
+def measure(func, repeat=REPEAT):
+    """
+    Time one case.
+
+    Returns:
+        dict: ns_per_op and ops_per_sec of the best run, plus loop counts
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"ns_per_op": round(best * 1e9, 1), "ops_per_sec": round(1 / best, 1),
+            "number": number, "repeat": repeat}
+
+
+def run_suite(name_filter="", repeat=REPEAT):
+    """
+    Run every case whose "group/name" contains name_filter.
+
+    Returns:
+        list[dict]: One result per case: group, name and the measure() fields
+    """
+    results = []
+    for group, cases in CASES.items():
+        for name, func in cases.items():
+            if name_filter.lower() not in f"{group}/{name}".lower():
+                continue
+            results.append({"group": group, "name": name, **measure(func, repeat)})
+    return results
+
+
+def environment():
+    """What the numbers were measured on (results only compare on the same machine)."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Protocol / deck / hand / round micro-benchmarks")
+    parser.add_argument("--filter", default="", help="Only cases whose group/name contains this text")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Timing runs per case (best is kept)")
+    parser.add_argument("--output", help="Write results as JSON to this file ('-' = stdout)")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier --output run")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {(r["group"], r["name"]): r for r in json.load(f)["results"]}
+
+    results = run_suite(args.filter, args.repeat)
+    report = {"environment": environment(), "results": results}
+
+    out = sys.stderr if args.output == "-" else sys.stdout
+    print(f"{'case':<42} {'ns/op':>11} {'ops/sec':>14}" + (f" {'vs base':>8}" if baseline else ""), file=out)
+    for r in results:
+        line = f"{r['group'] + '/' + r['name']:<42} {r['ns_per_op']:>11,.1f} {r['ops_per_sec']:>14,.0f}"
+        base = baseline.get((r["group"], r["name"]))
+        if base:
+            line += f" {base['ns_per_op'] / r['ns_per_op']:>7.2f}x"
+        print(line, file=out)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Unit tests for the multi-process batch simulation API.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.simulation.batch import simulate, _chunk_sizes
+from src.simulation.vectorized import make_policy
+
+
+class TestBatchSimulate:
+    """Test chunking, seeding and merging."""
+
+    def test_chunk_sizes(self):
+        """Chunks cover the rounds exactly; only the last one is partial."""
+        assert _chunk_sizes(10, 4) == [4, 4, 2]
+        assert _chunk_sizes(8, 4) == [4, 4]
+        assert _chunk_sizes(0, 4) == []
+
+    def test_same_seed_any_worker_count(self):
+        """Results depend on the seed, not on how many processes ran them."""
+        single = simulate(30_000, "basic", workers=1, seed=42, chunk_rounds=7_000)
+        pooled = simulate(30_000, "basic", workers=3, seed=42, chunk_rounds=7_000)
+        assert single == pooled
+        assert single.rounds == 30_000
+
+    def test_different_seeds_differ(self):
+        """Another master seed gives another sample."""
+        first = simulate(20_000, "mimic", seed=1, chunk_rounds=5_000)
+        second = simulate(20_000, "mimic", seed=2, chunk_rounds=5_000)
+        assert first != second
+
+    def test_policy_object(self):
+        """A picklable policy object works like its name."""
+        by_name = simulate(10_000, "never-bust", workers=2, seed=9, chunk_rounds=4_000)
+        by_object = simulate(10_000, make_policy("never-bust"), workers=2, seed=9, chunk_rounds=4_000)
+        assert by_name == by_object
+
+    def test_histograms_merged(self):
+        """Histograms add up to the number of rounds."""
+        result = simulate(12_000, "basic", workers=2, seed=5, chunk_rounds=5_000)
+        assert result.player_totals.sum() == 12_000
+        assert result.dealer_totals.sum() == 12_000
+
+    def test_negative_rounds(self):
+        """A negative round count is an error."""
+        with pytest.raises(ValueError):
+            simulate(-1, "basic")
@@ -4,8 +4,9 @@ Unit tests for Card class.
 Tests card rank/suit encoding, value calculation, and Ace handling.
 """
 
+import pickle
 import pytest
-from src.common.card import Card
+from src.common.card import Card, CARDS
 
 
 class TestCard:
@@ -74,3 +75,48 @@ class TestCard:
                 card = Card(rank, suit)
                 assert card.rank == rank
                 assert card.suit == suit
+
+
+class TestCardFlyweight:
+    """Test interned Card.of() instances and immutability."""
+    
+    def test_of_returns_same_instance(self):
+        """Card.of hands out one shared object per rank/suit."""
+        assert Card.of(12, 2) is Card.of(12, 2)
+    
+    def test_of_covers_all_52_cards(self):
+        """Every valid rank/suit maps to a distinct canonical card in deck order."""
+        cards = [Card.of(rank, suit) for suit in range(4) for rank in range(1, 14)]
+        assert len({id(card) for card in cards}) == 52
+        assert tuple(cards) == CARDS
+    
+    def test_of_out_of_range_not_interned(self):
+        """The neutral 0/0 card of a result payload still works, just not shared."""
+        card = Card.of(0, 0)
+        assert card.rank == 0 and card.suit == 0
+        assert card is not Card.of(0, 0)
+        assert card not in CARDS
+    
+    def test_no_instance_dict(self):
+        """__slots__: no per-instance __dict__."""
+        assert not hasattr(Card.of(5, 0), "__dict__")
+    
+    def test_immutable(self):
+        """Assigning or deleting attributes raises."""
+        card = Card.of(5, 0)
+        with pytest.raises(AttributeError):
+            card.rank = 6
+        with pytest.raises(AttributeError):
+            del card.suit
+        assert card.rank == 5
+    
+    def test_equality_and_hash(self):
+        """Cards compare and hash by value, interned or not."""
+        assert Card(5, 0) == Card.of(5, 0)
+        assert Card(5, 0) != Card(5, 1)
+        assert hash(Card(5, 0)) == hash(Card.of(5, 0))
+        assert len({Card(5, 0), Card.of(5, 0), Card(6, 0)}) == 2
+    
+    def test_pickle_returns_canonical(self):
+        """Unpickled cards are the interned instances."""
+        assert pickle.loads(pickle.dumps(Card.of(1, 3))) is Card.of(1, 3)
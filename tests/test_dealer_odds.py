@@ -0,0 +1,92 @@
+"""
+Unit tests for the exact dealer outcome engine.
+
+Checks the memoized recursion against brute-force enumeration of every
+draw order on small compositions.
+"""
+
+import itertools
+import pytest
+from fractions import Fraction
+from src.common.card import Card
+from src.common.deck import CompactDeck
+from src.common.game_logic import Hand, dealer_decision
+from src.common.dealer_odds import (
+    dealer_probabilities, full_composition, remove_ranks, deck_composition,
+    value_index, cache_info, OUTCOMES,
+)
+
+
+def brute_force(up_rank, composition):
+    """Play the dealer out over every ordering of the composition (exact, slow)."""
+    # One representative rank per composition index (index 9 -> rank 10)
+    ranks = [i + 1 for i, count in enumerate(composition) for _ in range(count)]
+    results = dict.fromkeys(OUTCOMES, Fraction(0))
+    orders = list(itertools.permutations(ranks))
+    for order in orders:
+        hand = Hand([Card(up_rank, 0)])
+        draws = iter(order)
+        while dealer_decision(hand.value()) == "Hit":
+            hand.add(Card(next(draws), 0))
+        results["bust" if hand.is_bust() else hand.value()] += Fraction(1, len(orders))
+    return results
+
+
+class TestDealerOdds:
+    """Test dealer_probabilities and helpers."""
+
+    @pytest.mark.parametrize("up_rank, composition", [
+        (6, (1, 1, 0, 1, 0, 0, 1, 0, 0, 3)),
+        (1, (0, 1, 1, 0, 1, 1, 0, 0, 1, 2)),
+        (10, (2, 0, 1, 1, 0, 1, 0, 1, 0, 1)),
+    ])
+    def test_matches_brute_force(self, up_rank, composition):
+        """Exact engine agrees with enumerating every draw order."""
+        expected = brute_force(up_rank, composition)
+        result = dealer_probabilities(up_rank, composition)
+        for outcome in OUTCOMES:
+            assert result[outcome] == pytest.approx(float(expected[outcome]), abs=1e-12)
+
+    def test_distribution_sums_to_one(self):
+        """Every up card gives a full probability distribution."""
+        for up_rank in range(1, 14):
+            composition = remove_ranks(full_composition(1), [up_rank])
+            assert sum(dealer_probabilities(up_rank, composition).values()) == pytest.approx(1.0)
+
+    def test_stands_on_soft_17(self):
+        """Ace up + 6 in the hole is soft 17: the dealer stands."""
+        composition = (0, 0, 0, 0, 0, 4, 0, 0, 0, 0)  # only 6s left
+        assert dealer_probabilities(1, composition)[17] == 1.0
+
+    def test_six_up_busts_most(self):
+        """Sanity check on a full deck: 6 up busts far more often than 10 up."""
+        six = dealer_probabilities(6, remove_ranks(full_composition(1), [6]))
+        ten = dealer_probabilities(10, remove_ranks(full_composition(1), [10]))
+        assert 0.40 < six["bust"] < 0.45
+        assert ten["bust"] < six["bust"]
+
+    def test_repeat_query_hits_cache(self):
+        """Asking the same question twice is answered from the cache."""
+        composition = remove_ranks(full_composition(2), [9, 10, 7])
+        dealer_probabilities(9, composition)
+        misses = cache_info().misses
+        dealer_probabilities(9, composition)
+        assert cache_info().misses == misses
+
+    def test_remove_missing_rank(self):
+        """Removing a card that isn't there is an error."""
+        with pytest.raises(ValueError):
+            remove_ranks((0,) * 10, [5])
+
+    def test_bad_composition_length(self):
+        """Compositions must have 10 counts."""
+        with pytest.raises(ValueError):
+            dealer_probabilities(10, (4, 4, 4))
+
+    def test_deck_composition(self):
+        """Undealt cards of a deck are counted by value."""
+        deck = CompactDeck()
+        assert deck_composition(deck) == full_composition(1)
+        drawn = [deck.draw() for _ in range(5)]
+        assert deck_composition(deck) == remove_ranks(full_composition(1), [c.rank for c in drawn])
+        assert value_index(13) == 9 and value_index(1) == 0
@@ -4,8 +4,9 @@ Unit tests for Deck class.
 Tests deck creation, shuffling, and drawing cards.
 """
 
+import random
 import pytest
-from src.common.deck import Deck
+from src.common.deck import Deck, CompactDeck, Shoe, INDEX_RANKS, INDEX_SUITS, INDEX_VALUES
 from src.common.card import Card
 
 
@@ -110,3 +111,174 @@ class TestDeck:
         # (extremely unlikely for 5 independent shuffles to produce same result)
         for i in range(1, len(orders)):
             assert orders[0] != orders[i] or len(orders[0]) == 0
+
+
+class TestCompactDeck:
+    """Test the integer-encoded CompactDeck."""
+    
+    def test_storage_is_byte_array(self):
+        """Cards are stored as one-byte indices, not Card objects."""
+        deck = CompactDeck()
+        assert deck.cards.typecode == "B"
+        assert sorted(deck.cards) == list(range(52))
+    
+    def test_draw_all_unique_cards(self):
+        """Drawing a whole deck yields all 52 canonical cards once."""
+        deck = CompactDeck()
+        drawn = [deck.draw() for _ in range(52)]
+        assert len({(card.rank, card.suit) for card in drawn}) == 52
+        assert all(card is Card.of(card.rank, card.suit) for card in drawn)
+        assert deck.is_empty()
+    
+    def test_cannot_draw_past_end(self):
+        """Drawing from an exhausted deck raises IndexError."""
+        deck = CompactDeck()
+        for _ in range(52):
+            deck.draw_index()
+        with pytest.raises(IndexError):
+            deck.draw()
+    
+    def test_lookup_tables_match_cards(self):
+        """INDEX_* tables agree with the Card for the same index."""
+        deck = CompactDeck()
+        for _ in range(52):
+            position = deck.index
+            card_index = deck.draw_index()
+            card = Card.of(INDEX_RANKS[card_index], INDEX_SUITS[card_index])
+            assert INDEX_VALUES[card_index] == card.value()
+            assert deck.cards[position] == card_index
+    
+    def test_multi_deck(self):
+        """num_decks copies of each card."""
+        deck = CompactDeck(num_decks=6)
+        assert deck.cards_remaining() == 312
+        assert sorted(deck.cards) == sorted(list(range(52)) * 6)
+    
+    def test_invalid_num_decks(self):
+        """At least one deck is required."""
+        with pytest.raises(ValueError):
+            CompactDeck(num_decks=0)
+    
+    def test_shuffle_resets_without_rebuild(self):
+        """shuffle() puts drawn cards back in the same array."""
+        deck = CompactDeck()
+        cards = deck.cards
+        for _ in range(10):
+            deck.draw()
+        deck.shuffle()
+        assert deck.cards is cards
+        assert deck.cards_remaining() == 52
+
+
+def chi_square_by_position(deck, position, trials):
+    """Chi-square statistic of which card index lands at `position` over `trials` deals."""
+    counts = [0] * 52
+    for _ in range(trials):
+        deck.shuffle()
+        for _ in range(position):
+            deck.draw_index()
+        counts[deck.draw_index()] += 1
+    expected = trials / 52
+    return sum((count - expected) ** 2 / expected for count in counts)
+
+
+# Chi-square critical value for 51 degrees of freedom at p = 0.001
+CHI_SQUARE_CRITICAL_51 = 87.97
+
+
+class TestLazyShuffle:
+    """Test the lazy (one swap per draw) shuffle mode."""
+    
+    def test_lazy_deals_every_card_once(self):
+        """A lazily shuffled deck is still a permutation of all 52 cards."""
+        deck = CompactDeck(lazy=True)
+        for _ in range(3):
+            deck.shuffle()
+            assert sorted(deck.draw_index() for _ in range(52)) == list(range(52))
+    
+    def test_lazy_shuffle_skips_upfront_work(self):
+        """shuffle() only rewinds; nothing moves until cards are drawn."""
+        deck = CompactDeck(lazy=True)
+        before = deck.cards.tolist()
+        deck.shuffle()
+        assert deck.cards.tolist() == before
+    
+    def test_seeded_rng_is_reproducible(self):
+        """The same seed deals the same cards."""
+        deals = []
+        for _ in range(2):
+            deck = CompactDeck(lazy=True, rng=random.Random(7))
+            deals.append([deck.draw_index() for _ in range(10)])
+        assert deals[0] == deals[1]
+    
+    @pytest.mark.parametrize("position", [0, 1, 5])
+    def test_lazy_uniform_chi_square(self, position):
+        """Each card is equally likely at each dealt position (lazy mode)."""
+        deck = CompactDeck(lazy=True, rng=random.Random(12345))
+        assert chi_square_by_position(deck, position, 52 * 200) < CHI_SQUARE_CRITICAL_51
+    
+    def test_eager_uniform_chi_square(self):
+        """Same check for the full-shuffle mode, as the reference."""
+        deck = CompactDeck(rng=random.Random(12345))
+        assert chi_square_by_position(deck, 0, 52 * 200) < CHI_SQUARE_CRITICAL_51
+
+
+class TestShoe:
+    """Test the multi-deck shoe with cut card."""
+    
+    def test_deals_across_rounds(self):
+        """No reshuffle between rounds until the cut card comes out."""
+        shoe = Shoe(num_decks=2, penetration=0.5)
+        assert shoe.shuffles == 1
+        for _ in range(8):
+            assert shoe.start_round() is False
+            for _ in range(6):
+                shoe.draw()
+        assert shoe.cards_remaining() == 104 - 48
+        assert shoe.shuffles == 1
+    
+    def test_reshuffles_after_cut_card(self):
+        """The round after passing the cut card starts from a fresh shoe."""
+        shoe = Shoe(num_decks=1, penetration=0.5)
+        for _ in range(26):
+            shoe.draw()
+        assert shoe.start_round() is True
+        assert shoe.shuffles == 2
+        assert shoe.cards_remaining() == 52
+    
+    def test_cards_per_shuffle(self):
+        """Counters track the lifetime of the shoe."""
+        shoe = Shoe(num_decks=1, penetration=0.5)
+        for _ in range(3):
+            shoe.start_round()
+            for _ in range(30):
+                shoe.draw()
+        assert shoe.cards_dealt() == 90
+        assert shoe.shuffles == 3
+        assert shoe.cards_per_shuffle() == 30
+    
+    def test_exhausted_shoe_reshuffles_discards(self):
+        """Running off the end mid-round reshuffles only the discards: no card is dealt twice in a round."""
+        shoe = Shoe(num_decks=1, penetration=1.0, rng=random.Random(3))
+        for _ in range(200):
+            shoe.start_round()
+            dealt = [shoe.draw_index() for _ in range(7)]  # 52 isn't a multiple of 7
+            assert len(set(dealt)) == len(dealt)
+        assert shoe.shuffles > 1
+        assert shoe.cards_dealt() == 200 * 7
+    
+    def test_whole_shoe_in_one_round_raises(self):
+        """A round can't use more cards than the shoe holds."""
+        shoe = Shoe(num_decks=1, penetration=1.0)
+        shoe.start_round()
+        for _ in range(52):
+            shoe.draw()
+        with pytest.raises(IndexError):
+            shoe.draw()
+    
+    def test_invalid_penetration(self):
+        """Penetration must be in (0, 1]."""
+        with pytest.raises(ValueError):
+            Shoe(penetration=0)
+        with pytest.raises(ValueError):
+            Shoe(penetration=1.5)
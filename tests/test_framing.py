@@ -0,0 +1,104 @@
+"""
+Unit tests for FrameReader.
+
+Uses socket.socketpair() so the reader sees a real byte stream.
+"""
+
+import socket
+import pytest
+from src.common.framing import FrameReader
+
+
+@pytest.fixture
+def pair():
+    a, b = socket.socketpair()
+    yield a, b
+    a.close()
+    b.close()
+
+
+class CountingSocket:
+    """Wraps a socket and counts recv_into calls."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.recv_calls = 0
+
+    def recv_into(self, buffer):
+        self.recv_calls += 1
+        return self.sock.recv_into(buffer)
+
+
+class TestFrameReader:
+    """Test reading fixed-size frames from a stream."""
+
+    def test_read_exact(self, pair):
+        """A single frame comes back intact."""
+        a, b = pair
+        b.sendall(b"A" * 14)
+        reader = FrameReader(a)
+        assert bytes(reader.read_exact(14)) == b"A" * 14
+
+    def test_returns_memoryview(self, pair):
+        """Frames are views into the reader's buffer, not new bytes objects."""
+        a, b = pair
+        b.sendall(b"x" * 14)
+        frame = FrameReader(a).read_exact(14)
+        assert isinstance(frame, memoryview)
+
+    def test_several_frames_one_recv(self, pair):
+        """A burst of frames costs one recv; the rest come from the buffer."""
+        a, b = pair
+        b.sendall(b"".join(bytes([i]) * 14 for i in range(5)))
+        counting = CountingSocket(a)
+        reader = FrameReader(counting)
+
+        frames = [bytes(reader.read_exact(14)) for _ in range(5)]
+
+        assert frames == [bytes([i]) * 14 for i in range(5)]
+        assert counting.recv_calls == 1
+
+    def test_read_frames_returns_whole_burst(self, pair):
+        """read_frames hands back every complete buffered frame."""
+        a, b = pair
+        b.sendall(b"a" * 14 + b"b" * 14 + b"c" * 3)
+        reader = FrameReader(a)
+
+        frames = [bytes(f) for f in reader.read_frames(14)]
+
+        assert frames == [b"a" * 14, b"b" * 14]
+        assert reader.buffered() == 3
+
+    def test_frame_split_across_recvs(self, pair):
+        """A frame arriving in pieces is reassembled."""
+        a, b = pair
+        reader = FrameReader(a)
+        b.sendall(b"12345")
+        b.sendall(b"6789ABCDE")
+        assert bytes(reader.read_exact(14)) == b"123456789ABCDE"
+
+    def test_wraps_around_small_buffer(self, pair):
+        """Partial frames at the end of the buffer are moved to the front."""
+        a, b = pair
+        reader = FrameReader(a, buffer_size=20)
+        payload = b"".join(bytes([65 + i]) * 14 for i in range(10))
+        b.sendall(payload)
+
+        frames = b"".join(bytes(reader.read_exact(14)) for _ in range(10))
+
+        assert frames == payload
+
+    def test_peer_closes(self, pair):
+        """EOF in the middle of a frame raises ConnectionError."""
+        a, b = pair
+        b.sendall(b"short")
+        b.close()
+        reader = FrameReader(a, closed_message="Server closed connection unexpectedly")
+        with pytest.raises(ConnectionError, match="Server closed"):
+            reader.read_exact(14)
+
+    def test_frame_larger_than_buffer(self, pair):
+        """Asking for more than the buffer can hold is a programming error."""
+        a, _ = pair
+        with pytest.raises(ValueError):
+            FrameReader(a, buffer_size=8).read_exact(14)
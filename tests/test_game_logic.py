@@ -7,8 +7,10 @@ Tests hand calculation (with Ace logic), bust detection, dealer decisions, and w
 import pytest
 from src.common.card import Card
 from src.common.game_logic import (
-    calculate_hand_value, is_bust, dealer_decision, determine_winner
+    calculate_hand_value, is_bust, dealer_decision, determine_winner, Hand,
+    hand_value_from_ranks, RANK_VALUES, RANK_IS_ACE, add_card_value
 )
+from src.common.deck import CompactDeck
 
 
 class TestHandCalculation:
@@ -35,6 +37,47 @@ class TestHandCalculation:
         assert calculate_hand_value(hand) == 17
 
 
+class TestRankTables:
+    """Test the rank lookup tables and the rank-int fast path."""
+    
+    def test_tables_match_card_methods(self):
+        """RANK_VALUES / RANK_IS_ACE agree with Card.value() / Card.is_ace()."""
+        for rank in range(1, 14):
+            card = Card(rank, 0)
+            assert RANK_VALUES[rank] == card.value()
+            assert bool(RANK_IS_ACE[rank]) == card.is_ace()
+    
+    def test_ranks_fast_path(self):
+        """Rank ints give the same totals as Card lists."""
+        assert hand_value_from_ranks([]) == 0
+        assert hand_value_from_ranks([1, 13]) == 21
+        assert hand_value_from_ranks([1, 1, 9]) == 21
+        assert hand_value_from_ranks([1, 1, 1, 1, 10, 10]) == 24
+        for ranks in ([10, 7], [1, 6], [1, 6, 10], [12, 13, 2]):
+            assert hand_value_from_ranks(ranks) == calculate_hand_value([Card(r, 0) for r in ranks])
+
+
+class TestAddCardValue:
+    """Test the (total, soft) stepping helper."""
+    
+    def test_steps(self):
+        """Ace as 11 when it fits, soft totals fall back to hard on a bust."""
+        assert add_card_value(0, False, 1) == (11, True)
+        assert add_card_value(11, True, 1) == (12, True)
+        assert add_card_value(18, True, 9) == (17, False)
+        assert add_card_value(15, False, 10) == (25, False)
+    
+    def test_matches_hand(self):
+        """Stepping card by card agrees with Hand."""
+        for ranks in ([1, 1, 9, 1], [1, 6, 10, 5], [10, 2, 1, 1]):
+            total, soft = 0, False
+            hand = Hand()
+            for rank in ranks:
+                total, soft = add_card_value(total, soft, RANK_VALUES[rank] if rank != 1 else 1)
+                hand.add(Card(rank, 0))
+                assert (total, soft) == (hand.value(), hand.is_soft())
+
+
 class TestBustDetection:
     """Test is_bust function."""
     
@@ -73,3 +116,56 @@ class TestWinnerDetermination:
     def test_tie(self):
         """Tie."""
         assert determine_winner(20, 20) == "tie"
+
+
+class TestHand:
+    """Test the incremental Hand."""
+    
+    def test_empty(self):
+        """An empty hand is worth 0."""
+        hand = Hand()
+        assert hand.value() == 0
+        assert len(hand) == 0
+    
+    def test_add_updates_value(self):
+        """The total follows each added card."""
+        hand = Hand([Card(10, 0)])
+        hand.add(Card(7, 1))
+        assert hand.value() == 17
+        assert not hand.is_soft()
+        assert [card.rank for card in hand] == [10, 7]
+    
+    def test_soft_hand(self):
+        """Ace + 6 is soft 17; a 10 makes it hard 17."""
+        hand = Hand([Card(1, 0), Card(6, 0)])
+        assert hand.value() == 17
+        assert hand.is_soft()
+        hand.add(Card(10, 0))
+        assert hand.value() == 17
+        assert not hand.is_soft()
+    
+    def test_two_aces_after_blackjack(self):
+        """Soft 21 + Ace demotes twice down to 12."""
+        hand = Hand([Card(1, 0), Card(13, 0), Card(1, 1)])
+        assert hand.value() == 12
+    
+    def test_bust(self):
+        """Over 21 with no soft Ace is bust."""
+        hand = Hand([Card(10, 0), Card(9, 0), Card(5, 0)])
+        assert hand.is_bust()
+        hand.add(Card(1, 0))  # Ace after bust counts 1
+        assert hand.value() == 25
+    
+    def test_matches_calculate_hand_value(self):
+        """Every prefix of many random deals agrees with calculate_hand_value."""
+        deck = CompactDeck(lazy=True)
+        for _ in range(500):
+            deck.shuffle()
+            hand = Hand()
+            cards = []
+            for _ in range(8):
+                card = deck.draw()
+                hand.add(card)
+                cards.append(card)
+                assert hand.value() == calculate_hand_value(cards)
+                assert hand.is_bust() == is_bust(calculate_hand_value(cards))
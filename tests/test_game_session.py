@@ -0,0 +1,181 @@
+"""
+Unit tests for the sans-IO GameSession state machine.
+
+Drives whole rounds without sockets using stacked (pre-ordered) decks.
+"""
+
+import random
+import struct
+import pytest
+from src.common.card import Card
+from src.common.deck import Shoe
+from src.server.game_session import (
+    GameSession, STATE_READY, STATE_PLAYER_TURN, STATE_FINISHED,
+    CARD_FRAMES, RESULT_FRAMES, build_payload
+)
+
+
+class StackedDeck:
+    """Deck that deals cards in a fixed order (first = dealt first)."""
+
+    def __init__(self, cards):
+        self.cards = list(cards)
+        self.index = 0
+
+    def draw(self):
+        card = self.cards[self.index]
+        self.index += 1
+        return card
+
+
+def stacked(*ranks):
+    """Deck factory dealing the given ranks (all Hearts) every round."""
+    return lambda: StackedDeck(Card(rank, 0) for rank in ranks)
+
+
+def parse_frame(frame):
+    """Return (result_code, rank, suit) from a 14-byte server payload."""
+    magic, msg_type = struct.unpack("!IB", frame[:5])
+    assert magic == 0xabcddcba
+    assert msg_type == 0x4
+    rank, suit = struct.unpack("!HB", frame[11:14])
+    return frame[10], rank, suit
+
+
+class TestGameSession:
+    """Test GameSession state transitions and emitted frames."""
+
+    def test_initial_deal(self):
+        """start_round emits player(2) + dealer up card and waits for a decision."""
+        # Deal order: player, player, dealer up, dealer hole
+        session = GameSession(1, deck_factory=stacked(10, 7, 9, 8))
+        assert session.state == STATE_READY
+
+        frames = session.start_round()
+
+        assert [parse_frame(f) for f in frames] == [(0x0, 10, 0), (0x0, 7, 0), (0x0, 9, 0)]
+        assert all(len(f) == 14 for f in frames)
+        assert session.state == STATE_PLAYER_TURN
+        assert session.round_num == 1
+
+    def test_stand_dealer_stands_player_wins(self):
+        """Player 19 vs dealer 17: hole card revealed, then win."""
+        session = GameSession(1, deck_factory=stacked(10, 9, 10, 7))
+        session.start_round()
+
+        frames = session.receive_decision("stand")
+
+        assert [parse_frame(f) for f in frames] == [(0x0, 7, 0), (0x3, 0, 0)]
+        assert session.state == STATE_FINISHED
+        assert session.wins == 1
+        assert session.last_result == "win"
+
+    def test_dealer_draws_until_17(self):
+        """Dealer on 12 keeps drawing: 12 + 2 + 3 = 17, tie with player's 17."""
+        session = GameSession(1, deck_factory=stacked(10, 7, 10, 2, 2, 3))
+        session.start_round()
+
+        frames = session.receive_decision("stand")
+
+        assert [parse_frame(f)[1] for f in frames[:-1]] == [2, 2, 3]
+        assert parse_frame(frames[-1])[0] == 0x1
+        assert session.ties == 1
+
+    def test_hit_without_bust_keeps_turn(self):
+        """Hitting to 20 sends one card and waits for another decision."""
+        session = GameSession(1, deck_factory=stacked(5, 5, 10, 10, 10))
+        session.start_round()
+
+        frames = session.receive_decision("hit")
+
+        assert [parse_frame(f) for f in frames] == [(0x0, 10, 0)]
+        assert session.state == STATE_PLAYER_TURN
+
+    def test_hit_bust_is_immediate_loss(self):
+        """Busting sends the card and a loss; the dealer never plays."""
+        session = GameSession(2, deck_factory=stacked(10, 6, 10, 10, 9))
+        session.start_round()
+
+        frames = session.receive_decision("hit")
+
+        assert [parse_frame(f) for f in frames] == [(0x0, 9, 0), (0x2, 0, 0)]
+        assert session.losses == 1
+        # More rounds requested -> ready for the next one
+        assert session.state == STATE_READY
+
+    def test_plays_all_requested_rounds(self):
+        """Session finishes after exactly num_rounds rounds."""
+        session = GameSession(3, deck_factory=stacked(10, 9, 10, 7))
+
+        while session.state == STATE_READY:
+            session.start_round()
+            session.receive_decision("stand")
+
+        assert session.round_num == 3
+        assert session.wins == 3
+        assert session.state == STATE_FINISHED
+
+    def test_decision_outside_player_turn_rejected(self):
+        """Decisions are only valid while waiting for the player."""
+        session = GameSession(1, deck_factory=stacked(10, 9, 10, 7))
+        with pytest.raises(RuntimeError):
+            session.receive_decision("hit")
+
+    def test_invalid_decision_rejected(self):
+        """Unknown decision strings raise ValueError."""
+        session = GameSession(1, deck_factory=stacked(10, 9, 10, 7))
+        session.start_round()
+        with pytest.raises(ValueError):
+            session.receive_decision("double")
+
+    def test_zero_rounds_is_finished(self):
+        """A request for 0 rounds has nothing to play."""
+        assert GameSession(0).state == STATE_FINISHED
+
+    def test_replay_from_seed(self):
+        """Same seed + same decisions = the exact same frames."""
+        def play(seed):
+            session = GameSession(10, shoe=Shoe(rng=random.Random(seed)))
+            frames = []
+            while session.state == STATE_READY:
+                frames += session.start_round()
+                while session.state == STATE_PLAYER_TURN:
+                    frames += session.receive_decision("hit" if session.round_num % 2 else "stand")
+            return frames
+
+        assert play(1234) == play(1234)
+        assert play(1234) != play(4321)
+
+    def test_session_keeps_one_shoe(self):
+        """By default every round is dealt from the same shoe."""
+        shoe = Shoe(num_decks=6)
+        session = GameSession(5, shoe=shoe)
+        while session.state == STATE_READY:
+            session.start_round()
+            session.receive_decision("stand")
+        assert session.state == STATE_FINISHED
+        assert session.shoe is shoe
+        assert shoe.shuffles == 1
+        assert shoe.cards_dealt() >= 5 * 4
+
+
+class TestFrameTables:
+    """Test the precomputed server frame tables."""
+
+    def test_card_frames_match_builder(self):
+        """Every table entry is byte-identical to a freshly built payload."""
+        assert len(CARD_FRAMES) == 52
+        for (rank, suit), frame in CARD_FRAMES.items():
+            assert frame == build_payload(0x0, rank, suit)
+            assert parse_frame(frame) == (0x0, rank, suit)
+
+    def test_result_frames(self):
+        """One frame per final result, neutral 0/0 card."""
+        assert {code: parse_frame(f) for code, f in RESULT_FRAMES.items()} == {
+            0x1: (0x1, 0, 0), 0x2: (0x2, 0, 0), 0x3: (0x3, 0, 0)
+        }
+
+    def test_tables_are_read_only(self):
+        """Frames are shared by all sessions, so the tables can't be modified."""
+        with pytest.raises(TypeError):
+            CARD_FRAMES[(1, 0)] = b""
@@ -0,0 +1,111 @@
+"""
+Unit tests for the latency histogram and the server's round timings.
+"""
+
+import asyncio
+import threading
+from src.common.histogram import LatencyHistogram, bucket_index, bucket_bounds, MAX_VALUE_BITS
+from src.client.load_generator import run_load
+from src.server.async_game_handler import AsyncGameHandler
+from src.server.latency import RoundTimings
+from src.server.session_registry import SessionRegistry
+
+
+class TestBuckets:
+    """Test the log-linear bucket layout."""
+
+    def test_small_values_exact(self):
+        """Values below 32 get a bucket each."""
+        for value in range(32):
+            assert bucket_bounds(bucket_index(value)) == (value, value)
+
+    def test_value_inside_its_bucket(self):
+        """Every value lies within its bucket, and buckets are within ~3% wide."""
+        for value in list(range(1, 5000)) + [10 ** k + 7 for k in range(4, 11)]:
+            low, high = bucket_bounds(bucket_index(value))
+            assert low <= value <= high
+            assert (high - low) <= value / 16
+
+    def test_buckets_contiguous(self):
+        """Consecutive buckets tile the value range with no gaps."""
+        last_high = -1
+        for index in range(bucket_index((1 << MAX_VALUE_BITS) - 1) + 1):
+            low, high = bucket_bounds(index)
+            assert low == last_high + 1
+            last_high = high
+
+
+class TestLatencyHistogram:
+    """Test recording, merging and percentiles."""
+
+    def test_empty_summary(self):
+        """An empty histogram reports zeros."""
+        summary = LatencyHistogram("x").summary()
+        assert summary["count"] == 0
+        assert summary["p99_us"] == 0
+        assert summary["max_us"] == 0
+
+    def test_percentiles(self):
+        """Percentiles land within one bucket of the exact value."""
+        histogram = LatencyHistogram()
+        for micros in range(1, 10001):
+            histogram.record_us(micros)
+        summary = histogram.summary()
+        assert summary["count"] == 10000
+        assert summary["mean_us"] == 5000.5
+        assert summary["max_us"] == 10000
+        for key, exact in (("p50_us", 5000), ("p90_us", 9000), ("p99_us", 9900)):
+            assert exact <= summary[key] <= exact * 1.04
+
+    def test_record_ns(self):
+        """Nanosecond input is stored as microseconds."""
+        histogram = LatencyHistogram()
+        histogram.record_ns(2_500_000)
+        assert histogram.summary()["max_us"] == 2500
+
+    def test_huge_value_clamped(self):
+        """Out-of-range values go to the last bucket instead of raising."""
+        histogram = LatencyHistogram()
+        histogram.record_us(1 << 45)
+        assert histogram.summary()["count"] == 1
+
+    def test_threads_merge(self):
+        """Each thread records into its own shard; the summary sees all of them."""
+        histogram = LatencyHistogram()
+
+        def record():
+            for micros in range(1000):
+                histogram.record_us(micros)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(histogram._shards) == 8
+        assert histogram.summary()["count"] == 8000
+
+
+class TestRoundTimings:
+    """Test the handlers feed the shared timings."""
+
+    def test_handlers_record_rounds(self):
+        """Every round, decision and stand of every session is recorded."""
+        timings = RoundTimings()
+        registry = SessionRegistry(master_seed=1)
+
+        async def scenario():
+            async def handle(reader, writer):
+                await AsyncGameHandler(reader, writer, registry, timings=timings).handle_game()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await run_load("127.0.0.1", port, users=5, rounds=4, strategy="stand", seed=2)
+
+        stats = asyncio.run(scenario())
+        report = timings.report()
+        assert report["round"]["count"] == 20
+        assert report["decision"]["count"] == len(stats.latencies) == 20
+        assert report["dealer"]["count"] == 20  # "stand" strategy: every decision is a stand
+        assert "decision" in timings.format_report()
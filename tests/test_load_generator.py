@@ -0,0 +1,78 @@
+"""
+Unit tests for the load generator.
+
+Runs a small fleet against an in-process asyncio server (AsyncGameHandler)
+on the same event loop.
+"""
+
+import asyncio
+import random
+import pytest
+from src.client.load_generator import run_load, parse_think_time, percentile, STRATEGIES
+from src.server.async_game_handler import AsyncGameHandler
+from src.server.session_registry import SessionRegistry
+
+
+async def _load_local_server(**options):
+    registry = SessionRegistry(master_seed=1)
+
+    async def handle(reader, writer):
+        await AsyncGameHandler(reader, writer, registry).handle_game()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        return await run_load("127.0.0.1", port, **options)
+
+
+class TestLoadGenerator:
+    """Test the fleet end to end and its helpers."""
+
+    @pytest.mark.parametrize("strategy", sorted(STRATEGIES))
+    def test_fleet_plays_all_rounds(self, strategy):
+        """Every session completes; counters and latencies add up."""
+        stats = asyncio.run(_load_local_server(users=20, rounds=4, sessions=2, strategy=strategy,
+                                               ramp_up=0.05, seed=3))
+        report = stats.report()
+        assert report["sessions_ok"] == 40
+        assert report["sessions_failed"] == 0
+        assert report["rounds"] == 160
+        assert sum(report["results"].values()) == 160
+        assert report["decisions"] >= 160
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["max"]
+
+    def test_connection_errors_counted(self):
+        """A dead target shows up as failed sessions, not a crash."""
+        async def scenario():
+            server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            return await run_load("127.0.0.1", port, users=3, rounds=1)
+
+        stats = asyncio.run(scenario())
+        assert stats.sessions_failed == 3
+        assert sum(stats.errors.values()) == 3
+
+    def test_think_time_specs(self):
+        """Think-time distributions parse and stay in range."""
+        rng = random.Random(1)
+        assert parse_think_time("0")(rng) == 0.0
+        assert parse_think_time("fixed:0.5")(rng) == 0.5
+        assert all(0.1 <= parse_think_time("uniform:0.1,0.2")(rng) <= 0.2 for _ in range(100))
+        assert parse_think_time("exp:0.1")(rng) >= 0.0
+        with pytest.raises(ValueError):
+            parse_think_time("gauss:1")
+
+    def test_percentile(self):
+        """Nearest-rank percentiles."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_unknown_strategy(self):
+        """Bad strategy names are rejected up front."""
+        with pytest.raises(ValueError):
+            asyncio.run(run_load("127.0.0.1", 1, strategy="cheat"))
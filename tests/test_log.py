@@ -0,0 +1,149 @@
+"""
+Unit tests for the structured, queue-based logging layer.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import threading
+import pytest
+from src.client.load_generator import run_load
+from src.common.seeding import derive_seed
+from src.server.async_game_handler import AsyncGameHandler
+from src.server.session_registry import SessionRegistry
+from src.common.log import (
+    get_logger, configure_logging, stop_logging, StructuredFormatter, RepeatFilter, ROOT_LOGGER,
+)
+
+
+def _record(msg, *args, level=logging.INFO, **fields):
+    record = logging.LogRecord(f"{ROOT_LOGGER}.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(fields)
+    return record
+
+
+@pytest.fixture
+def captured():
+    """Configure logging into a StringIO; restore the stdlib defaults afterwards."""
+    stream = io.StringIO()
+    configure_logging("INFO", "text", stream)
+    yield stream
+    stop_logging()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+
+
+class TestStructuredFormatter:
+    """Test text and JSON output."""
+
+    def test_text_fields(self):
+        """Text lines end with the extra fields as key=value."""
+        line = StructuredFormatter("text").format(_record("Client %s joined", "Sharks", session=7))
+        assert line.endswith("INFO  test: Client Sharks joined session=7")
+
+    def test_json_fields(self):
+        """JSON lines carry the message and fields as keys."""
+        entry = json.loads(StructuredFormatter("json").format(_record("Seed %d", 42, seed=42)))
+        assert entry["message"] == "Seed 42"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "test"
+        assert entry["seed"] == 42
+
+    def test_unknown_format(self):
+        """Only text and json are accepted."""
+        with pytest.raises(ValueError):
+            StructuredFormatter("xml")
+
+
+class TestRepeatFilter:
+    """Test rate-limited repeat suppression."""
+
+    def test_burst_then_suppress(self):
+        """Identical records beyond the burst are dropped; other messages pass."""
+        repeat_filter = RepeatFilter(window=60, burst=3)
+        passed = [repeat_filter.filter(_record("Broadcast error: %s", "down")) for _ in range(10)]
+        assert passed == [True] * 3 + [False] * 7
+        assert repeat_filter.filter(_record("Something else"))
+
+    def test_distinct_sessions_not_suppressed(self):
+        """Per-session lines share a template but differ in arguments: all get through."""
+        repeat_filter = RepeatFilter(window=60, burst=3)
+        records = [_record("Client %s from %s wants %d rounds", f"team-{i}", ("127.0.0.1", 40000 + i), 3,
+                           session=i, seed=1000 + i) for i in range(100)]
+        assert all(repeat_filter.filter(record) for record in records)
+
+    def test_reports_suppressed_after_window(self):
+        """The first record of the next window carries the number dropped."""
+        repeat_filter = RepeatFilter(window=60, burst=1)
+        for _ in range(5):
+            repeat_filter.filter(_record("Error from %s", "x"))
+        repeat_filter.window = 0  # Window over
+        record = _record("Error from %s", "x")
+        assert repeat_filter.filter(record)
+        assert record.suppressed == 4
+
+
+class TestQueueLogging:
+    """Test the background writer end to end."""
+
+    def test_records_written_by_listener(self, captured):
+        """Records from many threads all reach the stream once the writer is flushed."""
+        log = get_logger("server.test")
+
+        def emit(thread_index):
+            for i in range(5):
+                log.info("Thread %d message %d", thread_index, i, extra={"session": thread_index})
+
+        threads = [threading.Thread(target=emit, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stop_logging()
+        lines = captured.getvalue().splitlines()
+        assert len(lines) == 20
+        assert all("server.test:" in line and "session=" in line for line in lines)
+
+    def test_session_lines_all_written(self, captured):
+        """Well past the repeat burst, every session's "wants" line (with its seed) is written."""
+        log = get_logger("server.handler")
+        for i in range(100):
+            log.info("Client %s from %s wants %d rounds", f"load-{i}", ("127.0.0.1", 40000 + i), 3,
+                     extra={"session": i, "seed": 1000 + i})
+        stop_logging()
+        lines = captured.getvalue().splitlines()
+        assert len(lines) == 100
+        assert all(f"seed={1000 + i}" in line for i, line in enumerate(lines))
+
+    def test_level_filtering(self, captured):
+        """Records below the configured level are dropped before queueing."""
+        log = get_logger("server.test")
+        log.debug("hidden")
+        log.warning("shown")
+        stop_logging()
+        output = captured.getvalue()
+        assert "hidden" not in output
+        assert "WARNING server.test: shown" in output
+
+    def test_session_lines_name_the_shard(self, captured):
+        """A logged session carries shard + session + seed, enough to replay it."""
+        registry = SessionRegistry(master_seed=5, shard=2)
+
+        async def scenario():
+            async def handle(reader, writer):
+                await AsyncGameHandler(reader, writer, registry).handle_game()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                await run_load("127.0.0.1", port, users=1, rounds=1)
+
+        asyncio.run(scenario())
+        stop_logging()
+        wants = [line for line in captured.getvalue().splitlines() if "wants" in line]
+        assert len(wants) == 1
+        assert wants[0].endswith(f"shard=2 session=1 seed={derive_seed(5, 2, 1)}")
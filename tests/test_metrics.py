@@ -0,0 +1,147 @@
+"""
+Unit tests for the server metrics and the /metrics endpoint.
+"""
+
+import asyncio
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from src.client.load_generator import run_load
+from src.server.async_game_handler import AsyncGameHandler
+from src.server.game_handler import PAYLOAD_LEN, REQUEST_LEN
+from src.server.metrics import ServerMetrics, MetricsEndpoint
+from src.server.server import BlackjackServer
+from src.server.session_registry import SessionRegistry
+
+
+class TestServerMetrics:
+    """Test counting, shard merging and the text format."""
+
+    def test_counters_and_results(self):
+        """Counters, results and errors add up in the snapshot."""
+        metrics = ServerMetrics()
+        metrics.inc("sessions_accepted")
+        metrics.count_in(38)
+        metrics.count_out(3, 42)
+        metrics.round_finished("win")
+        metrics.round_finished("tie")
+        metrics.error(TimeoutError("slow"))
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["sessions_accepted"] == 1
+        assert snapshot["counters"]["frames_in"] == 1
+        assert snapshot["counters"]["bytes_in"] == 38
+        assert snapshot["counters"]["frames_out"] == 3
+        assert snapshot["counters"]["bytes_out"] == 42
+        assert snapshot["counters"]["rounds"] == 2
+        assert snapshot["results"] == {"win": 1, "loss": 0, "tie": 1}
+        assert snapshot["errors"] == {"TimeoutError": 1}
+
+    def test_threads_merge(self):
+        """Each thread counts into its own shard; the snapshot sees all of them."""
+        metrics = ServerMetrics()
+
+        def count():
+            for _ in range(1000):
+                metrics.count_in(14)
+
+        threads = [threading.Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(metrics._shards) == 4
+        assert metrics.snapshot()["counters"]["bytes_in"] == 4 * 1000 * 14
+
+    def test_snapshot_while_new_error_types_appear(self):
+        """Scraping while another thread records new exception types doesn't raise."""
+        metrics = ServerMetrics()
+        metrics.error(ValueError())  # Main thread's shard, so the worker's isn't the first merged
+        error_types = [type(f"Error{i}", (Exception,), {}) for i in range(20000)]
+
+        def record():
+            for error_type in error_types:
+                metrics.error(error_type())
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        while thread.is_alive():
+            metrics.snapshot()
+        thread.join()
+        assert len(metrics.snapshot()["errors"]) == 20001
+
+    def test_render_prometheus_text(self):
+        """Counters, labelled series and collectors are rendered with HELP/TYPE lines."""
+        metrics = ServerMetrics()
+        metrics.round_finished("loss")
+        metrics.error(ConnectionError())
+        metrics.add_collector("active_sessions", "gauge", "Sessions being played", lambda: 7)
+        text = metrics.render()
+        assert "# TYPE blackjack_rounds_total counter" in text
+        assert "blackjack_rounds_total 1" in text
+        assert 'blackjack_results_total{result="loss"} 1' in text
+        assert 'blackjack_errors_total{type="ConnectionError"} 1' in text
+        assert "# TYPE blackjack_active_sessions gauge" in text
+        assert "blackjack_active_sessions 7" in text
+        assert text.endswith("\n")
+
+    def test_server_collectors(self):
+        """A threaded server exposes active and rejected sessions without counting them twice."""
+        server = BlackjackServer("Metrics", engine="threaded")
+        collected = server.metrics.snapshot()["collected"]
+        assert collected == {"active_sessions": 0, "sessions_rejected_total": 0}
+
+
+class TestMetricsEndpoint:
+    """Test the HTTP endpoint and the handler instrumentation."""
+
+    def test_serves_metrics(self):
+        """GET /metrics returns the text format; other paths are 404."""
+        metrics = ServerMetrics()
+        metrics.inc("sessions_accepted", 5)
+        endpoint = MetricsEndpoint(metrics, 0)
+        endpoint.start()
+        try:
+            url = f"http://127.0.0.1:{endpoint.port}"
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert "blackjack_sessions_accepted_total 5" in response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+        finally:
+            endpoint.stop()
+
+    def test_shard_port_zero_means_any_free_port(self):
+        """A shard with metrics_port=0 binds a free port, not port 0 + shard + 1."""
+        server = BlackjackServer("Metrics", engine="asyncio", shard=1, metrics_port=0)
+        server._start_metrics_endpoint()
+        try:
+            assert server.metrics_endpoint.port > 1024
+        finally:
+            server.metrics_endpoint.stop()
+
+    def test_handlers_count_traffic(self):
+        """Sessions, rounds, results, frames and bytes match what the fleet played."""
+        metrics = ServerMetrics()
+        registry = SessionRegistry(master_seed=1)
+
+        async def scenario():
+            async def handle(reader, writer):
+                await AsyncGameHandler(reader, writer, registry, metrics=metrics).handle_game()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await run_load("127.0.0.1", port, users=4, rounds=5, seed=4)
+
+        stats = asyncio.run(scenario())
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        decisions = len(stats.latencies)
+        assert counters["sessions_accepted"] == 4
+        assert counters["rounds"] == 20
+        assert sum(snapshot["results"].values()) == 20
+        assert counters["frames_in"] == 4 + decisions
+        assert counters["bytes_in"] == 4 * REQUEST_LEN + decisions * PAYLOAD_LEN
+        assert counters["bytes_out"] == counters["frames_out"] * PAYLOAD_LEN
+        assert snapshot["errors"] == {}
@@ -10,7 +10,13 @@ from src.common.protocol import (
     encode_request, decode_request,
     encode_payload_card, decode_payload_card,
     encode_payload_player_decision, decode_payload_player_decision,
-    encode_payload_result, decode_payload_result
+    encode_payload_result, decode_payload_result,
+    encode_payload, pack_payload_into, unpack_payload_from,
+    pack_offer_into, unpack_offer_from,
+    pack_request_into, unpack_request_from,
+    pack_card_into, unpack_card_from,
+    pack_decision_into, unpack_decision_from,
+    pack_result_into, unpack_result_from,
 )
 
 
@@ -213,3 +219,69 @@ class TestPayloadResult:
             msg = encode_payload_result(code)
             # Verify message created successfully
             assert len(msg) > 0
+
+
+class TestCodecs:
+    """Test pack_*_into / unpack_*_from against caller-supplied buffers."""
+    
+    def test_pack_into_matches_encode(self):
+        """Packing into a buffer produces the same bytes as the encode_* wrappers."""
+        buf = bytearray(39 + 38 + 14)
+        offset = pack_offer_into(buf, 0, 8080, "Blackijecky")
+        offset = pack_request_into(buf, offset, 10, "TeamA")
+        offset = pack_payload_into(buf, offset, b"Stand", 0x0, 12, 3)
+        
+        assert offset == len(buf)
+        assert bytes(buf[:39]) == encode_offer(8080, "Blackijecky")
+        assert bytes(buf[39:77]) == encode_request(10, "TeamA")
+        assert bytes(buf[77:]) == encode_payload(b"Stand", 0x0, 12, 3)
+    
+    def test_unpack_from_offset(self):
+        """Messages are decoded in place at an offset, without slicing."""
+        buf = bytearray(3) + encode_offer(9000, "Srv") + encode_request(7, "Team") + encode_payload(b"Hittt", 0x2, 1, 0)
+        view = memoryview(buf)
+        
+        assert unpack_offer_from(view, 3) == (9000, "Srv")
+        assert unpack_request_from(view, 42) == (7, "Team")
+        assert unpack_payload_from(view, 80) == (b"Hittt", 0x2, 1, 0)
+    
+    def test_payload_size_and_layout(self):
+        """Payload is 14 bytes: cookie + type + decision + result + card."""
+        frame = encode_payload(b"Hittt", 0x3, 13, 2)
+        assert len(frame) == 14
+        assert frame[:5] == b"\xab\xcd\xdc\xba\x04"
+        assert frame[5:10] == b"Hittt"
+        assert frame[10] == 0x3
+        assert decode_payload_card(frame[11:]) == (13, 2)
+    
+    def test_payload_bad_header(self):
+        """Wrong cookie or message type is rejected."""
+        frame = bytearray(encode_payload(b"Stand", 0, 0, 0))
+        frame[4] = 0x3
+        with pytest.raises(ValueError):
+            unpack_payload_from(frame)
+        frame[0] = 0
+        with pytest.raises(ValueError):
+            unpack_payload_from(frame)
+    
+    def test_payload_too_short(self):
+        """Truncated buffer raises ValueError, not struct.error."""
+        with pytest.raises(ValueError):
+            unpack_payload_from(b"\xab\xcd\xdc\xba\x04")
+    
+    def test_field_codecs_round_trip(self):
+        """Card, decision and result fields round-trip at an offset."""
+        buf = bytearray(10)
+        offset = pack_card_into(buf, 1, 11, 2)
+        offset = pack_decision_into(buf, offset, "hit")
+        offset = pack_result_into(buf, offset, 0x1)
+        
+        assert offset == 10
+        assert unpack_card_from(buf, 1) == (11, 2)
+        assert unpack_decision_from(buf, 4) == "hit"
+        assert unpack_result_from(buf, 9) == 0x1
+    
+    def test_invalid_decision_bytes(self):
+        """Anything other than Hittt/Stand is rejected."""
+        with pytest.raises(ValueError):
+            unpack_decision_from(b"Xxxxx")
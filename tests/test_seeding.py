@@ -0,0 +1,29 @@
+"""
+Unit tests for seed derivation.
+"""
+
+from src.common.seeding import derive_seed, new_master_seed, SEED_BITS
+
+
+class TestSeeding:
+    """Test derive_seed / new_master_seed."""
+
+    def test_deterministic(self):
+        """Same master + keys always give the same seed."""
+        assert derive_seed(42, 0, 7) == derive_seed(42, 0, 7)
+
+    def test_keys_matter(self):
+        """Changing any input changes the seed (and key order matters)."""
+        seeds = {derive_seed(42, 0, 7), derive_seed(43, 0, 7), derive_seed(42, 1, 7),
+                 derive_seed(42, 0, 8), derive_seed(42, 7, 0)}
+        assert len(seeds) == 5
+
+    def test_range(self):
+        """Seeds fit in SEED_BITS bits."""
+        for session_id in range(100):
+            assert 0 <= derive_seed(new_master_seed(), session_id) < 2 ** SEED_BITS
+
+    def test_any_int_master_seed(self):
+        """Negative or huge master seeds (e.g. from --seed) are accepted."""
+        assert derive_seed(-1, 0) != derive_seed(1, 0)
+        assert 0 <= derive_seed(2 ** 200, 0) < 2 ** SEED_BITS
@@ -0,0 +1,70 @@
+"""
+Unit tests for the live SessionRegistry.
+"""
+
+from src.common.deck import Shoe
+from src.server.session_registry import SessionRegistry
+
+
+class TestSessionRegistry:
+    """Test register / update / unregister / snapshot."""
+
+    def test_register_creates_entry(self):
+        """A new session gets a unique id and shows up in the snapshot."""
+        registry = SessionRegistry()
+        first = registry.register(("10.0.0.1", 5000))
+        second = registry.register(("10.0.0.2", 5001))
+
+        assert first["id"] != second["id"]
+        assert len(registry) == 2
+        assert [e["address"] for e in registry.snapshot()] == [("10.0.0.1", 5000), ("10.0.0.2", 5001)]
+
+    def test_in_place_updates_visible(self):
+        """Team name and round set by the handler appear in snapshots."""
+        registry = SessionRegistry()
+        entry = registry.register(("10.0.0.1", 5000))
+        entry["team_name"] = "Sharks"
+        entry["round"] = 3
+
+        (snap,) = registry.snapshot()
+        assert snap["team_name"] == "Sharks"
+        assert snap["round"] == 3
+
+    def test_snapshot_is_a_copy(self):
+        """Mutating a snapshot doesn't touch the live table."""
+        registry = SessionRegistry()
+        registry.register(("10.0.0.1", 5000))
+        registry.snapshot()[0]["round"] = 99
+        assert registry.snapshot()[0]["round"] == 0
+
+    def test_unregister_frees_entry(self):
+        """Finished sessions are removed, so memory tracks active sessions only."""
+        registry = SessionRegistry()
+        for i in range(1000):
+            entry = registry.register(("10.0.0.1", i))
+            registry.unregister(entry["id"])
+        assert len(registry) == 0
+        assert registry.snapshot() == []
+        # Unregistering twice is harmless
+        registry.unregister(1)
+
+    def test_session_seeds(self):
+        """Seeds are distinct per session and reproducible from the master seed."""
+        first = SessionRegistry(master_seed=42)
+        second = SessionRegistry(master_seed=42)
+        seeds = [first.register(("10.0.0.1", i))["seed"] for i in range(100)]
+        assert len(set(seeds)) == 100
+        assert [second.register(("10.0.0.1", i))["seed"] for i in range(100)] == seeds
+        # Another shard with the same master seed gets different streams
+        assert SessionRegistry(master_seed=42, shard=1).register(("10.0.0.1", 0))["seed"] != seeds[0]
+
+    def test_shoe_totals(self):
+        """Finished sessions' shoe counters add up across sessions."""
+        registry = SessionRegistry()
+        assert registry.shoe_stats() == {"shuffles": 0, "cards_per_shuffle": 0.0}
+        for _ in range(2):
+            shoe = Shoe(num_decks=1, penetration=0.5)
+            for _ in range(30):
+                shoe.draw()
+            registry.record_shoe(shoe)
+        assert registry.shoe_stats() == {"shuffles": 2, "cards_per_shuffle": 30.0}
@@ -0,0 +1,70 @@
+"""
+Unit tests for the exact-EV basic-strategy table.
+
+Spot-checks well-known cells of hit/stand basic strategy (dealer stands on
+soft 17, no doubling/splitting) and the O(1) lookup API.
+"""
+
+import pytest
+from src.common.card import Card
+from src.common.game_logic import Hand
+from src.common.strategy import StrategyTable, generate_table, default_table, format_table, TABLE_SIZE
+
+
+@pytest.fixture(scope="module")
+def table():
+    return generate_table(6)
+
+
+class TestStrategyTable:
+    """Test generated decisions and lookups."""
+
+    @pytest.mark.parametrize("total, soft, up_rank, expected", [
+        (11, False, 1, "hit"),      # Can't bust
+        (12, False, 2, "hit"),
+        (12, False, 3, "hit"),
+        (12, False, 4, "stand"),
+        (13, False, 2, "stand"),
+        (16, False, 6, "stand"),    # Dealer's bust card
+        (16, False, 7, "hit"),
+        (16, False, 10, "hit"),
+        (16, False, 13, "hit"),     # King = ten-value
+        (17, False, 1, "stand"),
+        (17, True, 6, "hit"),       # Soft 17 always improves
+        (18, True, 8, "stand"),
+        (18, True, 9, "hit"),
+        (18, True, 1, "hit"),
+        (19, True, 10, "stand"),
+    ])
+    def test_known_cells(self, table, total, soft, up_rank, expected):
+        """Textbook hit/stand basic strategy."""
+        assert table.decide(total, soft, up_rank) == expected
+
+    def test_busted_hand_stands(self, table):
+        """Nothing to decide above 21."""
+        assert table.decide(25, False, 10) == "stand"
+
+    def test_decide_hand(self, table):
+        """Hand + up Card convenience wrapper."""
+        hand = Hand([Card(1, 0), Card(7, 2)])  # Soft 18
+        assert table.decide_hand(hand, Card(10, 1)) == "hit"
+        assert table.decide_hand(hand, Card(5, 1)) == "stand"
+
+    def test_compact(self, table):
+        """One byte per (soft, total, up card)."""
+        assert len(table.actions) == TABLE_SIZE == 440
+
+    def test_wrong_size_rejected(self):
+        """A truncated table is an error."""
+        with pytest.raises(ValueError):
+            StrategyTable(b"\x00" * 10, 1)
+
+    def test_default_table_cached(self):
+        """default_table() computes once per deck count."""
+        assert default_table(6) is default_table(6)
+
+    def test_format_table(self, table):
+        """The chart has a row per hard (4-21) and soft (12-21) total."""
+        lines = format_table(table).splitlines()
+        assert len(lines) == 2 + 18 + 10
+        assert lines[-1].startswith("soft 21")
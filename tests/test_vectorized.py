@@ -0,0 +1,89 @@
+"""
+Unit tests for the vectorized NumPy simulator.
+
+Cross-checks the batch simulator against the real GameSession rules played
+one round at a time.
+"""
+
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.common.deck import CompactDeck
+from src.common.strategy import default_table
+from src.server.game_session import GameSession, STATE_READY, STATE_PLAYER_TURN
+from src.simulation.vectorized import (
+    simulate_rounds, make_policy, StrategyPolicy, SimulationResult, DEALER_HITS, ONE_DECK_VALUES, _Batch,
+)
+
+
+def scalar_rates(n_rounds, decide, seed):
+    """Win/loss/tie rates from GameSession, one round at a time."""
+    rng = random.Random(seed)
+    session = GameSession(n_rounds, deck_factory=lambda: CompactDeck(lazy=True, rng=rng))
+    while session.state == STATE_READY:
+        session.start_round()
+        while session.state == STATE_PLAYER_TURN:
+            session.receive_decision(decide(session.player_hand, session.dealer_hand[0]))
+    return session.wins / n_rounds, session.losses / n_rounds, session.ties / n_rounds
+
+
+class TestVectorizedSimulator:
+    """Test simulate_rounds and policies."""
+
+    @pytest.mark.parametrize("name", ["basic", "mimic", "stand"])
+    def test_matches_game_session(self, name):
+        """Batch results agree with GameSession within sampling error."""
+        table = default_table(1)
+        decide = {
+            "basic": lambda hand, up: table.decide_hand(hand, up),
+            "mimic": lambda hand, up: "hit" if hand.value() < 17 else "stand",
+            "stand": lambda hand, up: "stand",
+        }[name]
+        expected = scalar_rates(20_000, decide, seed=3)
+        result = simulate_rounds(400_000, make_policy(name, 1), num_decks=1, seed=3)
+        for count, p in zip((result.wins, result.losses, result.ties), expected):
+            # ~5 standard errors of the (much noisier) scalar estimate
+            assert abs(count / result.rounds - p) < 5 * (p * (1 - p) / 20_000) ** 0.5
+
+    def test_reproducible(self):
+        """Same seed, same result; batch size doesn't matter for the totals."""
+        policy = make_policy("basic", 1)
+        first = simulate_rounds(50_000, policy, seed=11)
+        assert simulate_rounds(50_000, policy, seed=11) == first
+        assert first.rounds == 50_000
+        assert first.player_totals.sum() == first.dealer_totals.sum() == 50_000
+
+    def test_strategy_policy_matches_table(self):
+        """The vectorized lookup gives the same decision as StrategyTable.decide."""
+        table = default_table(6)
+        policy = StrategyPolicy(table)
+        totals, softs, ups = np.meshgrid(np.arange(4, 22), [False, True], np.arange(1, 11), indexing="ij")
+        hits = policy(totals.ravel(), softs.ravel(), ups.ravel())
+        for total, soft, up, hit in zip(totals.ravel(), softs.ravel(), ups.ravel(), hits):
+            assert hit == (table.decide(int(total), bool(soft), int(up)) == "hit")
+
+    def test_lazy_shuffle_is_permutation(self):
+        """Every shuffled row is still a full deck."""
+        batch = _Batch(1000, 2, np.random.default_rng(5))
+        batch.shuffle_until(104)
+        reference = np.sort(np.tile(ONE_DECK_VALUES, 2))
+        assert (np.sort(batch.cards, axis=1) == reference).all()
+
+    def test_dealer_rule_tabulated(self):
+        """The dealer hits below 17 and stands from 17 up."""
+        assert DEALER_HITS[16] and not DEALER_HITS[17]
+
+    def test_confidence_interval(self):
+        """Rates come with a sensible 95% half-width."""
+        result = SimulationResult(wins=430, losses=480, ties=90)
+        p, half_width = result.rate(result.wins)
+        assert p == 0.43
+        assert 0.02 < half_width < 0.04
+        assert "Player EV" in result.summary()
+
+    def test_unknown_policy(self):
+        """Bad policy names are rejected."""
+        with pytest.raises(ValueError):
+            make_policy("yolo")
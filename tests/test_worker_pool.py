@@ -0,0 +1,169 @@
+"""
+Unit tests for the bounded WorkerPool.
+
+Uses fake jobs (no sockets) that block until released, so the queue can be filled.
+"""
+
+import threading
+import time
+import pytest
+from src.server.worker_pool import WorkerPool
+
+
+class FakeSocket:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeJob:
+    """Stands in for a GameHandler: handle_game() blocks until released."""
+
+    def __init__(self, release):
+        self.socket = FakeSocket()
+        self.release = release
+        self.started = threading.Event()
+
+    def handle_game(self):
+        self.started.set()
+        self.release.wait(timeout=5)
+
+
+class TestWorkerPool:
+    """Test admission, overflow policies and counters."""
+
+    def test_runs_jobs(self):
+        """Submitted jobs run on a worker."""
+        release = threading.Event()
+        release.set()
+        pool = WorkerPool(num_workers=2, queue_size=4)
+        pool.start()
+        try:
+            job = FakeJob(release)
+            assert pool.submit(job)
+            assert job.started.wait(timeout=2)
+            assert pool.stats()["queued"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_reject_policy_closes_overflow(self):
+        """With one busy worker and a full queue, the next connection is closed."""
+        release = threading.Event()
+        pool = WorkerPool(num_workers=1, queue_size=1, overflow_policy="reject")
+        pool.start()
+        try:
+            busy = FakeJob(release)
+            assert pool.submit(busy)
+            assert busy.started.wait(timeout=2)
+
+            waiting = FakeJob(release)
+            assert pool.submit(waiting)
+
+            overflow = FakeJob(release)
+            assert not pool.submit(overflow)
+            assert overflow.socket.closed
+
+            stats = pool.stats()
+            assert stats["queued"] == 2
+            assert stats["rejected"] == 1
+            assert stats["waiting"] == 1
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_deadline_policy_expires_stale_jobs(self):
+        """Jobs that waited past the deadline are closed instead of served."""
+        release = threading.Event()
+        pool = WorkerPool(num_workers=1, queue_size=1, overflow_policy="deadline", deadline=0.05)
+        pool.start()
+        try:
+            busy = FakeJob(release)
+            pool.submit(busy)
+            assert busy.started.wait(timeout=2)
+
+            stale = FakeJob(release)
+            assert pool.submit(stale)
+            time.sleep(0.1)
+            release.set()
+
+            for _ in range(100):
+                if pool.stats()["expired"] == 1:
+                    break
+                time.sleep(0.02)
+            assert pool.stats()["expired"] == 1
+            assert stale.socket.closed
+            assert not stale.started.is_set()
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_deadline_submit_never_blocks(self):
+        """With the queue full, submit() returns at once; the job is served once a slot frees."""
+        release = threading.Event()
+        pool = WorkerPool(num_workers=1, queue_size=1, overflow_policy="deadline", deadline=5.0)
+        pool.start()
+        try:
+            busy = FakeJob(release)
+            assert pool.submit(busy)
+            assert busy.started.wait(timeout=2)
+            assert pool.submit(FakeJob(release))  # Fills the queue
+
+            parked = FakeJob(release)
+            started = time.monotonic()
+            assert pool.submit(parked)
+            assert time.monotonic() - started < 0.1
+            assert pool.stats()["waiting"] == 2
+
+            release.set()
+            assert parked.started.wait(timeout=2)
+            assert not parked.socket.closed
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_deadline_parked_jobs_expire(self):
+        """Parked jobs that never get a slot are closed once their deadline passes."""
+        release = threading.Event()
+        pool = WorkerPool(num_workers=1, queue_size=1, overflow_policy="deadline", deadline=0.1)
+        pool.start()
+        try:
+            busy = FakeJob(release)
+            assert pool.submit(busy)
+            assert busy.started.wait(timeout=2)
+            assert pool.submit(FakeJob(release))  # Fills the queue
+
+            parked = FakeJob(release)
+            assert pool.submit(parked)
+
+            for _ in range(100):
+                if parked.socket.closed:
+                    break
+                time.sleep(0.02)
+            assert parked.socket.closed
+            assert pool.stats()["expired"] >= 1
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_deadline_overflow_line_is_bounded(self):
+        """Once queue and overflow line (queue_size each) are full, submit rejects at once."""
+        release = threading.Event()
+        pool = WorkerPool(num_workers=1, queue_size=2, overflow_policy="deadline", deadline=5.0)
+        jobs = [FakeJob(release) for _ in range(5)]  # Not started: nothing drains the queue
+        started = time.monotonic()
+        admitted = [pool.submit(job) for job in jobs]
+        assert time.monotonic() - started < 0.1
+        assert admitted == [True] * 4 + [False]
+        assert jobs[-1].socket.closed
+        stats = pool.stats()
+        assert stats["waiting"] == 4
+        assert stats["rejected"] == 1
+        pool.shutdown()
+        assert all(job.socket.closed for job in jobs)
+
+    def test_unknown_policy(self):
+        """Only the configured overflow policies are accepted."""
+        with pytest.raises(ValueError):
+            WorkerPool(1, 1, overflow_policy="drop-oldest")